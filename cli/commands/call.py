@@ -19,6 +19,15 @@ def call_command(skill_name: str, input_text: str = None, **kwargs):
     input_file = kwargs.get('input_file')
     output_file = kwargs.get('output_file')
     no_save = kwargs.get('no_save', False)
+    # Stream tokens to the terminal by default; structured formats need the full result
+    stream = kwargs.pop('stream', None)
+    if stream is None:
+        stream = sys.stdout.isatty()
+    stream = stream and output_format in ('markdown', 'plain')
+
+    batch_file = kwargs.pop('batch', None)
+    if batch_file:
+        return _call_batch(executor, skill_name, batch_file, **kwargs)
 
     # Special handling for audiobook skill - pass file path, not content
     if skill_name == 'audiobook':
@@ -71,7 +80,23 @@ def call_command(skill_name: str, input_text: str = None, **kwargs):
         print(f"Calling skill: {skill_name}", file=sys.stderr)
 
     try:
-        result = executor.execute(skill_name, input_text, **kwargs)
+        streamed = []
+
+        if stream:
+            def print_chunk(chunk: str):
+                streamed.append(chunk)
+                sys.stdout.write(chunk)
+                sys.stdout.flush()
+
+            result = executor.execute(skill_name, input_text, on_chunk=print_chunk, **kwargs)
+
+            if streamed:
+                print()
+                latency = result.get('metadata', {}).get('first_token_latency')
+                if latency is not None and output_format != 'plain':
+                    print(f"\n✓ First token after {latency:.2f}s", file=sys.stderr)
+        else:
+            result = executor.execute(skill_name, input_text, **kwargs)
 
         # Format output
         formatted = OutputFormatter.format(result, output_format)
@@ -100,10 +125,11 @@ def call_command(skill_name: str, input_text: str = None, **kwargs):
             with open(output_path, 'w', encoding='utf-8') as f:
                 f.write(formatted)
             
-            # Print to terminal
-            print(formatted)
+            # Print to terminal (already shown if streamed)
+            if not streamed:
+                print(formatted)
             print(f"\n✓ Output saved to: {output_path}", file=sys.stderr)
-        else:
+        elif not streamed:
             # Print only (no save)
             print(formatted)
 
@@ -122,6 +148,53 @@ def call_command(skill_name: str, input_text: str = None, **kwargs):
         return 1
 
 
+def _call_batch(executor: SkillExecutor, skill_name: str, batch_file: str, **kwargs) -> int:
+    """Run a skill over every line of a JSONL file (--batch)."""
+    from cli.core.batch_runner import BatchRunner
+
+    input_path = Path(batch_file)
+    if not input_path.exists():
+        print(f"Error: Batch input file not found: {batch_file}")
+        return 1
+
+    output_file = kwargs.pop('output_file', None)
+    output_path = Path(output_file) if output_file else input_path.with_name(f"{input_path.stem}.results.jsonl")
+    jobs = kwargs.pop('jobs', None) or 4
+    quiet = kwargs.pop('format', 'markdown') == 'plain'
+
+    # Remaining CLI-only options are not skill options
+    for key in ('input_file', 'no_save'):
+        kwargs.pop(key, None)
+
+    def report(record):
+        if quiet:
+            return
+        if record['status'] == 'success':
+            print(f"✓ {record['id']}", file=sys.stderr)
+        else:
+            print(f"✗ {record['id']}: {record['error']}", file=sys.stderr)
+
+    if not quiet:
+        print(f"Calling skill: {skill_name} (batch: {input_path}, jobs: {jobs})", file=sys.stderr)
+
+    try:
+        runner = BatchRunner(executor, skill_name, jobs=jobs, options=kwargs)
+        summary = runner.run(input_path, output_path, on_result=report)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    if not quiet:
+        print(
+            f"\n✓ {summary.succeeded} succeeded, {summary.failed} failed, "
+            f"{summary.skipped} already done",
+            file=sys.stderr
+        )
+        print(f"✓ Results saved to: {output_path}", file=sys.stderr)
+
+    return 1 if summary.failed else 0
+
+
 def _print_helpful_skill_not_found_error(skill_name: str):
     """Print helpful error message when skill is not found."""
     print(f"Error: Skill '{skill_name}' not found\n")
@@ -2,11 +2,18 @@
 CLI command: export - Export skill metadata for IDE AI consumption
 """
 import json
+import os
+import tempfile
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import yaml
+
+from cli.core.export_cache import ExportCache, file_stamp
 from cli.core.skill_loader import SkillLoader
-from cli.utils.paths import get_project_root
+from cli.utils.config import CLIConfig
+from cli.utils.paths import get_project_root, get_workflows_dir
 
 
 def _get_version() -> str:
@@ -29,6 +36,11 @@ def export_command(output_file: str = None, format_type: str = 'json',
     """
     Export skill metadata for IDE AI consumption.
 
+    Entries are cached per skill and per workflow file, keyed by the stats
+    of the files they are built from, so repeated exports only re-read what
+    changed. The output is deterministic (sorted, no timestamps) and the
+    output file is left untouched when its content would not change.
+
     Args:
         output_file: Optional output file path (default: stdout)
         format_type: Output format (json or markdown)
@@ -37,30 +49,30 @@ def export_command(output_file: str = None, format_type: str = 'json',
         markdown: Output as markdown table
     """
     loader = SkillLoader()
-    skills = loader.discover_skills()
+    cache = ExportCache(CLIConfig().cache_dir / "export_cache.json", salt=_cache_salt())
+
+    entries = cache.build({**_skill_items(loader), **_workflow_items()})
+    cache.save()
+
+    skills = [entry for key, entry in entries.items() if key.startswith('skill:') and entry]
+    skills.sort(key=lambda s: s['name'])
 
     if skill_type:
-        skills = [s for s in skills if s.skill_type == skill_type]
+        skills = [s for s in skills if s['type'] == skill_type]
 
     if has_api is not None:
-        api_skills = set(loader.PYTHON_SKILLS.keys())
-        if has_api:
-            skills = [s for s in skills if s.name in api_skills]
-        else:
-            skills = [s for s in skills if s.name not in api_skills]
+        skills = [s for s in skills if s['requires_api'] == has_api]
 
     if markdown or format_type == 'markdown':
         output = _generate_markdown(skills)
     else:
-        metadata = _generate_metadata(skills, loader)
+        workflows = [entry for key, entry in entries.items() if key.startswith('workflow:') and entry]
+        metadata = _generate_metadata(skills, workflows)
         output = json.dumps(metadata, indent=2)
 
     if output_file:
         output_path = Path(output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(output)
+        _write_if_changed(output_path, output + "\n")
 
         print(f"Metadata exported to: {output_file}")
         return 0
@@ -69,44 +81,153 @@ def export_command(output_file: str = None, format_type: str = 'json',
         return 0
 
 
-def _generate_metadata(skills: List, loader: SkillLoader) -> Dict[str, Any]:
-    """Generate JSON metadata structure."""
-    skills_data = []
-
-    for skill in skills:
-        skill_data = {
-            'name': skill.name,
-            'type': skill.skill_type,
-            'description': skill.description,
-            'has_profile': skill.has_profile,
-            'requires_api': skill.name in loader.PYTHON_SKILLS,
-            'capabilities': _extract_capabilities(skill),
-            'examples': _extract_examples(skill)
-        }
+def _cache_salt() -> List:
+    """Cached entries are rebuilt when the export code or version changes."""
+    return [_get_version(), file_stamp([Path(__file__)])]
+
+
+def _skill_items(loader: SkillLoader) -> Dict[str, Tuple[List[Path], Callable]]:
+    """Cache items for every skill directory, keyed by skill path."""
+    items = {}
+
+    for skill_dir, parent_dir in loader.skill_dirs():
+        sources = [skill_dir / "SKILL.md", skill_dir / "PROFILE.md", skill_dir / "PROFILE.md.template"]
+        if parent_dir is not None:
+            # A subskill is dropped with its parent, so its entry depends on the parent too
+            sources.append(parent_dir / "SKILL.md")
+        key = f"skill:{skill_dir.relative_to(loader.skills_dir).as_posix()}"
+        items[key] = (sources, partial(_skill_entry, loader, skill_dir, parent_dir))
+
+    return items
 
-        if skill.skill_type == 'python':
-            skill_data['python_module'] = skill.python_module
-            skill_data['apis'] = _get_api_requirements(skill.name)
-        else:
-            skill_data['apis'] = ['anthropic']
 
-        skills_data.append(skill_data)
+def _skill_entry(loader: SkillLoader, skill_dir: Path, parent_dir: Optional[Path]) -> Optional[Dict[str, Any]]:
+    """Build the export entry for one skill (None if it does not load)."""
+    if parent_dir is not None and loader._load_skill_info(parent_dir) is None:
+        return None
 
-    workflows_data = _get_workflows_metadata()
+    skill = loader._load_skill_info(skill_dir)
+    if skill is None:
+        return None
+
+    skill_data = {
+        'name': skill.name,
+        'type': skill.skill_type,
+        'description': skill.description,
+        'has_profile': skill.has_profile,
+        'requires_api': skill.name in loader.PYTHON_SKILLS,
+        'capabilities': _extract_capabilities(skill),
+        'examples': _extract_examples(skill)
+    }
+
+    if skill.skill_type == 'python':
+        skill_data['python_module'] = skill.python_module
+        skill_data['apis'] = _get_api_requirements(skill.name)
+    else:
+        skill_data['apis'] = ['anthropic']
+
+    return skill_data
+
+
+def _workflow_items() -> Dict[str, Tuple[List[Path], Callable]]:
+    """Cache items for every installed workflow definition file."""
+    files = []
+    for workflow_dir in ['definitions', 'custom']:
+        dir_path = get_workflows_dir(workflow_dir)
+        if dir_path.exists():
+            files.extend(sorted(dir_path.glob('*.yaml')))
+
+    workflows_root = get_workflows_dir()
+    if workflows_root.exists():
+        for workflow_folder in sorted(workflows_root.iterdir()):
+            if workflow_folder.is_dir() and workflow_folder.name not in ['definitions', 'custom']:
+                workflow_file = workflow_folder / 'workflow.yaml'
+                if workflow_file.exists():
+                    files.append(workflow_file)
+
+    return {
+        f"workflow:{path.relative_to(workflows_root).as_posix()}": ([path], partial(_workflow_entry, path))
+        for path in files
+    }
+
+
+def _workflow_entry(workflow_file: Path) -> Optional[Dict[str, Any]]:
+    """Build the export entry for one workflow file (None if it does not parse)."""
+    try:
+        with open(workflow_file, 'r', encoding='utf-8') as f:
+            workflow = yaml.safe_load(f)
+    except Exception as e:
+        print(f"Warning: Failed to load {workflow_file}: {e}")
+        return None
+
+    if not isinstance(workflow, dict):
+        return None
+
+    name = workflow.get('name') or (
+        workflow_file.parent.name if workflow_file.name == 'workflow.yaml' else workflow_file.stem
+    )
+    steps = [step.get('skill') for step in workflow.get('steps') or [] if isinstance(step, dict)]
+    steps = [step for step in steps if step]
+    outputs = [step.get('output') for step in (workflow.get('steps') or [])[-1:] if isinstance(step, dict)]
+
+    return {
+        'name': name,
+        'description': workflow.get('description', 'No description'),
+        'steps': steps,
+        'step_count': len(steps),
+        'inputs': list((workflow.get('variables') or {}).keys()),
+        'outputs': [output for output in outputs if output],
+        'use_cases': workflow.get('use_cases', [])
+    }
+
+
+def _write_if_changed(output_path: Path, content: str) -> None:
+    """Atomically write `content`, leaving the file alone if it is unchanged."""
+    try:
+        if output_path.read_text(encoding='utf-8') == content:
+            return
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=output_path.parent, prefix=f".{output_path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp, output_path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _generate_metadata(skills: List[Dict[str, Any]], workflows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Generate JSON metadata structure."""
+    workflows_data = _merge_workflows(_get_workflows_metadata(), workflows)
 
     return {
         'version': _get_version(),
-        'total_skills': len(skills_data),
-        'skills': skills_data,
+        'total_skills': len(skills),
+        'skills': skills,
         'workflows': workflows_data,
         'metadata': {
-            'prompt_skills': len([s for s in skills if s.skill_type == 'prompt']),
-            'python_skills': len([s for s in skills if s.skill_type == 'python']),
-            'api_integrated_skills': len([s for s in skills if s.name in loader.PYTHON_SKILLS])
+            'prompt_skills': len([s for s in skills if s['type'] == 'prompt']),
+            'python_skills': len([s for s in skills if s['type'] == 'python']),
+            'api_integrated_skills': len([s for s in skills if s['requires_api']])
         }
     }
 
 
+def _merge_workflows(built_in: List[Dict[str, Any]], installed: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Built-in workflow descriptions, overridden and extended by installed definitions."""
+    merged = {workflow['name']: workflow for workflow in built_in}
+    for workflow in sorted(installed, key=lambda w: w['name']):
+        if workflow['name'] in merged:
+            # Keep curated fields the definition file does not provide
+            workflow = {key: value or merged[workflow['name']].get(key) for key, value in workflow.items()}
+        merged[workflow['name']] = workflow
+    return [merged[name] for name in sorted(merged)]
+
+
 def _extract_capabilities(skill) -> List[str]:
     """Extract capabilities from skill description."""
     capability_keywords = {
@@ -223,7 +344,7 @@ def _get_workflows_metadata() -> List[Dict[str, Any]]:
     return workflows
 
 
-def _generate_markdown(skills: List) -> str:
+def _generate_markdown(skills: List[Dict[str, Any]]) -> str:
     """Generate markdown table of skills."""
     lines = [
         "# SuperSkills Reference",
@@ -234,15 +355,13 @@ def _generate_markdown(skills: List) -> str:
         "|-------|------|-------------|---------|------|"
     ]
 
-    loader = SkillLoader()
-
-    for skill in sorted(skills, key=lambda s: s.name):
-        skill_type = skill.skill_type.capitalize()
-        profile_marker = "✓" if skill.has_profile else "-"
-        apis = ", ".join(_get_api_requirements(skill.name)) if skill.name in loader.PYTHON_SKILLS else "Anthropic"
+    for skill in sorted(skills, key=lambda s: s['name']):
+        skill_type = skill['type'].capitalize()
+        profile_marker = "✓" if skill['has_profile'] else "-"
+        apis = ", ".join(skill['apis']) if skill['requires_api'] else "Anthropic"
 
         lines.append(
-            f"| **{skill.name}** | {skill_type} | {skill.description} | {profile_marker} | {apis} |"
+            f"| **{skill['name']}** | {skill_type} | {skill['description']} | {profile_marker} | {apis} |"
         )
 
     lines.extend([
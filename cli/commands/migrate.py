@@ -5,19 +5,25 @@ import json
 import zipfile
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, List, Tuple, Union
 
-from cli.utils.paths import get_project_root, get_user_config_dir
 from cli.utils.migration import (
-    collect_skill_profiles,
+    calculate_checksums,
     collect_skill_configs,
-    calculate_checksum,
-    validate_manifest,
+    collect_skill_profiles,
+    copy_with_checksum,
     create_backup,
+    diff_manifest,
+    last_manifest_path,
+    load_manifest,
+    manifest_state,
     merge_env_files,
     parse_env_file,
-    write_env_file
+    save_manifest,
+    validate_manifest,
+    write_env_file,
 )
+from cli.utils.paths import get_project_root, get_user_config_dir
 
 
 def _get_version() -> str:
@@ -36,7 +42,8 @@ def _get_version() -> str:
 
 def migrate_command(migrate_action: str, output: str = None, input: str = None,
                    include_api_keys: bool = False, dry_run: bool = False,
-                   yes: bool = False, overwrite: bool = False, merge: bool = False):
+                   yes: bool = False, overwrite: bool = False, merge: bool = False,
+                   incremental: Union[bool, str] = False):
     """
     Export or import profiles and settings.
     
@@ -45,13 +52,15 @@ def migrate_command(migrate_action: str, output: str = None, input: str = None,
         output: Output file path for export
         input: Input file path for import
         include_api_keys: Include API keys in export
+        incremental: Only pack files changed since the last export (True),
+            or since the package or manifest at the given path
         dry_run: Preview import changes without applying
         yes: Skip confirmation prompts
         overwrite: Overwrite all existing files on import
         merge: Merge configurations on import
     """
     if migrate_action == 'export':
-        return _export_migration(output, include_api_keys)
+        return _export_migration(output, include_api_keys, incremental)
     elif migrate_action == 'import':
         if not input:
             print("Error: Input file is required for import")
@@ -62,13 +71,20 @@ def migrate_command(migrate_action: str, output: str = None, input: str = None,
         return 1
 
 
-def _export_migration(output_path: str = None, include_api_keys: bool = False) -> int:
+def _export_migration(output_path: str = None, include_api_keys: bool = False,
+                      incremental: Union[bool, str] = False) -> int:
     """
     Export migration package.
     
+    Files are hashed in parallel and streamed into the archive. In
+    incremental mode only files whose checksum differs from the base
+    manifest are packed; the rest are listed as unchanged.
+    
     Args:
         output_path: Optional output file path
         include_api_keys: Include API keys in export
+        incremental: True to diff against the last export, or a path to a
+            previous package or manifest
         
     Returns:
         Exit code
@@ -124,25 +140,58 @@ def _export_migration(output_path: str = None, include_api_keys: bool = False) -
         "flags": {
             "api_keys_included": include_api_keys,
             "profiles_included": len(profiles) > 0,
-            "configs_included": len(configs) > 0
+            "configs_included": len(configs) > 0,
+            "incremental": False
         },
         "files": {}
     }
     
-    # Create ZIP archive
+    # Base manifest for incremental mode
+    base = None
+    if incremental:
+        base_path = last_manifest_path() if incremental is True else Path(incremental)
+        base = load_manifest(base_path)
+        if base is None:
+            print(f"⚠️  No valid base manifest at {base_path}; creating a full package")
+    
     try:
+        checksums = calculate_checksums(files_to_export)
+        entries = {
+            archive_path: {
+                "checksum": checksums[archive_path],
+                "size": file_path.stat().st_size
+            }
+            for archive_path, file_path in files_to_export.items()
+        }
+        
+        to_pack = list(entries)
+        if base is not None:
+            to_pack, unchanged, removed = diff_manifest(entries, manifest_state(base))
+            manifest["flags"]["incremental"] = True
+            manifest["base_timestamp"] = base["export_timestamp"]
+            manifest["unchanged"] = {path: entries[path] for path in unchanged}
+            manifest["removed"] = removed
+        
+        # Create ZIP archive; ZipFile.write streams each file in chunks
         with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for archive_path, file_path in files_to_export.items():
-                zipf.write(file_path, archive_path)
-                manifest["files"][archive_path] = {
-                    "checksum": calculate_checksum(file_path),
-                    "size": file_path.stat().st_size
-                }
+            for archive_path in to_pack:
+                zipf.write(files_to_export[archive_path], archive_path)
+                manifest["files"][archive_path] = entries[archive_path]
             
             # Write manifest
             manifest_json = json.dumps(manifest, indent=2)
             zipf.writestr("manifest.json", manifest_json)
         
+        # Remember the full exported state for the next incremental export
+        try:
+            full_manifest = {**manifest, "files": entries}
+            for key in ("base_timestamp", "unchanged", "removed"):
+                full_manifest.pop(key, None)
+            full_manifest["flags"] = {**manifest["flags"], "incremental": False}
+            save_manifest(full_manifest, last_manifest_path())
+        except OSError as e:
+            print(f"⚠️  Could not save export manifest: {e}")
+        
         # Display summary
         print("\n✅ Migration package created successfully!")
         print(f"\nLocation: {output_file.absolute()}")
@@ -154,6 +203,11 @@ def _export_migration(output_path: str = None, include_api_keys: bool = False) -
         print(f"  • Skill configs: {len(configs)}")
         print(f"  • API keys: {'Yes' if include_api_keys else 'No'}")
         
+        if base is not None:
+            print(f"\nIncremental since {base['export_timestamp']}: "
+                  f"{len(to_pack)} changed, {len(manifest['unchanged'])} unchanged, "
+                  f"{len(manifest['removed'])} removed")
+        
         if include_api_keys:
             print("\n⚠️  Remember to keep this file secure and delete after transfer!")
         
@@ -241,6 +295,16 @@ def _import_migration(input_path: str, dry_run: bool = False,
             if file_count['env'] > 0:
                 print("\n⚠️  WARNING: This package contains API keys!")
             
+            if manifest['flags'].get('incremental'):
+                print(f"\nIncremental package (base export: {manifest.get('base_timestamp', 'unknown')})")
+                print(f"  • Unchanged files expected on this machine: {len(manifest.get('unchanged', {}))}")
+                missing = _check_base_files(manifest)
+                if missing:
+                    print(f"\n⚠️  {len(missing)} unchanged file(s) differ from the base export here;")
+                    print("   import the base package first:")
+                    for archive_path in missing:
+                        print(f"     {archive_path}")
+            
             # Check version compatibility
             current_version = _get_version()
             if manifest['version'] != current_version:
@@ -292,6 +356,29 @@ def _preview_import(zipf: zipfile.ZipFile, manifest: Dict[str, Any]) -> None:
         exists = target_path.exists() if target_path else False
         status = "overwrite" if exists else "new"
         print(f"  [{status:9}] {archive_path} → {target_path}")
+    
+    for archive_path, target_path in _removed_targets(manifest):
+        print(f"  [{'remove':9}] {archive_path} → {target_path}")
+
+
+def _check_base_files(manifest: Dict[str, Any]) -> List[str]:
+    """Unchanged files of an incremental package that are missing or differ locally."""
+    targets = {}
+    missing = []
+    
+    for archive_path in manifest.get('unchanged', {}):
+        target_path = _get_target_path(archive_path)
+        if target_path and target_path.exists():
+            targets[archive_path] = target_path
+        else:
+            missing.append(archive_path)
+    
+    checksums = calculate_checksums(targets)
+    for archive_path, checksum in checksums.items():
+        if checksum != manifest['unchanged'][archive_path]['checksum']:
+            missing.append(archive_path)
+    
+    return sorted(missing)
 
 
 def _collect_files_to_backup(manifest: Dict[str, Any]) -> list:
@@ -303,9 +390,26 @@ def _collect_files_to_backup(manifest: Dict[str, Any]) -> list:
         if target_path and target_path.exists():
             files_to_backup.append(target_path)
     
+    files_to_backup.extend(target_path for _, target_path in _removed_targets(manifest))
+    
     return files_to_backup
 
 
+def _removed_targets(manifest: Dict[str, Any]) -> List[Tuple[str, Path]]:
+    """(archive path, local file) for files an incremental package removes that exist here."""
+    targets = []
+    
+    for archive_path in manifest.get('removed', []):
+        # API keys drop out of a package exported without them; that is not a deletion
+        if archive_path.startswith('env/'):
+            continue
+        target_path = _get_target_path(archive_path)
+        if target_path and target_path.is_file():
+            targets.append((archive_path, target_path))
+    
+    return targets
+
+
 def _get_target_path(archive_path: str) -> Path:
     """
     Get target path for an archive path.
@@ -368,18 +472,25 @@ def _apply_import(zipf: zipfile.ZipFile, manifest: Dict[str, Any],
         # Extract file
         target_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # Stream the entry to disk, hashing it on the way
         with zipf.open(archive_path) as source:
-            with open(target_path, 'wb') as target:
-                target.write(source.read())
+            actual_checksum = copy_with_checksum(source, target_path)
         
         # Verify checksum
-        actual_checksum = calculate_checksum(target_path)
         expected_checksum = file_info['checksum']
         
         if actual_checksum != expected_checksum:
             print(f"  ⚠️  Checksum mismatch: {archive_path}")
         else:
             print(f"  ✅ Imported: {archive_path}")
+    
+    # Files deleted since the base export; like changed files, only replaced with --overwrite
+    for archive_path, target_path in _removed_targets(manifest):
+        if not overwrite:
+            print(f"  ⏭️  Keeping (removed in package): {archive_path}")
+            continue
+        target_path.unlink()
+        print(f"  🗑️  Removed: {archive_path}")
 
 
 def _import_env_file(zipf: zipfile.ZipFile, archive_path: str, 
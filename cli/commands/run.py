@@ -40,7 +40,7 @@ def run_command(workflow_name: str, **kwargs):
     if batch:
         try:
             print(f"Batch processing workflow: {workflow_name}\n")
-            return engine.batch_execute(workflow_name)
+            return engine.batch_execute(workflow_name, deferred=kwargs.get('deferred', False))
         except Exception as e:
             print(f"Error in batch mode: {e}")
             import traceback
@@ -63,7 +63,7 @@ def run_command(workflow_name: str, **kwargs):
                 variables['input'] = kwargs['input']
 
         for key, value in kwargs.items():
-            if key not in ['input', 'output', 'dry_run', 'format', 'watch', 'batch', 'interval']:
+            if key not in ['input', 'output', 'dry_run', 'format', 'watch', 'batch', 'interval', 'deferred']:
                 variables[key] = value
 
         result = engine.execute(workflow_name, variables, dry_run=dry_run)
@@ -2,10 +2,14 @@
 CLI command: search - Search for files, content, or skills
 """
 import os
+import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
+from cli.core.content_search import DEFAULT_MAX_FILE_SIZE, ContentSearch
+from cli.core.file_index import DEFAULT_EXCLUDES, FileIndex
 from cli.utils.config import CLIConfig
 from cli.utils.logger import get_logger
 
@@ -72,55 +76,36 @@ def _search_skills(query: str, config: CLIConfig) -> int:
 
 
 def _search_files(query: str, config: CLIConfig) -> int:
-    """Search for files by name"""
+    """Search for files by name using the persistent filename index"""
     print(f"→ Searching files for: {query}")
 
     search_paths = _get_search_paths(config)
-    matches = []
-
-    for search_path in search_paths:
-        if not search_path.exists():
-            continue
+    max_results = config.get('search.max_results', 50)
 
-        # Search using glob patterns
-        try:
-            # Try exact match first
-            exact_matches = list(search_path.rglob(query))
-            matches.extend([(str(m), m) for m in exact_matches])
-
-            # Try case-insensitive pattern match
-            pattern = f"*{query}*"
-            pattern_matches = list(search_path.rglob(pattern))
-            matches.extend([(str(m), m) for m in pattern_matches if m not in exact_matches])
-
-        except Exception as e:
-            get_logger().warning(f"Error searching {search_path}: {e}")
-            continue
-
-    # Remove duplicates (keep order)
-    seen = set()
-    unique_matches = []
-    for match_str, match_path in matches:
-        if match_str not in seen:
-            seen.add(match_str)
-            unique_matches.append((match_str, match_path))
+    index_path = config.cache_dir / "file_index.db"
+    with FileIndex(index_path, exclude=config.get('search.exclude', DEFAULT_EXCLUDES)) as index:
+        # Only directories whose mtime changed since the last refresh are re-listed
+        index.ensure_fresh(search_paths, max_age=config.get('search.index_max_age', 30))
+        matches, total = index.search(query, roots=search_paths, limit=max_results)
 
     # Display results
-    if not unique_matches:
+    if not matches:
         print("No files found")
         return 0
 
-    print(f"Found {len(unique_matches)} match(es):\n")
-    for i, (match_str, match_path) in enumerate(unique_matches[:50], 1):
+    print(f"Found {total} match(es):\n")
+    for i, match in enumerate(matches, 1):
+        match_path = Path(match.path)
+        suffix = " (similar name)" if match.fuzzy else ""
         # Show relative path if inside current directory
         try:
             rel_path = match_path.relative_to(Path.cwd())
-            print(f"  {i}. {rel_path}")
+            print(f"  {i}. {rel_path}{suffix}")
         except ValueError:
-            print(f"  {i}. {match_str}")
+            print(f"  {i}. {match.path}{suffix}")
 
-    if len(unique_matches) > 50:
-        print(f"\n... and {len(unique_matches) - 50} more")
+    if total > len(matches):
+        print(f"\n... and {total - len(matches)} more")
 
     return 0
 
@@ -136,7 +121,7 @@ def _search_content(query: str, config: CLIConfig) -> int:
     if use_ripgrep and _is_command_available('rg'):
         return _search_with_ripgrep(query, search_paths, config)
     else:
-        return _search_with_grep(query, search_paths, config)
+        return _search_builtin(query, search_paths, config)
 
 
 def _search_with_ripgrep(query: str, search_paths: List[Path], config: CLIConfig) -> int:
@@ -175,40 +160,37 @@ def _search_with_ripgrep(query: str, search_paths: List[Path], config: CLIConfig
         return 1
 
 
-def _search_with_grep(query: str, search_paths: List[Path], config: CLIConfig) -> int:
-    """Search using grep (fallback)"""
+def _search_builtin(query: str, search_paths: List[Path], config: CLIConfig) -> int:
+    """Search using the built-in parallel content search"""
     max_results = config.get('search.max_results', 50)
-    matches = []
-
-    for search_path in search_paths:
-        if not search_path.exists():
-            continue
-
-        try:
-            # Use grep recursively
-            cmd = ['grep', '-r', '-n', '-I', query, str(search_path)]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+    engine = ContentSearch(
+        max_results=max_results,
+        max_file_size=config.get('search.max_file_size', DEFAULT_MAX_FILE_SIZE)
+    )
 
-            if result.returncode == 0:
-                matches.append(result.stdout)
-
-        except Exception as e:
-            get_logger().warning(f"Error searching {search_path}: {e}")
-            continue
+    index_path = config.cache_dir / "file_index.db"
+    with FileIndex(index_path, exclude=config.get('search.exclude', DEFAULT_EXCLUDES)) as index:
+        # The filename index supplies the file list, so no directory walk is needed
+        index.ensure_fresh(search_paths, max_age=config.get('search.index_max_age', 30))
+        matches = engine.search(query, index.iter_files(search_paths))
 
     if not matches:
         print("No matches found")
         return 0
 
-    # Display results (limit to max_results)
-    all_lines = []
-    for match_output in matches:
-        all_lines.extend(match_output.strip().split('\n'))
-
-    print('\n'.join(all_lines[:max_results]))
+    cwd = Path.cwd()
+    for match in matches:
+        match_path = Path(match.path)
+        try:
+            display_path = match_path.relative_to(cwd)
+        except ValueError:
+            display_path = match_path
+        for line_number, text in match.lines:
+            print(f"{display_path}:{line_number}:{text}")
 
-    if len(all_lines) > max_results:
-        print(f"\n... and {len(all_lines) - max_results} more matches")
+    shown = sum(len(match.lines) for match in matches)
+    if shown >= max_results:
+        print(f"\n(stopped after {max_results} matches)")
 
     return 0
 
@@ -247,13 +229,7 @@ def _get_search_paths(config: CLIConfig) -> List[Path]:
     return search_paths
 
 
+@lru_cache(maxsize=None)
 def _is_command_available(command: str) -> bool:
-    """Check if a command is available in PATH"""
-    try:
-        subprocess.run([command, '--version'],
-                      capture_output=True,
-                      check=False,
-                      timeout=1)
-        return True
-    except (subprocess.SubprocessError, FileNotFoundError):
-        return False
+    """Check if a command is available in PATH (cached for the process)"""
+    return shutil.which(command) is not None
@@ -0,0 +1,210 @@
+"""
+Bulk skill execution over JSONL input files.
+
+Runs one skill over many inputs in a single process: the SkillExecutor (and
+with it the provider client and system prompt) is shared, calls run on a
+bounded thread pool, and results are appended to a JSONL file in completion
+order as soon as each call finishes. Inputs whose ID already has a successful
+result in the output file are skipped, so an interrupted run can be resumed
+by re-running the same command.
+"""
+import json
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Set
+
+from cli.core.skill_executor import SkillExecutor
+from cli.utils.logger import get_logger
+
+
+@dataclass
+class BatchItem:
+    """A single input line."""
+    id: str
+    input: str
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BatchSummary:
+    """Counts for a finished batch run."""
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+
+def read_batch_inputs(input_path: Path) -> Iterator[BatchItem]:
+    """
+    Read batch inputs from a JSONL file.
+
+    Each line is either a JSON object with an "input" (or "text") field and
+    optional "id" and "options" fields, or a bare JSON string. Lines without
+    an ID are identified by their line number.
+
+    Raises:
+        ValueError: If a line is not valid JSON or has no input
+    """
+    with open(input_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{input_path}:{line_number}: invalid JSON: {e}")
+
+            if isinstance(record, str):
+                record = {'input': record}
+
+            text = record.get('input', record.get('text')) if isinstance(record, dict) else None
+            if not isinstance(text, str):
+                raise ValueError(f"{input_path}:{line_number}: expected an object with an 'input' field")
+
+            yield BatchItem(
+                id=str(record.get('id', f"line-{line_number}")),
+                input=text,
+                options=record.get('options') or {}
+            )
+
+
+def completed_ids(output_path: Path) -> Set[str]:
+    """Return IDs that already have a successful result in an output file."""
+    done = set()
+    if not output_path.exists():
+        return done
+
+    with open(output_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Partially written last line from an interrupted run
+                continue
+            if isinstance(record, dict) and record.get('status') == 'success':
+                done.add(str(record.get('id')))
+
+    return done
+
+
+class BatchRunner:
+    """Run one skill over a stream of inputs with bounded concurrency."""
+
+    def __init__(self, executor: SkillExecutor, skill_name: str, jobs: int = 4,
+                 options: Optional[Dict[str, Any]] = None):
+        """
+        Initialize batch runner.
+
+        Args:
+            executor: Shared skill executor
+            skill_name: Skill to run for every input
+            jobs: Maximum number of concurrent skill calls
+            options: Skill options applied to every input (per-line options win)
+        """
+        if jobs < 1:
+            raise ValueError("jobs must be at least 1")
+
+        self.executor = executor
+        self.skill_name = skill_name
+        self.jobs = jobs
+        self.options = options or {}
+        self.logger = get_logger()
+
+    def run(self, input_path: Path, output_path: Path,
+            on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> BatchSummary:
+        """
+        Process every pending input and append results to the output file.
+
+        Args:
+            input_path: JSONL input file
+            output_path: JSONL results file (appended to, created if missing)
+            on_result: Optional callback for each result record
+
+        Returns:
+            BatchSummary
+        """
+        input_path = Path(input_path)
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        done = completed_ids(output_path)
+        summary = BatchSummary()
+
+        # Build the prompt and provider once, before threads start sharing them
+        self.executor.warm_up([self.skill_name])
+
+        partial_line = self._ends_with_partial_line(output_path)
+
+        with open(output_path, 'a', encoding='utf-8') as out, \
+                ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix='superskills-batch') as pool:
+            if partial_line:
+                # Start appended records on a fresh line after an interrupted write
+                out.write("\n")
+
+            pending = {}
+            # Keep a small backlog queued so workers never idle, without
+            # reading the whole input file into futures up front
+            max_pending = self.jobs * 2
+
+            for item in read_batch_inputs(input_path):
+                summary.total += 1
+                if item.id in done:
+                    summary.skipped += 1
+                    continue
+
+                if len(pending) >= max_pending:
+                    self._write_finished(pending, out, summary, on_result)
+
+                pending[pool.submit(self._execute, item)] = item
+
+            while pending:
+                self._write_finished(pending, out, summary, on_result)
+
+        self.logger.info(
+            f"Batch {self.skill_name}: {summary.succeeded} succeeded, "
+            f"{summary.failed} failed, {summary.skipped} skipped"
+        )
+        return summary
+
+    def _execute(self, item: BatchItem) -> Dict[str, Any]:
+        options = {**self.options, **item.options}
+        return self.executor.execute(self.skill_name, item.input, **options)
+
+    def _write_finished(self, pending, out, summary: BatchSummary, on_result) -> None:
+        """Wait for at least one call to finish and write every finished result."""
+        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+        for future in finished:
+            item = pending.pop(future)
+            error = future.exception()
+
+            if error is None:
+                result = future.result()
+                record = {
+                    'id': item.id,
+                    'status': 'success',
+                    'output': result.get('output'),
+                    'metadata': result.get('metadata', {})
+                }
+                summary.succeeded += 1
+            else:
+                self.logger.debug(f"Batch item {item.id} failed: {error}")
+                record = {'id': item.id, 'status': 'error', 'error': str(error)}
+                summary.failed += 1
+
+            out.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            out.flush()
+
+            if on_result:
+                on_result(record)
+
+    @staticmethod
+    def _ends_with_partial_line(path: Path) -> bool:
+        if not path.exists() or path.stat().st_size == 0:
+            return False
+        with open(path, 'rb') as f:
+            f.seek(-1, 2)
+            return f.read(1) != b"\n"
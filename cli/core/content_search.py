@@ -0,0 +1,173 @@
+"""
+Built-in content search for `superskills search`.
+
+Scans files in parallel with memory-mapped reads, so content search works
+the same on every machine whether or not ripgrep is installed. Binary files
+are recognised from their first block and skipped before being mapped, and
+the scan stops once `max_results` matching lines have been found. Matching
+files are ranked by match density (matches per KB), so short notes that are
+about the query come before long files that mention it once.
+
+Matching is smart-case, like ripgrep: an all-lowercase query ignores case,
+a query with capitals is matched exactly.
+"""
+import mmap
+import os
+import re
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Set, Tuple
+
+# Bytes inspected to decide whether a file is binary
+BINARY_SNIFF_BYTES = 8192
+
+# Files larger than this are skipped by default (logs, disk images, ...)
+DEFAULT_MAX_FILE_SIZE = 10 * 1024 * 1024
+
+# Lines longer than this are shortened in results
+MAX_LINE_LENGTH = 300
+
+
+@dataclass
+class ContentMatch:
+    """Matching lines of one file."""
+    path: str
+    size: int
+    hits: int
+    lines: List[Tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def density(self) -> float:
+        """Matches per KB of file."""
+        return self.hits * 1024 / max(self.size, 1)
+
+
+def _compile(query: str) -> 're.Pattern[bytes]':
+    """Smart-case byte pattern for a literal query."""
+    if query != query.lower():
+        return re.compile(re.escape(query.encode('utf-8')))
+
+    # IGNORECASE on a bytes pattern only folds ASCII letters, so other
+    # letters match as any of their case forms, encoded
+    parts = []
+    for char in query:
+        variants = {char, char.upper(), char.title()}
+        if char.isascii() or len(variants) == 1:
+            parts.append(re.escape(char.encode('utf-8')))
+        else:
+            parts.append(b'(?:' + b'|'.join(re.escape(variant.encode('utf-8')) for variant in sorted(variants)) + b')')
+    return re.compile(b''.join(parts), re.IGNORECASE)
+
+
+class ContentSearch:
+    """Parallel, memory-mapped text search over a set of files."""
+
+    def __init__(self, max_results: int = 50, max_file_size: int = DEFAULT_MAX_FILE_SIZE,
+                 workers: Optional[int] = None):
+        self.max_results = max_results
+        self.max_file_size = max_file_size
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)
+
+    def search(self, query: str, paths: Iterable[str]) -> List[ContentMatch]:
+        """
+        Search files for a literal query.
+
+        Args:
+            query: Text to find
+            paths: Files to scan
+
+        Returns:
+            Matching files, highest match density first. Together they hold
+            at most `max_results` lines.
+        """
+        if not query:
+            return []
+
+        pattern = _compile(query)
+
+        found: List[ContentMatch] = []
+        state = {'lines': 0}
+        lock = threading.Lock()
+        done = threading.Event()
+
+        def scan(path: str) -> None:
+            if done.is_set():
+                return
+            match = self._scan_file(path, pattern, done)
+            if match is None:
+                return
+            with lock:
+                remaining = self.max_results - state['lines']
+                if remaining <= 0:
+                    return
+                match.lines = match.lines[:remaining]
+                state['lines'] += len(match.lines)
+                found.append(match)
+                if state['lines'] >= self.max_results:
+                    done.set()
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='superskills-search') as pool:
+            # map() would queue every path up front; submit lazily so a
+            # finished search stops consuming the path iterator
+            pending: Set[Future] = set()
+            for path in paths:
+                if done.is_set():
+                    break
+                pending.add(pool.submit(scan, path))
+                if len(pending) >= self.workers * 4:
+                    _, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+        found.sort(key=lambda match: (-match.density, -match.hits, match.path))
+        return found
+
+    def _scan_file(self, path: str, pattern: 're.Pattern[bytes]',
+                   done: threading.Event) -> Optional[ContentMatch]:
+        try:
+            size = os.path.getsize(path)
+            if size == 0 or size > self.max_file_size:
+                return None
+
+            with open(path, 'rb') as f:
+                if b'\0' in f.read(BINARY_SNIFF_BYTES):
+                    return None
+
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return self._collect(path, size, data, pattern, done)
+        except (OSError, ValueError):
+            # Unreadable, vanished or unmappable files are skipped
+            return None
+
+    def _collect(self, path: str, size: int, data: mmap.mmap, pattern: 're.Pattern[bytes]',
+                 done: threading.Event) -> Optional[ContentMatch]:
+        hits = 0
+        lines: List[Tuple[int, str]] = []
+        line_number = 1
+        counted_to = 0
+        last_line_start = -1
+
+        for found in pattern.finditer(data):
+            if done.is_set() and not lines:
+                return None
+
+            hits += 1
+            start = found.start()
+            line_start = data.rfind(b'\n', 0, start) + 1
+            if line_start == last_line_start:
+                continue
+
+            line_number += data[counted_to:line_start].count(b'\n')
+            counted_to = line_start
+            last_line_start = line_start
+
+            if len(lines) < self.max_results:
+                line_end = data.find(b'\n', start)
+                text = data[line_start:line_end if line_end != -1 else size]
+                text = text.decode('utf-8', errors='replace').rstrip('\r')
+                if len(text) > MAX_LINE_LENGTH:
+                    text = text[:MAX_LINE_LENGTH] + '...'
+                lines.append((line_number, text))
+
+        if not hits:
+            return None
+        return ContentMatch(path=path, size=size, hits=hits, lines=lines)
@@ -0,0 +1,189 @@
+"""
+Deferred workflow execution through provider batch APIs.
+
+Instead of running a workflow file by file, deferred mode runs it step by
+step across all files: every prompt-skill call for a step is submitted as one
+provider batch job, the job is polled until it finishes, and the results are
+written back into each file's workflow context before the next step is
+prepared. Python skill steps run synchronously between batch jobs.
+
+Submitted batch IDs are recorded under ~/.superskills/cache/deferred/, so an
+interrupted overnight run picks up the pending job instead of paying for it
+twice.
+"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from cli.core.skill_executor import SkillExecutor
+from cli.core.workflow_plan import CompiledStep, WorkflowPlan, resolve_reference
+from cli.utils.config import CLIConfig
+from cli.utils.llm_client import BATCH_COMPLETED, BATCH_FAILED, BatchResult, LLMProvider
+from cli.utils.logger import get_logger
+from superskills.core.deadline import Deadline
+
+
+class DeferredRunner:
+    """Run a compiled workflow over many inputs using provider batch jobs."""
+
+    def __init__(self, executor: SkillExecutor, config: CLIConfig):
+        self.executor = executor
+        self.config = config
+        self.logger = get_logger()
+        self.state_dir = config.cache_dir / "deferred"
+        self.poll_interval = config.get('workflows.deferred.poll_interval', 30)
+        self.max_wait = config.get('workflows.deferred.max_wait', 24 * 60 * 60)
+
+    def run(self, plan: WorkflowPlan, inputs: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Execute a plan for every input.
+
+        Args:
+            plan: Compiled workflow plan
+            inputs: Input ID (e.g. file name) -> runtime variables
+
+        Returns:
+            Input ID -> {'context': ..., 'steps': ..., 'final_output': ...} on
+            success, or {'error': message} if one of its steps failed
+        """
+        contexts: Dict[str, Dict[str, Any]] = {}
+        for input_id, variables in inputs.items():
+            context = dict(variables)
+            for variable in plan.variables:
+                if variable.name not in context:
+                    context[variable.name] = resolve_reference(context, variable.value, variable.ref)
+            contexts[input_id] = context
+
+        step_results: Dict[str, Dict[str, Any]] = {input_id: {} for input_id in inputs}
+        errors: Dict[str, str] = {}
+
+        for step in plan.steps:
+            active = [input_id for input_id in inputs if input_id not in errors]
+            if not active:
+                break
+
+            self.logger.info(f"Deferred step {step.index}/{len(plan.steps)}: {step.name} ({len(active)} inputs)")
+            step_inputs = {
+                input_id: resolve_reference(contexts[input_id], step.input, step.input_ref)
+                for input_id in active
+            }
+
+            skill_info = self.executor.loader.get_skill(step.skill)
+            if skill_info and skill_info.skill_type == 'prompt':
+                outcomes = self._run_batch_step(plan, step, step_inputs)
+            else:
+                outcomes = self._run_sync_step(step, step_inputs)
+
+            for input_id, outcome in outcomes.items():
+                if isinstance(outcome, Exception):
+                    errors[input_id] = f"Step '{step.name}' failed: {outcome}"
+                    continue
+                if step.output:
+                    contexts[input_id][step.output] = outcome['output']
+                    step_results[input_id][step.name] = outcome
+
+        results = {}
+        for input_id in inputs:
+            if input_id in errors:
+                results[input_id] = {'error': errors[input_id]}
+            else:
+                results[input_id] = {
+                    'context': contexts[input_id],
+                    'steps': step_results[input_id],
+                    'final_output': contexts[input_id].get(plan.final_output) if plan.steps else None
+                }
+        return results
+
+    def _run_sync_step(self, step: CompiledStep, step_inputs: Dict[str, str]) -> Dict[str, Any]:
+        outcomes = {}
+        for input_id, input_text in step_inputs.items():
+            try:
+                outcomes[input_id] = self.executor.execute(step.skill, input_text, **step.config)
+            except Exception as e:
+                outcomes[input_id] = e
+        return outcomes
+
+    def _run_batch_step(self, plan: WorkflowPlan, step: CompiledStep,
+                        step_inputs: Dict[str, str]) -> Dict[str, Any]:
+        provider = self.executor.batch_provider()
+
+        # Provider custom IDs have strict formats; map them back to input IDs
+        custom_ids = {f"item-{n}": input_id for n, input_id in enumerate(step_inputs)}
+        requests = [
+            self.executor.batch_request(step.skill, step_inputs[input_id], custom_id, **step.config)
+            for custom_id, input_id in custom_ids.items()
+        ]
+
+        state_file = self._state_file(plan, step, requests)
+        batch_id = self._load_batch_id(state_file)
+        if batch_id:
+            self.logger.info(f"Resuming batch job {batch_id} for step {step.name}")
+        else:
+            batch_id = provider.submit_batch(requests)
+            self._save_batch_id(state_file, batch_id)
+            self.logger.info(f"Submitted batch job {batch_id} for step {step.name} ({len(requests)} requests)")
+
+        try:
+            batch_results = self._wait_for_batch(provider, batch_id)
+        except Exception as e:
+            return {input_id: e for input_id in step_inputs}
+
+        state_file.unlink(missing_ok=True)
+
+        outcomes = {}
+        for custom_id, input_id in custom_ids.items():
+            result: Optional[BatchResult] = batch_results.get(custom_id)
+            if result is None:
+                outcomes[input_id] = RuntimeError("No result returned by batch job")
+            elif result.error:
+                outcomes[input_id] = RuntimeError(result.error)
+            else:
+                outcomes[input_id] = {
+                    'output': result.output,
+                    'metadata': {
+                        'skill': step.skill,
+                        'type': 'prompt',
+                        'provider': provider.__class__.__name__,
+                        'batch_id': batch_id
+                    }
+                }
+        return outcomes
+
+    def _wait_for_batch(self, provider: LLMProvider, batch_id: str) -> Dict[str, BatchResult]:
+        """Poll a batch job until it finishes (or max_wait passes)."""
+        deadline = Deadline(self.max_wait)
+
+        while True:
+            status = provider.batch_status(batch_id)
+            if status == BATCH_COMPLETED:
+                return provider.batch_results(batch_id)
+            if status == BATCH_FAILED:
+                raise RuntimeError(f"Batch job {batch_id} failed")
+
+            self.logger.debug(f"Batch job {batch_id} pending; checking again in {self.poll_interval}s")
+            deadline.sleep(self.poll_interval, f"Batch job {batch_id}")
+
+    def _state_file(self, plan: WorkflowPlan, step: CompiledStep, requests: List) -> Path:
+        digest = hashlib.sha256()
+        for request in requests:
+            digest.update(json.dumps(
+                [request.custom_id, request.system_prompt, request.user_prompt, request.options],
+                sort_keys=True, default=str
+            ).encode('utf-8'))
+        return self.state_dir / f"{plan.file_hash[:16]}-{step.index}-{digest.hexdigest()[:16]}.json"
+
+    def _load_batch_id(self, state_file: Path) -> Optional[str]:
+        try:
+            with open(state_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get('batch_id')
+        except (OSError, ValueError):
+            return None
+
+    def _save_batch_id(self, state_file: Path, batch_id: str) -> None:
+        try:
+            state_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(state_file, 'w', encoding='utf-8') as f:
+                json.dump({'batch_id': batch_id}, f)
+        except OSError as e:
+            self.logger.debug(f"Could not record batch job {batch_id}: {e}")
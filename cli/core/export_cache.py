@@ -0,0 +1,115 @@
+"""
+Persistent cache of `superskills export` entries.
+
+Export builds one metadata entry per skill and per workflow file. Each entry
+is stored with the modification time and size of the files it was built
+from, so an export only rebuilds entries whose sources changed (or appeared
+or disappeared) and reuses the rest. Stale entries are rebuilt in parallel.
+
+The cache file also records a `salt` (the export code's own file stats);
+when it differs, every entry is rebuilt.
+"""
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from cli.utils.logger import get_logger
+
+CACHE_VERSION = 1
+
+Stamp = List[Tuple[str, Optional[Tuple[int, int]]]]
+
+
+def file_stamp(sources: Iterable[Path]) -> Stamp:
+    """(path, (mtime_ns, size)) for each source; None for missing files."""
+    stamp = []
+    for path in sources:
+        try:
+            stat = os.stat(path)
+            stamp.append((str(path), (stat.st_mtime_ns, stat.st_size)))
+        except OSError:
+            stamp.append((str(path), None))
+    return stamp
+
+
+class ExportCache:
+    """Export entries keyed by name, validated against source file stats."""
+
+    def __init__(self, path: Path, salt: Any = None, workers: Optional[int] = None):
+        self.path = Path(path)
+        self.salt = salt
+        self.workers = workers or min(8, (os.cpu_count() or 1) + 4)
+        self.rebuilt: List[str] = []
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        self._dirty = False
+
+    def build(self, items: Dict[str, Tuple[List[Path], Callable[[], Any]]]) -> Dict[str, Any]:
+        """
+        Return the entry for every item, rebuilding only stale ones.
+
+        Args:
+            items: name -> (source files, builder). The builder runs only when
+                a source changed since the cached entry was built.
+
+        Returns:
+            name -> entry, for every item. Cached names not in `items` are
+            dropped from the cache.
+        """
+        stamps = {name: self._normalize(file_stamp(sources)) for name, (sources, _) in items.items()}
+        stale = [name for name in items
+                 if name not in self._entries or self._entries[name]['stamp'] != stamps[name]]
+
+        if stale:
+            get_logger().debug(f"Rebuilding {len(stale)} export entr{'y' if len(stale) == 1 else 'ies'}")
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(stale))) as pool:
+                built = list(pool.map(lambda name: items[name][1](), stale))
+            for name, entry in zip(stale, built):
+                self._entries[name] = {'stamp': stamps[name], 'entry': entry}
+            self._dirty = True
+
+        removed = set(self._entries) - set(items)
+        for name in removed:
+            del self._entries[name]
+        self._dirty = self._dirty or bool(removed)
+        self.rebuilt = stale
+
+        return {name: self._entries[name]['entry'] for name in items}
+
+    def save(self) -> None:
+        """Write the cache atomically if anything changed."""
+        if not self._dirty:
+            return
+        payload = {'version': CACHE_VERSION, 'salt': self.salt, 'entries': self._entries}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix='.export_cache.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(payload, f)
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            self._dirty = False
+        except OSError as e:
+            get_logger().debug(f"Could not save export cache: {e}")
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get('version') != CACHE_VERSION:
+            return {}
+        if payload.get('salt') != self._normalize(self.salt):
+            return {}
+        return payload.get('entries') or {}
+
+    @staticmethod
+    def _normalize(value: Any) -> Any:
+        # Stamps are compared with what came back from JSON (tuples -> lists)
+        return json.loads(json.dumps(value))
@@ -0,0 +1,381 @@
+"""
+Persistent filename index for `superskills search`.
+
+File names under the configured search paths are stored in a SQLite
+database in ~/.superskills/cache/. Names are indexed with SQLite's FTS5
+trigram tokenizer, so case-insensitive substring queries are answered from
+the index instead of walking the file system, and typos are handled by
+ranking names on trigram overlap with the query.
+
+The index is kept current incrementally: each directory's mtime is stored,
+and a refresh only re-lists directories whose mtime changed (a file or
+folder was added, removed or renamed in it). Unchanged directories cost a
+single stat.
+
+On SQLite builds without the trigram tokenizer (before 3.34) the index
+falls back to LIKE scans over the stored names.
+"""
+import fnmatch
+import os
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from cli.utils.logger import get_logger
+
+# Directories that are never worth indexing
+DEFAULT_EXCLUDES = ('.git', '.hg', '.svn', 'node_modules', '__pycache__', '.venv', '.cache', '.Trash')
+
+# Minimum trigram similarity for a fuzzy match
+FUZZY_THRESHOLD = 0.3
+
+# Candidate rows considered per query before ranking
+CANDIDATE_LIMIT = 2000
+
+_TERM_SPLIT = re.compile(r'[\s_\-./\\]+')
+_GLOB_CHARS = re.compile(r'[*?\[]')
+# fnmatch negates a character class with [!...], SQLite GLOB with [^...];
+# fnmatch reads [^...] as a class that includes '^'
+_CARET_CLASS = re.compile(r'\[\^([^\]]+)\]')
+_NEGATED_CLASS = re.compile(r'\[!')
+
+
+@dataclass
+class FileMatch:
+    """A file name search hit."""
+    path: str
+    score: float
+    fuzzy: bool = False
+
+
+def trigrams(text: str) -> Set[str]:
+    """Lower-cased character trigrams of a string, ignoring separators."""
+    text = _TERM_SPLIT.sub('', text.lower())
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class FileIndex:
+    """SQLite-backed filename index, refreshed incrementally by directory mtime."""
+
+    def __init__(self, db_path: Path, exclude: Iterable[str] = DEFAULT_EXCLUDES):
+        self.db_path = Path(db_path)
+        self.exclude = set(exclude)
+        self.logger = get_logger()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), timeout=5)
+        self.fts = self._create_schema()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> 'FileIndex':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # Maintenance
+
+    def ensure_fresh(self, roots: Iterable[Path], max_age: float = 30) -> None:
+        """Refresh roots that were last refreshed more than max_age seconds ago."""
+        now = time.time()
+        stale = []
+        for root in roots:
+            row = self.conn.execute(
+                "SELECT refreshed_at FROM roots WHERE path = ?", (self._key(root),)
+            ).fetchone()
+            if row is None or now - row[0] > max_age:
+                stale.append(root)
+
+        if stale:
+            self.refresh(stale)
+
+    def refresh(self, roots: Iterable[Path]) -> Dict[str, int]:
+        """
+        Bring the index up to date for the given root directories.
+
+        Returns:
+            Counts of directories visited and re-listed
+        """
+        stats = {'visited': 0, 'rescanned': 0}
+
+        with self.conn:
+            for root in roots:
+                root_key = self._key(root)
+                known = self._known_dirs(root_key)
+                self._refresh_root(root_key, known, stats)
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO roots (path, refreshed_at) VALUES (?, ?)",
+                    (root_key, time.time())
+                )
+
+        self.logger.debug(f"File index refreshed: {stats['rescanned']}/{stats['visited']} directories re-listed")
+        return stats
+
+    def _refresh_root(self, root: str, known: Dict[str, Tuple[int, List[str]]],
+                      stats: Dict[str, int]) -> None:
+        stack = [root]
+
+        while stack:
+            directory = stack.pop()
+            stats['visited'] += 1
+
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                self._remove_tree(directory)
+                continue
+
+            entry = known.get(directory)
+            if entry is not None and entry[0] == mtime:
+                stack.extend(entry[1])
+                continue
+
+            stats['rescanned'] += 1
+            files, subdirs = self._list_directory(directory)
+
+            if entry is not None:
+                self.conn.execute("DELETE FROM files WHERE dir = ?", (directory,))
+            self.conn.executemany(
+                "INSERT INTO files (dir, name, lname) VALUES (?, ?, ?)",
+                [(directory, name, name.lower()) for name in files]
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO dirs (path, parent, mtime_ns) VALUES (?, ?, ?)",
+                (directory, os.path.dirname(directory), mtime)
+            )
+
+            children = [os.path.join(directory, name) for name in subdirs]
+            if entry is not None:
+                for gone in set(entry[1]) - set(children):
+                    self._remove_tree(gone)
+            stack.extend(children)
+
+    def _list_directory(self, directory: str) -> Tuple[List[str], List[str]]:
+        files, subdirs = [], []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.exclude:
+                                subdirs.append(entry.name)
+                        else:
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError as e:
+            self.logger.debug(f"Cannot list {directory}: {e}")
+        return files, subdirs
+
+    def _known_dirs(self, root: str) -> Dict[str, Tuple[int, List[str]]]:
+        """Stored directories under root: path -> (mtime_ns, child paths)."""
+        rows = self.conn.execute(
+            f"SELECT path, parent, mtime_ns FROM dirs WHERE {self._under('path')}",
+            self._under_args(root)
+        ).fetchall()
+
+        known = {path: (mtime, []) for path, _, mtime in rows}
+        for path, parent, _ in rows:
+            if parent in known and path != parent:
+                known[parent][1].append(path)
+        return known
+
+    def _remove_tree(self, directory: str) -> None:
+        args = self._under_args(directory)
+        self.conn.execute(f"DELETE FROM files WHERE {self._under('dir')}", args)
+        self.conn.execute(f"DELETE FROM dirs WHERE {self._under('path')}", args)
+
+    # Queries
+
+    def search(self, query: str, roots: Optional[Iterable[Path]] = None, limit: int = 50,
+               fuzzy: bool = True) -> Tuple[List[FileMatch], int]:
+        """
+        Find files by name.
+
+        Glob patterns (``*.md``) are matched case-insensitively against the
+        whole name. Otherwise every word of the query must occur in the name
+        (``executive summary`` finds ``Executive-Summary.md``); if that finds
+        fewer than `limit` files, names similar to the query are added.
+
+        Args:
+            query: Search text or glob pattern
+            roots: Only return files under these directories
+            limit: Maximum number of matches returned
+            fuzzy: Add trigram-similarity matches for typos
+
+        Returns:
+            Tuple of (best matches, total number of matches found)
+        """
+        query = query.strip()
+        if not query:
+            return [], 0
+
+        root_keys = [self._key(root) for root in roots] if roots is not None else None
+
+        if _GLOB_CHARS.search(query):
+            matches = self._search_glob(query, root_keys)
+        else:
+            matches = self._search_terms(query, root_keys)
+            if fuzzy and len(matches) < limit:
+                seen = {match.path for match in matches}
+                matches.extend(m for m in self._search_fuzzy(query, root_keys) if m.path not in seen)
+
+        matches.sort(key=lambda match: (-match.score, len(match.path), match.path))
+        return matches[:limit], len(matches)
+
+    def iter_files(self, roots: Optional[Iterable[Path]] = None) -> Iterator[str]:
+        """Yield the paths of all indexed files, optionally only under `roots`."""
+        root_keys = [self._key(root) for root in roots] if roots is not None else None
+        root_clause, root_args = self._roots_clause(root_keys)
+        for directory, name in self.conn.execute(f"SELECT dir, name FROM files WHERE 1 {root_clause}", root_args):
+            yield os.path.join(directory, name)
+
+    def _search_glob(self, pattern: str, roots: Optional[List[str]]) -> List[FileMatch]:
+        pattern = pattern.lower()
+        root_clause, root_args = self._roots_clause(roots)
+        rows = self.conn.execute(
+            f"SELECT dir, name FROM files WHERE lname GLOB ? {root_clause} LIMIT ?",
+            [self._sqlite_glob(pattern), *root_args, CANDIDATE_LIMIT]
+        ).fetchall()
+        return [FileMatch(os.path.join(d, name), 1.0) for d, name in rows if fnmatch.fnmatch(name.lower(), pattern)]
+
+    def _search_terms(self, query: str, roots: Optional[List[str]]) -> List[FileMatch]:
+        terms = [term for term in _TERM_SPLIT.split(query.lower()) if term]
+        if not terms:
+            return []
+
+        long_terms = [term for term in terms if len(term) >= 3] if self.fts else []
+        short_terms = [term for term in terms if term not in long_terms]
+        root_clause, root_args = self._roots_clause(roots, table='f')
+
+        like_clause = ''.join(" AND f.lname LIKE ? ESCAPE '\\'" for _ in short_terms)
+        like_args = [f"%{self._escape_like(term)}%" for term in short_terms]
+
+        if long_terms:
+            sql = (f"SELECT f.dir, f.name FROM names JOIN files f ON f.id = names.rowid "
+                   f"WHERE names MATCH ? {like_clause} {root_clause} LIMIT ?")
+            args = [' AND '.join(self._fts_phrase(term) for term in long_terms)]
+        else:
+            sql = f"SELECT f.dir, f.name FROM files f WHERE 1 {like_clause} {root_clause} LIMIT ?"
+            args = []
+
+        rows = self.conn.execute(sql, [*args, *like_args, *root_args, CANDIDATE_LIMIT]).fetchall()
+
+        compact = ''.join(terms)
+        matches = []
+        for directory, name in rows:
+            stem = _TERM_SPLIT.sub('', os.path.splitext(name)[0].lower())
+            if stem == compact:
+                score = 3.0
+            elif stem.startswith(compact) or name.lower().startswith(terms[0]):
+                score = 2.0
+            else:
+                score = 1.0
+            matches.append(FileMatch(os.path.join(directory, name), score))
+        return matches
+
+    def _search_fuzzy(self, query: str, roots: Optional[List[str]]) -> List[FileMatch]:
+        query_trigrams = trigrams(query)
+        if not query_trigrams:
+            return []
+
+        root_clause, root_args = self._roots_clause(roots, table='f')
+        if self.fts:
+            rows = self.conn.execute(
+                f"SELECT f.dir, f.name FROM names JOIN files f ON f.id = names.rowid "
+                f"WHERE names MATCH ? {root_clause} ORDER BY names.rank LIMIT ?",
+                [' OR '.join(self._fts_phrase(t) for t in sorted(query_trigrams)), *root_args, CANDIDATE_LIMIT]
+            ).fetchall()
+        else:
+            rows = self.conn.execute(
+                f"SELECT f.dir, f.name FROM files f WHERE 1 {root_clause}", root_args
+            ).fetchall()
+
+        matches = []
+        for directory, name in rows:
+            name_trigrams = trigrams(os.path.splitext(name)[0])
+            if not name_trigrams:
+                continue
+            similarity = len(query_trigrams & name_trigrams) / len(query_trigrams | name_trigrams)
+            if similarity >= FUZZY_THRESHOLD:
+                matches.append(FileMatch(os.path.join(directory, name), round(similarity, 3), fuzzy=True))
+        return matches
+
+    # Helpers
+
+    def _create_schema(self) -> bool:
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS roots (path TEXT PRIMARY KEY, refreshed_at REAL NOT NULL);
+            CREATE TABLE IF NOT EXISTS dirs (path TEXT PRIMARY KEY, parent TEXT NOT NULL, mtime_ns INTEGER NOT NULL);
+            CREATE TABLE IF NOT EXISTS files (
+                id INTEGER PRIMARY KEY,
+                dir TEXT NOT NULL,
+                name TEXT NOT NULL,
+                lname TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS files_dir ON files (dir);
+        """)
+
+        try:
+            with self.conn:
+                self.conn.executescript("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS names
+                        USING fts5(name, content='files', content_rowid='id', tokenize='trigram');
+                    CREATE TRIGGER IF NOT EXISTS files_ai AFTER INSERT ON files BEGIN
+                        INSERT INTO names (rowid, name) VALUES (new.id, new.name);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS files_ad AFTER DELETE ON files BEGIN
+                        INSERT INTO names (names, rowid, name) VALUES ('delete', old.id, old.name);
+                    END;
+                """)
+            return True
+        except sqlite3.OperationalError as e:
+            self.logger.debug(f"SQLite trigram index unavailable, using LIKE scans: {e}")
+            return False
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return os.path.abspath(os.path.expanduser(str(path)))
+
+    @staticmethod
+    def _under(column: str) -> str:
+        # '/' sorts just before '0', so this range is every path below the
+        # directory, and it can use the column's index
+        return f"({column} = ? OR ({column} > ? AND {column} < ?))"
+
+    @staticmethod
+    def _under_args(directory: str) -> List[str]:
+        prefix = directory.rstrip(os.sep)
+        return [directory, prefix + os.sep, prefix + chr(ord(os.sep) + 1)]
+
+    def _roots_clause(self, roots: Optional[List[str]], table: Optional[str] = None) -> Tuple[str, List[str]]:
+        if roots is None:
+            return '', []
+        if not roots:
+            return 'AND 0', []
+
+        column = f"{table}.dir" if table else 'dir'
+        clauses, args = [], []
+        for root in roots:
+            clauses.append(self._under(column))
+            args.extend(self._under_args(root))
+        return f"AND ({' OR '.join(clauses)})", args
+
+    @staticmethod
+    def _fts_phrase(text: str) -> str:
+        return '"' + text.replace('"', '""') + '"'
+
+    @staticmethod
+    def _sqlite_glob(pattern: str) -> str:
+        """The SQLite GLOB pattern matching the same names as an fnmatch pattern."""
+        pattern = _CARET_CLASS.sub(lambda match: f"[{match.group(1)}^]", pattern)
+        return _NEGATED_CLASS.sub('[^', pattern)
+
+    @staticmethod
+    def _escape_like(text: str) -> str:
+        return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
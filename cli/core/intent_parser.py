@@ -4,16 +4,17 @@ Intent parser: Convert natural language to structured intent JSON
 import json
 import os
 from dataclasses import dataclass
-from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import jsonschema
 
+from cli.core.prompt_cache import PromptCache
 from cli.core.skill_loader import SkillLoader
 from cli.utils.config import CLIConfig
-from cli.utils.llm_client import LLMProvider
+from cli.utils.llm_client import ClientPool, LLMProvider
 from cli.utils.logger import get_logger
+from cli.utils.paths import get_skills_dir
 
 
 @dataclass
@@ -65,6 +66,13 @@ class IntentParser:
         except Exception as e:
             self.logger.warning(f"Model resolution failed, using alias directly: {e}")
 
+        # The provider's SDK client comes from the process-wide pool, shared
+        # with the skill executor
+        ClientPool.configure(
+            max_connections=config.get('api.pool.max_connections', 10),
+            idle_timeout=config.get('api.pool.idle_timeout', 60)
+        )
+
         try:
             self.llm_provider = LLMProvider.create(
                 provider=provider_name,
@@ -76,9 +84,8 @@ class IntentParser:
             self.logger.error(f"Failed to initialize LLM provider: {e}")
             raise
 
-    @lru_cache(maxsize=128)
     def _get_skill_context(self) -> str:
-        """Get cached skill metadata for context"""
+        """Get skill metadata for context (cached with the prompt, see _build_system_prompt)"""
         try:
             skills = self.skill_loader.discover_skills()
             skill_list = []
@@ -130,6 +137,21 @@ class IntentParser:
             raise ValueError(f"Failed to parse intent: {e}")
 
     def _build_system_prompt(self) -> str:
+        """Return the compiled system prompt, rebuilt only when a skill changed"""
+        # Skill names and descriptions come from the SKILL.md frontmatter of
+        # skills and their subskills (see SkillLoader.skill_dirs); a folder
+        # changes when a skill or subskill in it is added or removed
+        skills_dir = get_skills_dir()
+        skill_files = sorted(skills_dir.glob('*/SKILL.md'))
+        sources = [
+            skills_dir,
+            *(skill_file.parent for skill_file in skill_files),
+            *skill_files,
+            *sorted(skills_dir.glob('*/*/SKILL.md')),
+        ]
+        return PromptCache.get('intent-parser', sources, self._compile_system_prompt).text
+
+    def _compile_system_prompt(self) -> str:
         """Build system prompt with context"""
         skill_context = self._get_skill_context()
 
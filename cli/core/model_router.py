@@ -0,0 +1,266 @@
+"""
+Adaptive model routing for prompt skills.
+
+Picks a provider and model per call instead of using the single configured
+api.model for everything. Routing rules live in the `routing` section of
+cli/config/models.yaml and match on estimated input tokens and the skill's
+declared quality tier; among a rule's candidates, providers without an API
+key and models with a high recent error rate are skipped, and rules with
+`prefer: latency` pick the model with the lowest median latency.
+
+Latency and error statistics are kept in a rolling window per model and
+persisted to ~/.superskills/cache/model_stats.json so they survive between
+CLI invocations.
+"""
+import atexit
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from cli.core.prompt_cache import estimate_tokens
+from cli.core.skill_loader import SkillInfo
+from cli.utils.config import CLIConfig
+from cli.utils.logger import get_logger
+from cli.utils.model_resolver import ModelResolver
+
+# Registry provider names -> LLMProvider.create() names
+PROVIDER_ALIASES = {'google': 'gemini'}
+
+PROVIDER_API_KEYS = {
+    'gemini': 'GEMINI_API_KEY',
+    'anthropic': 'ANTHROPIC_API_KEY',
+    'openai': 'OPENAI_API_KEY',
+}
+
+
+@dataclass
+class RouteDecision:
+    """Provider and model selected for one call."""
+    provider: str
+    model: str
+    rule: Optional[str] = None
+    reason: str = "default"
+
+
+class ModelStats:
+    """
+    Rolling latency and error statistics per model, persisted between runs.
+
+    Thread-safe; writes to disk are throttled and flushed at exit. Error rates
+    only count calls from the last `error_max_age` seconds, so a model that was
+    failing is tried again once its failures age out.
+    """
+
+    def __init__(self, path: Optional[Path] = None, window: int = 50,
+                 error_max_age: float = 3600, save_interval: float = 5.0):
+        self.path = path
+        self.window = window
+        self.error_max_age = error_max_age
+        self.save_interval = save_interval
+        # model -> deque of (unix time, latency seconds, succeeded)
+        self._samples: Dict[str, Deque[Tuple[float, float, bool]]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = 0.0
+        self._load()
+
+        if path is not None:
+            atexit.register(self.save)
+
+    def record(self, model: str, latency: float, ok: bool) -> None:
+        """Record the outcome of one call."""
+        with self._lock:
+            samples = self._samples.setdefault(model, deque(maxlen=self.window))
+            samples.append((time.time(), round(latency, 3), ok))
+            self._dirty = True
+            due = time.monotonic() - self._last_save >= self.save_interval
+
+        if due:
+            self.save()
+
+    def count(self, model: str) -> int:
+        with self._lock:
+            return len(self._samples.get(model, ()))
+
+    def error_rate(self, model: str) -> Tuple[Optional[float], int]:
+        """
+        Fraction of recent calls that failed.
+
+        Returns:
+            Tuple of (error rate or None without recent samples, sample count)
+        """
+        cutoff = time.time() - self.error_max_age
+        with self._lock:
+            recent = [ok for timestamp, _, ok in self._samples.get(model, ()) if timestamp >= cutoff]
+        if not recent:
+            return None, 0
+        return sum(1 for ok in recent if not ok) / len(recent), len(recent)
+
+    def median_latency(self, model: str) -> Optional[float]:
+        """Median latency of successful calls in the window, or None."""
+        with self._lock:
+            latencies = [latency for _, latency, ok in self._samples.get(model, ()) if ok]
+        if not latencies:
+            return None
+        return statistics.median(latencies)
+
+    def save(self) -> None:
+        """Write statistics to disk (atomically) if they changed."""
+        if self.path is None:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {model: [list(sample) for sample in samples] for model, samples in self._samples.items()}
+            self._dirty = False
+            self._last_save = time.monotonic()
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix='.model_stats-', suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            get_logger().debug(f"Could not save model statistics: {e}")
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict):
+            return
+
+        for model, samples in data.items():
+            self._samples[model] = deque(
+                ((float(timestamp), float(latency), bool(ok)) for timestamp, latency, ok in samples),
+                maxlen=self.window
+            )
+
+
+class ModelRouter:
+    """Choose a provider and model for each prompt-skill call."""
+
+    def __init__(self, config: CLIConfig, stats: Optional[ModelStats] = None,
+                 routing: Optional[Dict[str, Any]] = None):
+        self.config = config
+        self.logger = get_logger()
+
+        routing = routing if routing is not None else ModelResolver.get_routing()
+        self.rules: List[Dict[str, Any]] = routing.get('rules') or []
+
+        stats_config = routing.get('stats') or {}
+        self.min_samples = stats_config.get('min_samples', 5)
+        self.max_error_rate = stats_config.get('max_error_rate', 0.5)
+
+        if stats is None:
+            stats = ModelStats(
+                Path(config.cache_dir) / 'model_stats.json',
+                window=stats_config.get('window', 50),
+                error_max_age=stats_config.get('error_max_age', 3600)
+            )
+        self.stats = stats
+
+    def route(self, skill_info: SkillInfo, system_prompt: str, input_text: str,
+              default_provider: str, default_model: str) -> RouteDecision:
+        """
+        Pick the provider and model for a call.
+
+        Args:
+            skill_info: Skill being executed (its quality tier is used)
+            system_prompt: System prompt that will be sent
+            input_text: User input that will be sent
+            default_provider: Configured provider, used when no rule applies
+            default_model: Configured model, used when no rule applies
+
+        Returns:
+            RouteDecision; falls back to the defaults when no rule matches or
+            none of the matching rule's candidates is usable
+        """
+        tokens = estimate_tokens(system_prompt, input_text)
+        quality = skill_info.quality or 'balanced'
+
+        for rule in self.rules:
+            if not self._matches(rule, tokens, quality):
+                continue
+
+            decision = self._pick(rule)
+            if decision:
+                self.logger.debug(
+                    f"Routing {skill_info.name} (~{tokens} tokens, {quality}) to "
+                    f"{decision.provider}/{decision.model} via rule '{decision.rule}': {decision.reason}"
+                )
+                return decision
+
+            self.logger.debug(f"Routing rule '{rule.get('name')}' matched but has no usable candidate")
+
+        return RouteDecision(default_provider, default_model)
+
+    def record(self, model: str, latency: float, ok: bool) -> None:
+        """Record the outcome of a routed call."""
+        self.stats.record(model, latency, ok)
+
+    @staticmethod
+    def _matches(rule: Dict[str, Any], tokens: int, quality: str) -> bool:
+        if 'min_input_tokens' in rule and tokens < rule['min_input_tokens']:
+            return False
+        if 'max_input_tokens' in rule and tokens > rule['max_input_tokens']:
+            return False
+
+        tiers = rule.get('quality')
+        if tiers is not None:
+            if isinstance(tiers, str):
+                tiers = [tiers]
+            if quality not in tiers:
+                return False
+
+        return True
+
+    def _pick(self, rule: Dict[str, Any]) -> Optional[RouteDecision]:
+        healthy = []
+        for model in rule.get('candidates') or []:
+            provider = ModelResolver.get_provider(model)
+            if provider is None:
+                self.logger.debug(f"Routing candidate not in model registry: {model}")
+                continue
+            provider = PROVIDER_ALIASES.get(provider, provider)
+
+            if not os.getenv(PROVIDER_API_KEYS.get(provider, '')):
+                continue
+
+            error_rate, samples = self.stats.error_rate(model)
+            if samples >= self.min_samples and error_rate > self.max_error_rate:
+                self.logger.debug(f"Skipping {model}: error rate {error_rate:.0%}")
+                continue
+
+            healthy.append((provider, model))
+
+        if not healthy:
+            return None
+
+        name = rule.get('name')
+        if rule.get('prefer') == 'latency' and len(healthy) > 1:
+            # Give every candidate min_samples calls before comparing, so the
+            # statistics cover all of them rather than only the first
+            for provider, model in healthy:
+                if self.stats.median_latency(model) is None or self.stats.count(model) < self.min_samples:
+                    return RouteDecision(provider, model, name, "collecting latency samples")
+
+            latencies = {model: self.stats.median_latency(model) for _, model in healthy}
+            provider, model = min(healthy, key=lambda candidate: latencies[candidate[1]])
+            return RouteDecision(provider, model, name, f"lowest median latency ({latencies[model]:.2f}s)")
+
+        provider, model = healthy[0]
+        return RouteDecision(provider, model, name, "first available candidate")
@@ -0,0 +1,94 @@
+"""
+Process-wide cache of compiled system prompts.
+
+A skill's system prompt is assembled from three layers (SKILL.md, the Master
+Briefing and PROFILE.md). Reading the files and rendering the briefing YAML
+on every call is wasted work when nothing changed, so compiled prompts are
+cached together with their token estimate and keyed by the modification
+time and size of every source file. Editing, creating or deleting any layer
+changes the key, and the prompt is rebuilt on next use.
+
+The cache is shared by the skill executor, the workflow dry-run planner and
+the intent parser.
+"""
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from cli.utils.logger import get_logger
+
+# Rough characters-per-token ratio used to size prompts without a tokenizer
+CHARS_PER_TOKEN = 4
+
+SourceKey = Tuple[Tuple[str, Optional[Tuple[int, int]]], ...]
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Estimate the token count of some text (about 4 characters per token)."""
+    return sum(len(text) for text in texts if text) // CHARS_PER_TOKEN
+
+
+@dataclass(frozen=True)
+class CompiledPrompt:
+    """A compiled system prompt and its estimated token count."""
+    name: str
+    text: str
+    tokens: int
+
+
+class PromptCache:
+    """Compiled prompts keyed by name, validated against source file stats."""
+
+    _entries: Dict[str, Tuple[SourceKey, CompiledPrompt]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, name: str, sources: Iterable[Path], build: Callable[[], str]) -> CompiledPrompt:
+        """
+        Return the compiled prompt for `name`, building it if a source changed.
+
+        Args:
+            name: Cache key (e.g. the skill name)
+            sources: Files the prompt is built from; missing files are allowed
+                and creating one later invalidates the entry
+            build: Builds the prompt text
+
+        Returns:
+            CompiledPrompt
+        """
+        key = cls._source_key(sources)
+
+        with cls._lock:
+            entry = cls._entries.get(name)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+
+        get_logger().debug(f"Compiling system prompt: {name}")
+        text = build()
+        compiled = CompiledPrompt(name=name, text=text, tokens=estimate_tokens(text))
+
+        with cls._lock:
+            cls._entries[name] = (key, compiled)
+        return compiled
+
+    @classmethod
+    def invalidate(cls, name: Optional[str] = None) -> None:
+        """Drop one compiled prompt, or all of them."""
+        with cls._lock:
+            if name is None:
+                cls._entries.clear()
+            else:
+                cls._entries.pop(name, None)
+
+    @staticmethod
+    def _source_key(sources: Iterable[Path]) -> SourceKey:
+        key = []
+        for path in sources:
+            try:
+                stat = os.stat(path)
+                key.append((str(path), (stat.st_mtime_ns, stat.st_size)))
+            except OSError:
+                key.append((str(path), None))
+        return tuple(key)
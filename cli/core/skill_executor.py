@@ -3,12 +3,19 @@ Skill execution engine.
 """
 import importlib
 import json
-from typing import Any, Dict, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
 
+from cli.core.model_router import ModelRouter, RouteDecision
+from cli.core.prompt_cache import CompiledPrompt, PromptCache
 from cli.core.skill_loader import SkillInfo, SkillLoader
 from cli.utils.config import CLIConfig
-from cli.utils.llm_client import LLMProvider
+from cli.utils.llm_client import BatchRequest, ClientPool, LLMProvider
 from cli.utils.logger import get_logger
+from cli.utils.model_resolver import ModelResolver
+from superskills.core.deadline import Deadline, DeadlineExceeded, OperationCancelled, deadline_scope
 
 
 class SkillExecutor:
@@ -17,8 +24,36 @@ class SkillExecutor:
         self.loader = SkillLoader()
         self.llm_provider = None
         self.logger = get_logger()
+        self._provider_lock = threading.Lock()
+        self._router: Optional[ModelRouter] = None
+        self._routed_providers: Dict[Tuple[str, str], LLMProvider] = {}
+        # Skills and providers already warmed; batch and watch runs warm up
+        # once per input file, and a provider warm-up is an API round trip
+        self._warmed_skills: Set[str] = set()
+        self._warmed_providers: Set[int] = set()
+
+        ClientPool.configure(
+            max_connections=config.get('api.pool.max_connections', 10),
+            idle_timeout=config.get('api.pool.idle_timeout', 60)
+        )
 
-    def execute(self, skill_name: str, input_text: str, **kwargs) -> Dict[str, Any]:
+    def execute(self, skill_name: str, input_text: str, deadline: Optional[Deadline] = None,
+                on_chunk: Optional[Callable[[str], None]] = None, **kwargs) -> Dict[str, Any]:
+        """
+        Execute a skill.
+
+        Args:
+            skill_name: Skill to run
+            input_text: Skill input
+            deadline: Optional deadline; provider calls, retries and subprocesses
+                started by the skill stop when it expires or is cancelled
+            on_chunk: Optional callback receiving output text as it is
+                generated (prompt skills only; the full output is still returned)
+            **kwargs: Skill-specific options
+
+        Returns:
+            Result dictionary with 'output' and 'metadata'
+        """
         skill_info = self.loader.get_skill(skill_name)
         if not skill_info:
             self.logger.error(f"Skill not found: {skill_name}")
@@ -27,64 +62,296 @@ class SkillExecutor:
         self.logger.info(f"Executing {skill_info.skill_type} skill: {skill_name}")
         self.logger.debug(f"Input length: {len(input_text)} characters")
 
-        if skill_info.skill_type == 'prompt':
-            return self._execute_prompt_skill(skill_info, input_text, **kwargs)
-        else:
-            return self._execute_python_skill(skill_info, input_text, **kwargs)
+        with deadline_scope(deadline):
+            if deadline is not None:
+                deadline.check(f"Skill {skill_name}")
+
+            if skill_info.skill_type == 'prompt':
+                return self._execute_prompt_skill(
+                    skill_info, input_text, deadline=deadline, on_chunk=on_chunk, **kwargs
+                )
+            else:
+                return self._execute_python_skill(skill_info, input_text, **kwargs)
+
+    def warm_up(self, skill_names: Iterable[str], max_workers: int = 4) -> Dict[str, str]:
+        """
+        Pre-load everything the given skills need before their first call.
+
+        Compiles system prompts for prompt skills, creates the LLM provider (and
+        opens its connection), and imports Python skill modules, in parallel.
+        Skills warmed by an earlier call, and a provider whose connection was
+        already opened, are skipped.
 
-    def _execute_prompt_skill(self, skill_info: SkillInfo, input_text: str, **kwargs) -> Dict[str, Any]:
-        self.logger.debug(f"Loading skill content for: {skill_info.name}")
-        content = self.loader.load_skill_content(skill_info.name)
+        Args:
+            skill_names: Skills that are about to be executed
+            max_workers: Maximum number of warm-up threads
+
+        Returns:
+            Dict of skill name -> error message for skills that failed to warm.
+            Failures are not fatal; the skill reports them again when executed.
+        """
+        # Discover once on this thread; SkillLoader's cache is not thread-safe
+        skills = []
+        for name in dict.fromkeys(skill_names):
+            if name in self._warmed_skills:
+                continue
+            skill_info = self.loader.get_skill(name)
+            if skill_info:
+                skills.append(skill_info)
+
+        tasks = {}
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='superskills-warmup') as pool:
+            if any(s.skill_type == 'prompt' for s in skills):
+                tasks['llm_provider'] = pool.submit(self._warm_provider)
+
+            for skill_info in skills:
+                if skill_info.skill_type == 'prompt':
+                    tasks[skill_info.name] = pool.submit(self.compile_prompt, skill_info)
+                elif skill_info.python_module:
+                    module_path = skill_info.python_module.split(':')[0]
+                    tasks[skill_info.name] = pool.submit(importlib.import_module, module_path)
+
+        errors = {}
+        for name, future in tasks.items():
+            error = future.exception()
+            if error is not None:
+                errors[name] = str(error)
+                self.logger.debug(f"Warm-up failed for {name}: {error}")
+            elif name != 'llm_provider':
+                self._warmed_skills.add(name)
+
+        self.logger.debug(f"Warmed {len(tasks) - len(errors)}/{len(tasks)} resources")
+        return errors
+
+    def batch_provider(self) -> LLMProvider:
+        """
+        Return the configured LLM provider for deferred (batch API) execution.
+
+        Raises:
+            ValueError: If the provider has no batch API support
+        """
+        provider = self._get_llm_provider()
+        if not provider.supports_batch:
+            raise ValueError(f"{provider.__class__.__name__} does not support deferred execution")
+        return provider
 
-        # Build hierarchical system prompt with all three layers
-        system_prompt = self._build_system_prompt(
-            content['skill'],
-            content['master_briefing'],
-            content['profile']
+    def batch_request(self, skill_name: str, input_text: str, custom_id: str, **kwargs) -> BatchRequest:
+        """
+        Build the batch API equivalent of execute() for a prompt skill.
+
+        Args:
+            skill_name: Prompt skill to run
+            input_text: Skill input
+            custom_id: Identifier used to match the result to this request
+            **kwargs: Provider options (model, max_tokens, temperature)
+
+        Raises:
+            ValueError: If the skill is unknown or not a prompt skill
+        """
+        skill_info = self.loader.get_skill(skill_name)
+        if not skill_info:
+            raise ValueError(f"Skill not found: {skill_name}")
+        if skill_info.skill_type != 'prompt':
+            raise ValueError(f"Only prompt skills can be deferred: {skill_name}")
+
+        return BatchRequest(
+            custom_id=custom_id,
+            system_prompt=self._get_system_prompt(skill_info),
+            user_prompt=input_text,
+            options=kwargs
         )
 
-        if self.llm_provider is None:
-            self.logger.debug("Initializing LLM provider")
+    def compile_prompt(self, skill_info: SkillInfo) -> CompiledPrompt:
+        """
+        Return the compiled system prompt for a prompt skill.
 
-            # Support both old (api.anthropic.*) and new (api.provider) config structures
-            provider_name = self.config.get('api.provider')
-            if provider_name:
-                # New config structure
-                model = self.config.get('api.model', 'gemini-flash-latest')
-                max_tokens = self.config.get('api.max_tokens', 4000)
-                temperature = self.config.get('api.temperature', 0.7)
-            else:
-                # Legacy config structure (api.anthropic.*)
-                provider_name = 'anthropic'
-                model = self.config.get('api.anthropic.model', 'claude-sonnet-latest')
-                max_tokens = self.config.get('api.anthropic.max_tokens', 4000)
-                temperature = self.config.get('api.anthropic.temperature', 0.7)
-
-            self.llm_provider = LLMProvider.create(
-                provider=provider_name,
-                model=model,
-                max_tokens=max_tokens,
-                temperature=temperature
+        Compiled prompts are shared process-wide and rebuilt only when
+        SKILL.md, PROFILE.md or the Master Briefing changed on disk.
+        """
+        def build() -> str:
+            self.logger.debug(f"Loading skill content for: {skill_info.name}")
+            content = self.loader.load_skill_content(skill_info.name)
+
+            # Build hierarchical system prompt with all three layers
+            return self._build_system_prompt(
+                content['skill'],
+                content['master_briefing'],
+                content['profile']
             )
 
-        self.logger.info(f"Calling {self.llm_provider.__class__.__name__}")
-        output = self.llm_provider.call(
-            system_prompt=system_prompt,
-            user_prompt=input_text,
-            **kwargs
+        return PromptCache.get(skill_info.name, self.loader.prompt_sources(skill_info.name), build)
+
+    def clear_prompt_cache(self) -> None:
+        """Force system prompts to be rebuilt on next use."""
+        PromptCache.invalidate()
+
+    def _warm_provider(self) -> None:
+        provider = self._get_llm_provider()
+        if id(provider) in self._warmed_providers:
+            return
+        # Best-effort: a failed warm-up is not retried for every batch item
+        self._warmed_providers.add(id(provider))
+        if provider.warm_up():
+            self.logger.debug(f"{provider.__class__.__name__} connection ready")
+
+    def _provider_settings(self) -> Tuple[str, str, int, float]:
+        """Return the configured (provider, model, max_tokens, temperature)."""
+        # Support both old (api.anthropic.*) and new (api.provider) config structures
+        provider_name = self.config.get('api.provider')
+        if provider_name:
+            # New config structure
+            return (
+                provider_name,
+                self.config.get('api.model', 'gemini-flash-latest'),
+                self.config.get('api.max_tokens', 4000),
+                self.config.get('api.temperature', 0.7)
+            )
+
+        # Legacy config structure (api.anthropic.*)
+        return (
+            'anthropic',
+            self.config.get('api.anthropic.model', 'claude-sonnet-latest'),
+            self.config.get('api.anthropic.max_tokens', 4000),
+            self.config.get('api.anthropic.temperature', 0.7)
         )
 
+    def _get_llm_provider(self) -> LLMProvider:
+        with self._provider_lock:
+            if self.llm_provider is None:
+                self.logger.debug("Initializing LLM provider")
+
+                provider_name, model, max_tokens, temperature = self._provider_settings()
+                self.llm_provider = LLMProvider.create(
+                    provider=provider_name,
+                    model=model,
+                    max_tokens=max_tokens,
+                    temperature=temperature
+                )
+
+        return self.llm_provider
+
+    def _route(self, skill_info: SkillInfo, system_prompt: str, input_text: str,
+               kwargs: Dict[str, Any]) -> Tuple[LLMProvider, Optional[RouteDecision]]:
+        """
+        Select the provider for a prompt-skill call.
+
+        With api.routing enabled, the ModelRouter picks a provider and model
+        from the rules in models.yaml; otherwise (or when the caller passed an
+        explicit model) the configured default provider is used.
+
+        Returns:
+            Tuple of (provider, routing decision or None when not routed)
+        """
+        if self.config.get('api.routing', False) is not True or 'model' in kwargs:
+            return self._get_llm_provider(), None
+
+        with self._provider_lock:
+            if self._router is None:
+                self._router = ModelRouter(self.config)
+
+        default_provider, default_model, max_tokens, temperature = self._provider_settings()
+        decision = self._router.route(skill_info, system_prompt, input_text, default_provider, default_model)
+
+        if (decision.provider, decision.model) == (default_provider, default_model):
+            return self._get_llm_provider(), decision
+
+        key = (decision.provider, decision.model)
+        with self._provider_lock:
+            provider = self._routed_providers.get(key)
+            if provider is None:
+                try:
+                    provider = LLMProvider.create(
+                        provider=decision.provider,
+                        model=ModelResolver.get_model_id(decision.model),
+                        max_tokens=max_tokens,
+                        temperature=temperature
+                    )
+                except Exception as e:
+                    self.logger.warning(f"Could not create routed provider {decision.provider}/{decision.model}: {e}")
+                    provider = None
+                else:
+                    self._routed_providers[key] = provider
+
+        if provider is None:
+            return self._get_llm_provider(), None
+        return provider, decision
+
+    def _record_route(self, decision: Optional[RouteDecision], start: float, ok: bool) -> None:
+        if decision is not None and self._router is not None:
+            self._router.record(decision.model, time.monotonic() - start, ok)
+
+    def _get_system_prompt(self, skill_info: SkillInfo) -> str:
+        return self.compile_prompt(skill_info).text
+
+    def _execute_prompt_skill(self, skill_info: SkillInfo, input_text: str,
+                              deadline: Optional[Deadline] = None,
+                              on_chunk: Optional[Callable[[str], None]] = None, **kwargs) -> Dict[str, Any]:
+        system_prompt = self._get_system_prompt(skill_info)
+        llm_provider, route = self._route(skill_info, system_prompt, input_text, kwargs)
+
+        if deadline is not None:
+            kwargs['deadline'] = deadline
+
+        metadata = {
+            'skill': skill_info.name,
+            'type': 'prompt',
+            'provider': llm_provider.__class__.__name__
+        }
+        if route is not None:
+            metadata['model'] = route.model
+            metadata['route'] = route.rule
+
+        start = time.monotonic()
+        try:
+            if on_chunk is None:
+                self.logger.info(f"Calling {llm_provider.__class__.__name__}")
+                output = llm_provider.call(
+                    system_prompt=system_prompt,
+                    user_prompt=input_text,
+                    **kwargs
+                )
+            else:
+                self.logger.info(f"Streaming from {llm_provider.__class__.__name__}")
+                output, first_token_latency = self._stream_output(
+                    llm_provider.stream(system_prompt=system_prompt, user_prompt=input_text, **kwargs),
+                    on_chunk
+                )
+                metadata['first_token_latency'] = first_token_latency
+        except (DeadlineExceeded, OperationCancelled, KeyboardInterrupt):
+            raise
+        except Exception:
+            self._record_route(route, start, ok=False)
+            raise
+        self._record_route(route, start, ok=True)
+
         self.logger.info(f"Skill execution completed. Output length: {len(output)} characters")
 
         return {
             'output': output,
-            'metadata': {
-                'skill': skill_info.name,
-                'type': 'prompt',
-                'provider': self.llm_provider.__class__.__name__
-            }
+            'metadata': metadata
         }
 
+    def _stream_output(self, chunks: Iterable[str],
+                       on_chunk: Callable[[str], None]) -> Tuple[str, Optional[float]]:
+        """
+        Forward streamed chunks to a callback and assemble the full output.
+
+        Returns:
+            Tuple of (output text, seconds until the first chunk or None)
+        """
+        start = time.monotonic()
+        first_token_latency = None
+        parts = []
+
+        for chunk in chunks:
+            if first_token_latency is None:
+                first_token_latency = round(time.monotonic() - start, 3)
+                self.logger.info(f"First token after {first_token_latency:.2f}s")
+            parts.append(chunk)
+            on_chunk(chunk)
+
+        return ''.join(parts), first_token_latency
+
     def _build_system_prompt(
         self,
         skill_content: str,
@@ -245,6 +512,8 @@ class SkillExecutor:
                 self.logger.error(f"Python skill execution not implemented for: {skill_info.name}")
                 raise NotImplementedError(f"Python skill execution not implemented for: {skill_info.name}")
 
+        except (DeadlineExceeded, OperationCancelled):
+            raise
         except Exception as e:
             self.logger.error(f"Failed to execute Python skill {skill_info.name}: {e}", exc_info=True)
             raise RuntimeError(f"Failed to execute Python skill {skill_info.name}: {e}")
@@ -3,7 +3,7 @@ Skill discovery and loading system.
 """
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
@@ -21,6 +21,7 @@ class SkillInfo:
     has_profile: bool
     python_module: Optional[str] = None
     parent_skill: Optional[str] = None  # For hierarchical display
+    quality: Optional[str] = None  # Quality tier for model routing ("fast", "balanced", "best")
 
 
 class SkillLoader:
@@ -50,39 +51,60 @@ class SkillLoader:
         self.master_briefing_loader = MasterBriefingLoader()
         self.logger = get_logger()
 
-    def discover_skills(self) -> List[SkillInfo]:
-        skills = []
+    def skill_dirs(self) -> List[Tuple[Path, Optional[Path]]]:
+        """
+        Directories that contain a SKILL.md, without parsing them.
+
+        Returns:
+            (skill directory, parent skill directory or None) pairs; a
+            subskill always follows its parent
+        """
+        dirs = []
 
-        for item in self.skills_dir.iterdir():
+        for item in sorted(self.skills_dir.iterdir()):
             if not item.is_dir():
                 continue
 
             if item.name.startswith('.') or item.name == 'cli':
                 continue
 
-            skill_md = item / "SKILL.md"
-            if not skill_md.exists():
+            if not (item / "SKILL.md").exists():
                 continue
 
-            skill_info = self._load_skill_info(item)
+            dirs.append((item, None))
+
+            # Subskills (nested skills within parent skill directory)
+            for subdir in sorted(item.iterdir()):
+                if not subdir.is_dir():
+                    continue
+                if subdir.name.startswith('.') or subdir.name == 'src':
+                    continue
+
+                if (subdir / "SKILL.md").exists():
+                    dirs.append((subdir, item))
+
+        return dirs
+
+    def discover_skills(self) -> List[SkillInfo]:
+        skills = []
+        parents: Dict[Path, SkillInfo] = {}
+
+        for skill_dir, parent_dir in self.skill_dirs():
+            if parent_dir is None:
+                skill_info = self._load_skill_info(skill_dir)
+                if skill_info:
+                    parents[skill_dir] = skill_info
+            else:
+                # Subskills are only listed when their parent skill loads
+                parent = parents.get(parent_dir)
+                if parent is None:
+                    continue
+                skill_info = self._load_skill_info(skill_dir, parent_skill=parent.name)
+
             if skill_info:
                 skills.append(skill_info)
                 self._skill_cache[skill_info.name] = skill_info
 
-                # Discover subskills (nested skills within parent skill directory)
-                for subdir in item.iterdir():
-                    if not subdir.is_dir():
-                        continue
-                    if subdir.name.startswith('.') or subdir.name == 'src':
-                        continue
-
-                    subskill_md = subdir / "SKILL.md"
-                    if subskill_md.exists():
-                        subskill_info = self._load_skill_info(subdir, parent_skill=skill_info.name)
-                        if subskill_info:
-                            skills.append(subskill_info)
-                            self._skill_cache[subskill_info.name] = subskill_info
-
         return sorted(skills, key=lambda s: s.name)
 
     def _load_skill_info(self, skill_path: Path, parent_skill: Optional[str] = None) -> Optional[SkillInfo]:
@@ -113,7 +135,8 @@ class SkillLoader:
                 path=skill_path,
                 has_profile=has_profile,
                 python_module=python_module,
-                parent_skill=parent_skill
+                parent_skill=parent_skill,
+                quality=metadata.get('quality')
             )
 
         except Exception as e:
@@ -187,6 +210,24 @@ class SkillLoader:
             'profile': profile_content
         }
 
+    def prompt_sources(self, skill_name: str) -> List[Path]:
+        """
+        Files a prompt skill's system prompt is built from.
+
+        Optional layers are included even when missing, so that creating
+        one invalidates compiled prompts.
+        """
+        skill_info = self.get_skill(skill_name)
+        if not skill_info:
+            raise ValueError(f"Skill not found: {skill_name}")
+
+        return [
+            skill_info.path / "SKILL.md",
+            self.master_briefing_loader.master_briefing_path,
+            skill_info.path / "PROFILE.md",
+            skill_info.path / "PROFILE.md.template",
+        ]
+
     def list_skills(self, skill_type: Optional[str] = None) -> List[SkillInfo]:
         skills = self.discover_skills()
 
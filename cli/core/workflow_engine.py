@@ -1,17 +1,26 @@
 """
 Workflow execution engine.
 """
+import contextvars
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
 from cli.core.skill_executor import SkillExecutor
+from cli.core.workflow_plan import (
+    WorkflowCompiler,
+    WorkflowPlan,
+    parse_reference,
+    resolve_reference,
+)
 from cli.utils.config import CLIConfig
 from cli.utils.logger import get_logger
 from cli.utils.paths import get_workflows_dir
 from cli.utils.progress import ProgressIndicator
 from cli.utils.validation import WorkflowValidator
+from superskills.core.deadline import Deadline, DeadlineExceeded
 
 
 class WorkflowEngine:
@@ -22,25 +31,34 @@ class WorkflowEngine:
         self.logger = get_logger()
         self.progress = ProgressIndicator(show_progress=show_progress)
         self.validator = WorkflowValidator()
+        self.compiler = WorkflowCompiler(
+            cache_dir=config.cache_dir / "workflow_plans",
+            validator=self.validator
+        )
 
-    def load_workflow(self, workflow_name: str) -> Dict[str, Any]:
-        self.logger.info(f"Loading workflow: {workflow_name}")
+    def load_plan(self, workflow_name: str) -> WorkflowPlan:
+        """
+        Load the compiled plan for a workflow.
+
+        Validation and parsing only happen when the workflow file changed since
+        it was last compiled; otherwise the cached plan is returned.
+        """
         workflow_file = self._find_workflow_file(workflow_name)
 
         if not workflow_file:
             self.logger.error(f"Workflow not found: {workflow_name}")
             raise FileNotFoundError(f"Workflow not found: {workflow_name}")
 
-        # Validate workflow before loading
-        self.logger.debug(f"Validating workflow: {workflow_file}")
-        is_valid, errors = self.validator.validate_workflow(workflow_file)
-        if not is_valid:
-            error_msg = "Workflow validation failed:\n  " + "\n  ".join(errors)
-            self.logger.error(error_msg)
-            raise ValueError(error_msg)
+        plan = self.compiler.compile(workflow_file)
+        self.logger.debug(f"Workflow plan ready: {plan.name or workflow_name} ({plan.file_hash[:12]})")
+        return plan
 
-        self.logger.debug(f"Reading workflow from: {workflow_file}")
-        with open(workflow_file, 'r') as f:
+    def load_workflow(self, workflow_name: str) -> Dict[str, Any]:
+        self.logger.info(f"Loading workflow: {workflow_name}")
+        plan = self.load_plan(workflow_name)
+
+        self.logger.debug(f"Reading workflow from: {plan.source}")
+        with open(plan.source, 'r') as f:
             workflow = yaml.safe_load(f)
 
         self.logger.info(f"Workflow loaded: {workflow.get('name', workflow_name)} with {len(workflow.get('steps', []))} steps")
@@ -66,46 +84,77 @@ class WorkflowEngine:
 
     def execute(self, workflow_name: str, variables: Optional[Dict[str, Any]] = None, dry_run: bool = False) -> Dict[str, Any]:
         self.logger.info(f"Starting workflow execution: {workflow_name} (dry_run={dry_run})")
-        workflow = self.load_workflow(workflow_name)
+        plan = self.load_plan(workflow_name)
+        return self.execute_plan(plan, variables, dry_run=dry_run, workflow_name=workflow_name)
+
+    def execute_plan(self, plan: WorkflowPlan, variables: Optional[Dict[str, Any]] = None,
+                     dry_run: bool = False, workflow_name: Optional[str] = None,
+                     deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """
+        Execute an already compiled workflow plan.
+
+        Args:
+            plan: Compiled workflow plan
+            variables: Runtime variables (input, topic, ...)
+            dry_run: Show what would happen without executing skills
+            workflow_name: Name used in results and progress output
+            deadline: Enclosing deadline; the workflow timeout (plan `timeout`
+                or workflows.timeout config) is applied on top of it
+
+        Returns:
+            Execution result dictionary
+
+        Raises:
+            DeadlineExceeded: If the workflow or one of its steps timed out
+        """
+        workflow_name = workflow_name or plan.name
 
         if variables:
             self.logger.debug(f"Received variables: {list(variables.keys())}")
             self.context.update(variables)
 
-        if 'variables' in workflow:
-            for key, value in workflow['variables'].items():
-                if key not in self.context:
-                    resolved_value = self._resolve_variable(value)
-                    self.context[key] = resolved_value
-                    self.logger.debug(f"Set workflow variable: {key} = {resolved_value}")
+        for variable in plan.variables:
+            if variable.name not in self.context:
+                resolved_value = self._resolve_compiled(variable.value, variable.ref)
+                self.context[variable.name] = resolved_value
+                self.logger.debug(f"Set workflow variable: {variable.name} ({len(str(resolved_value))} characters)")
 
         # If dry-run, just show what would happen
         if dry_run:
-            return self._dry_run_workflow(workflow_name, workflow)
+            return self._dry_run_workflow(workflow_name, plan)
+
+        # Load skill content, provider clients and skill modules up front so
+        # step 1 doesn't pay cold-start costs on the critical path
+        if self.config.get('workflows.prewarm', True):
+            self.executor.warm_up(plan.skills)
+
+        workflow_timeout = plan.timeout or self.config.get('workflows.timeout')
+        workflow_deadline = Deadline(workflow_timeout, parent=deadline)
+        default_step_timeout = self.config.get('workflows.step_timeout')
 
         results = {}
-        total_steps = len(workflow.get('steps', []))
+        total_steps = len(plan.steps)
 
         with self.progress.create_workflow_progress(total_steps, f"Workflow: {workflow_name}") as prog:
-            for idx, step in enumerate(workflow.get('steps', []), 1):
-                step_name = step.get('name')
-                skill_name = step.get('skill')
-
-                self.logger.info(f"Step {idx}/{total_steps}: {step_name} (skill: {skill_name})")
-                prog.update(idx - 1, f"Step {idx}/{total_steps}: {step_name}")
+            for step in plan.steps:
+                idx = step.index
 
-                input_text = self._resolve_variable(step.get('input', ''))
-                self.logger.debug(f"Resolved input for step {step_name}: {len(input_text)} characters")
+                self.logger.info(f"Step {idx}/{total_steps}: {step.name} (skill: {step.skill})")
+                prog.update(idx - 1, f"Step {idx}/{total_steps}: {step.name}")
 
-                step_config = step.get('config', {})
+                input_text = self._resolve_compiled(step.input, step.input_ref)
+                self.logger.debug(f"Resolved input for step {step.name}: {len(input_text)} characters")
 
-                result = self.executor.execute(skill_name, input_text, **step_config)
+                step_deadline = workflow_deadline.child(step.timeout or default_step_timeout)
+                if step.stream_to:
+                    result = self._execute_streamed_step(plan, step, input_text, step_deadline)
+                else:
+                    result = self._execute_step(step, input_text, step_deadline)
 
-                output_var = step.get('output')
-                if output_var:
-                    self.context[output_var] = result['output']
-                    results[step_name] = result
-                    self.logger.debug(f"Stored output in variable: {output_var}")
+                if step.output:
+                    self.context[step.output] = result['output']
+                    results[step.name] = result
+                    self.logger.debug(f"Stored output in variable: {step.output}")
 
             prog.update(total_steps, "Workflow completed")
 
@@ -114,33 +163,83 @@ class WorkflowEngine:
         return {
             'workflow': workflow_name,
             'steps': results,
-            'final_output': self.context.get(workflow.get('steps', [])[-1].get('output')) if workflow.get('steps') else None
+            'final_output': self.context.get(plan.final_output) if plan.steps else None
         }
 
-    def _resolve_variable(self, value: Any) -> Any:
-        if not isinstance(value, str):
-            return value
+    def _execute_streamed_step(self, plan: WorkflowPlan, step, input_text: str,
+                               deadline: Deadline) -> Dict[str, Any]:
+        """
+        Execute a step while writing its output to `stream_to` as it arrives.
 
-        if not value.startswith('${') or not value.endswith('}'):
-            return value
+        Relative paths resolve against the workflow file's directory. Skills
+        that don't stream have their full output written once they finish.
+        """
+        base_dir = Path(plan.source).parent if plan.source else Path.cwd()
+        stream_path = base_dir / step.stream_to
+        stream_path.parent.mkdir(parents=True, exist_ok=True)
 
-        var_name = value[2:-1]
+        with open(stream_path, 'w', encoding='utf-8') as f:
+            def write_chunk(chunk: str):
+                f.write(chunk)
+                f.flush()
 
-        if '.' in var_name:
-            parts = var_name.split('.')
-            current = self.context
+            result = self._execute_step(step, input_text, deadline, on_chunk=write_chunk)
+            if f.tell() == 0:
+                f.write(str(result['output']))
 
-            for part in parts:
-                if isinstance(current, dict):
-                    current = current.get(part)
-                else:
-                    return value
+        self.logger.debug(f"Streamed output of step {step.name} to: {stream_path}")
+        return result
+
+    def _execute_step(self, step, input_text: str, deadline: Deadline, **options) -> Dict[str, Any]:
+        """
+        Execute one step, abandoning it when its deadline passes.
+
+        Bounded steps run on a worker thread so the workflow can give up on
+        them even if a skill ignores its deadline; the deadline is cancelled so
+        cooperative code (provider retries, subprocesses) stops promptly.
+        """
+        options.update(step.config)
+
+        if deadline.expires_at is None:
+            return self.executor.execute(step.skill, input_text, deadline=deadline, **options)
+
+        outcome: Dict[str, Any] = {}
+        context = contextvars.copy_context()
+
+        def run_step():
+            try:
+                outcome['result'] = context.run(
+                    self.executor.execute, step.skill, input_text, deadline=deadline, **options
+                )
+            except BaseException as e:
+                outcome['error'] = e
+
+        worker = threading.Thread(target=run_step, name=f"superskills-step-{step.name}", daemon=True)
+        worker.start()
+
+        try:
+            worker.join(deadline.remaining())
+        except KeyboardInterrupt:
+            deadline.cancel()
+            raise
+
+        if worker.is_alive():
+            deadline.cancel()
+            self.logger.error(f"Step '{step.name}' timed out")
+            raise DeadlineExceeded(f"Step '{step.name}' (skill: {step.skill}) exceeded its timeout")
+
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome['result']
 
-            return current if current is not None else value
+    def _resolve_compiled(self, value: Any, ref: Optional[Tuple[str, ...]]) -> Any:
+        """Resolve a value whose variable reference was parsed at compile time."""
+        return resolve_reference(self.context, value, ref)
 
-        return self.context.get(var_name, value)
+    def _resolve_variable(self, value: Any) -> Any:
+        return self._resolve_compiled(value, parse_reference(value))
 
-    def _dry_run_workflow(self, workflow_name: str, workflow: Dict[str, Any]) -> Dict[str, Any]:
+    def _dry_run_workflow(self, workflow_name: str, plan: WorkflowPlan) -> Dict[str, Any]:
         """
         Perform a dry-run of the workflow without executing skills.
 
@@ -150,11 +249,11 @@ class WorkflowEngine:
         print(f"DRY RUN: Workflow '{workflow_name}'")
         print(f"{'='*60}\n")
 
-        print(f"Description: {workflow.get('description', 'No description')}")
-        print(f"Total steps: {len(workflow.get('steps', []))}\n")
+        print(f"Description: {plan.description}")
+        print(f"Total steps: {len(plan.steps)}\n")
 
         # Show variables
-        if 'variables' in workflow or self.context:
+        if plan.variables or self.context:
             print("Variables:")
             for key, value in self.context.items():
                 value_preview = str(value)[:100] + '...' if len(str(value)) > 100 else str(value)
@@ -167,26 +266,30 @@ class WorkflowEngine:
 
         total_tokens_estimate = 0
 
-        for idx, step in enumerate(workflow.get('steps', []), 1):
-            step_name = step.get('name')
-            skill_name = step.get('skill')
-            input_template = step.get('input', '')
-            output_var = step.get('output', 'None')
+        for step in plan.steps:
+            idx = step.index
+            step_name = step.name
+            skill_name = step.skill
+            input_template = step.input
+            output_var = step.output or 'None'
 
             # Resolve input to show what would be used
             try:
-                resolved_input = self._resolve_variable(input_template)
+                resolved_input = self._resolve_compiled(input_template, step.input_ref)
             except Exception:
                 # If variable resolution fails, use template as-is for display
                 resolved_input = input_template
 
             input_length = len(resolved_input)
+            prompt_tokens = self._system_prompt_tokens(skill_name)
             # Rough token estimate (1 token ≈ 4 characters)
-            estimated_tokens = input_length // 4 + 1000  # +1000 for output
+            estimated_tokens = input_length // 4 + prompt_tokens + 1000  # +1000 for output
             total_tokens_estimate += estimated_tokens
 
             print(f"\nStep {idx}: {step_name}")
             print(f"  Skill: {skill_name}")
+            if prompt_tokens:
+                print(f"  System prompt: ~{prompt_tokens} tokens")
             print(f"  Input: {input_length} characters (~{input_length//4} tokens)")
 
             if len(resolved_input) > 200:
@@ -219,11 +322,21 @@ class WorkflowEngine:
         return {
             'workflow': workflow_name,
             'dry_run': True,
-            'total_steps': len(workflow.get('steps', [])),
+            'total_steps': len(plan.steps),
             'estimated_tokens': total_tokens_estimate,
             'estimated_cost': estimated_cost
         }
 
+    def _system_prompt_tokens(self, skill_name: str) -> int:
+        """Estimated system prompt tokens for a prompt skill (0 otherwise)."""
+        try:
+            skill_info = self.executor.loader.get_skill(skill_name)
+            if skill_info and skill_info.skill_type == 'prompt':
+                return self.executor.compile_prompt(skill_info).tokens
+        except Exception as e:
+            self.logger.debug(f"Could not compile prompt for {skill_name}: {e}")
+        return 0
+
     def list_workflows(self) -> List[Dict[str, str]]:
         workflows = []
 
@@ -288,9 +401,9 @@ class WorkflowEngine:
 
         self.logger.info(f"Starting watch mode for workflow: {workflow_name}")
 
-        # Load workflow to get io configuration
-        workflow = self.load_workflow(workflow_name)
-        io_config = workflow.get('io', {})
+        # Compile workflow once; every processed file reuses the same plan
+        plan = self.load_plan(workflow_name)
+        io_config = plan.io
 
         if not io_config or 'input_dir' not in io_config:
             print("Error: Workflow does not have io.input_dir configured")
@@ -298,12 +411,7 @@ class WorkflowEngine:
             return 1
 
         # Resolve input directory (relative to workflow file location)
-        workflow_file = self._find_workflow_file(workflow_name)
-        if not workflow_file:
-            print(f"Error: Could not find workflow file for {workflow_name}")
-            return 1
-
-        workflow_dir = workflow_file.parent
+        workflow_dir = Path(plan.source).parent
         input_dir = workflow_dir / io_config['input_dir']
 
         if not input_dir.exists():
@@ -353,7 +461,7 @@ class WorkflowEngine:
                             'filename': file_path.stem
                         }
 
-                        self.execute(workflow_name, variables, dry_run=False)
+                        self.execute_plan(plan, variables, workflow_name=workflow_name)
 
                         print(f"\n✓ Successfully processed: {file_path.name}")
                         processed_files.add(str(file_path))
@@ -368,21 +476,24 @@ class WorkflowEngine:
             print("\n\nWatch mode stopped")
             return 0
 
-    def batch_execute(self, workflow_name: str) -> int:
+    def batch_execute(self, workflow_name: str, deferred: bool = False) -> int:
         """
         Process all files in workflow input directory.
 
         Args:
             workflow_name: Name of the workflow to execute
+            deferred: Submit prompt-skill calls through the provider's batch
+                API (cheaper, but results can take hours) instead of calling
+                the synchronous API file by file
 
         Returns:
             Exit code (0 for success, 1 for errors)
         """
         self.logger.info(f"Starting batch execution for workflow: {workflow_name}")
 
-        # Load workflow to get io configuration
-        workflow = self.load_workflow(workflow_name)
-        io_config = workflow.get('io', {})
+        # Compile workflow once; every processed file reuses the same plan
+        plan = self.load_plan(workflow_name)
+        io_config = plan.io
 
         if not io_config or 'input_dir' not in io_config:
             print("Error: Workflow does not have io.input_dir configured")
@@ -390,12 +501,7 @@ class WorkflowEngine:
             return 1
 
         # Resolve input directory
-        workflow_file = self._find_workflow_file(workflow_name)
-        if not workflow_file:
-            print(f"Error: Could not find workflow file for {workflow_name}")
-            return 1
-
-        workflow_dir = workflow_file.parent
+        workflow_dir = Path(plan.source).parent
         input_dir = workflow_dir / io_config['input_dir']
 
         if not input_dir.exists():
@@ -414,6 +520,9 @@ class WorkflowEngine:
 
         print(f"Found {len(files_to_process)} file(s) to process\n")
 
+        if deferred:
+            return self._deferred_batch_execute(plan, files_to_process)
+
         success_count = 0
         error_count = 0
 
@@ -434,7 +543,7 @@ class WorkflowEngine:
                     'filename': file_path.stem
                 }
 
-                self.execute(workflow_name, variables, dry_run=False)
+                self.execute_plan(plan, variables, workflow_name=workflow_name)
 
                 print(f"\n✓ Successfully processed: {file_path.name}")
                 success_count += 1
@@ -452,3 +561,48 @@ class WorkflowEngine:
         print(f"  Total:   {len(files_to_process)}\n")
 
         return 0 if error_count == 0 else 1
+
+    def _deferred_batch_execute(self, plan: WorkflowPlan, files_to_process: List[Path]) -> int:
+        """Run batch mode step by step through provider batch jobs."""
+        from cli.core.deferred_runner import DeferredRunner
+
+        inputs = {}
+        read_errors = {}
+        for file_path in files_to_process:
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                inputs[file_path.name] = {
+                    'input': content,
+                    'input_file': content,
+                    'filename': file_path.stem
+                }
+            except Exception as e:
+                read_errors[file_path.name] = str(e)
+
+        print("Deferred mode: submitting prompt steps as provider batch jobs (this can take a while)\n")
+        results = DeferredRunner(self.executor, self.config).run(plan, inputs)
+
+        success_count = 0
+        error_count = len(read_errors)
+
+        for name, error in read_errors.items():
+            print(f"✗ Error processing {name}: {error}")
+
+        for name, result in results.items():
+            if 'error' in result:
+                print(f"✗ Error processing {name}: {result['error']}")
+                self.logger.error(f"Deferred processing of {name} failed: {result['error']}")
+                error_count += 1
+            else:
+                print(f"✓ Successfully processed: {name}")
+                success_count += 1
+
+        print(f"\n{'='*60}")
+        print("Deferred batch processing completed")
+        print(f"{'='*60}")
+        print(f"  Success: {success_count}")
+        print(f"  Errors:  {error_count}")
+        print(f"  Total:   {len(files_to_process)}\n")
+
+        return 0 if error_count == 0 else 1
@@ -0,0 +1,382 @@
+"""
+Workflow compilation into immutable, cached execution plans.
+
+A workflow YAML file is validated and parsed once into a WorkflowPlan. Plans are
+cached in memory and on disk (~/.superskills/cache/workflow_plans), keyed by the
+SHA256 of the workflow file, so repeated executions (batch and watch mode) skip
+YAML parsing and validation entirely. Files with the same content share a plan;
+each lookup returns it with `source` set to the file asked for.
+"""
+import hashlib
+import json
+import re
+from dataclasses import dataclass, replace
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import yaml
+
+from cli.utils.logger import get_logger
+
+# Bump when the serialized plan layout changes to invalidate disk caches
+PLAN_FORMAT_VERSION = 4
+
+# Any name is allowed inside ${...} (e.g. ${step-1.output}), as before plans
+_EXACT_REF_PATTERN = re.compile(r'^\$\{([^}]+)\}$')
+_REF_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+
+def parse_reference(value: Any) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a value that is exactly one variable reference into its accessor path.
+
+    Args:
+        value: Raw value from the workflow definition
+
+    Returns:
+        Tuple of path segments (e.g. ('research', 'summary')) or None if the
+        value is not a single ${...} reference
+    """
+    if not isinstance(value, str):
+        return None
+
+    match = _EXACT_REF_PATTERN.match(value)
+    if not match:
+        return None
+
+    return tuple(match.group(1).split('.'))
+
+
+def resolve_reference(context: Mapping[str, Any], value: Any, ref: Optional[Tuple[str, ...]]) -> Any:
+    """
+    Resolve a pre-parsed reference against a workflow context.
+
+    Args:
+        context: Variables and step outputs
+        value: Original value (returned when the reference can't be resolved)
+        ref: Accessor path from parse_reference(), or None for literal values
+
+    Returns:
+        Resolved value
+    """
+    if ref is None:
+        return value
+
+    if len(ref) == 1:
+        return context.get(ref[0], value)
+
+    current = context
+    for part in ref:
+        if isinstance(current, dict):
+            current = current.get(part)
+        else:
+            return value
+
+    return current if current is not None else value
+
+
+def referenced_variables(value: Any) -> Tuple[str, ...]:
+    """Return the base variable names referenced anywhere in a value."""
+    if not isinstance(value, str):
+        return ()
+
+    return tuple(dict.fromkeys(m.split('.')[0] for m in _REF_PATTERN.findall(value)))
+
+
+@dataclass(frozen=True)
+class CompiledVariable:
+    """A workflow-level variable with its reference pre-parsed."""
+    name: str
+    value: Any
+    ref: Optional[Tuple[str, ...]] = None
+
+
+@dataclass(frozen=True)
+class CompiledStep:
+    """A single validated workflow step."""
+    index: int
+    name: str
+    skill: str
+    input: str
+    input_ref: Optional[Tuple[str, ...]]
+    output: Optional[str]
+    config: Mapping[str, Any]
+    depends_on: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    stream_to: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class WorkflowPlan:
+    """Immutable, validated representation of a workflow definition."""
+    name: str
+    description: str
+    source: str
+    file_hash: str
+    variables: Tuple[CompiledVariable, ...]
+    io: Mapping[str, Any]
+    steps: Tuple[CompiledStep, ...]
+    timeout: Optional[float] = None
+
+    @property
+    def skills(self) -> Tuple[str, ...]:
+        """Unique skill names used by the plan, in step order."""
+        return tuple(dict.fromkeys(step.skill for step in self.steps))
+
+    @property
+    def final_output(self) -> Optional[str]:
+        """Output variable of the last step."""
+        return self.steps[-1].output if self.steps else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            'format_version': PLAN_FORMAT_VERSION,
+            'name': self.name,
+            'description': self.description,
+            'source': self.source,
+            'file_hash': self.file_hash,
+            'variables': [
+                {'name': v.name, 'value': v.value, 'ref': list(v.ref) if v.ref else None}
+                for v in self.variables
+            ],
+            'io': dict(self.io),
+            'timeout': self.timeout,
+            'steps': [
+                {
+                    'index': s.index,
+                    'name': s.name,
+                    'skill': s.skill,
+                    'input': s.input,
+                    'input_ref': list(s.input_ref) if s.input_ref else None,
+                    'output': s.output,
+                    'config': dict(s.config),
+                    'depends_on': list(s.depends_on),
+                    'timeout': s.timeout,
+                    'stream_to': s.stream_to,
+                }
+                for s in self.steps
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'WorkflowPlan':
+        """Rebuild a plan from its serialized form."""
+        if data.get('format_version') != PLAN_FORMAT_VERSION:
+            raise ValueError(f"Unsupported plan format: {data.get('format_version')}")
+
+        return cls(
+            name=data['name'],
+            description=data['description'],
+            source=data['source'],
+            file_hash=data['file_hash'],
+            variables=tuple(
+                CompiledVariable(
+                    name=v['name'],
+                    value=v['value'],
+                    ref=tuple(v['ref']) if v['ref'] else None
+                )
+                for v in data['variables']
+            ),
+            io=MappingProxyType(dict(data['io'])),
+            steps=tuple(
+                CompiledStep(
+                    index=s['index'],
+                    name=s['name'],
+                    skill=s['skill'],
+                    input=s['input'],
+                    input_ref=tuple(s['input_ref']) if s['input_ref'] else None,
+                    output=s['output'],
+                    config=MappingProxyType(dict(s['config'])),
+                    depends_on=tuple(s['depends_on']),
+                    timeout=s.get('timeout'),
+                    stream_to=s.get('stream_to'),
+                )
+                for s in data['steps']
+            ),
+            timeout=data.get('timeout'),
+        )
+
+
+class WorkflowCompiler:
+    """
+    Compile workflow files into cached WorkflowPlan objects.
+
+    The in-memory caches are shared by all compiler instances in the process, so
+    every WorkflowEngine reuses plans compiled by any other.
+    """
+
+    # file hash -> compiled plan
+    _plans: Dict[str, WorkflowPlan] = {}
+    # path -> (mtime_ns, size, file hash), avoids re-hashing unchanged files
+    _hashes: Dict[str, Tuple[int, int, str]] = {}
+
+    def __init__(self, cache_dir: Optional[Path] = None, validator=None):
+        """
+        Initialize workflow compiler.
+
+        Args:
+            cache_dir: Directory for on-disk plan cache (None disables disk caching)
+            validator: WorkflowValidator instance (created lazily on first cache miss)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._validator = validator
+        self.logger = get_logger()
+
+    @property
+    def validator(self):
+        if self._validator is None:
+            from cli.utils.validation import WorkflowValidator
+            self._validator = WorkflowValidator()
+        return self._validator
+
+    def compile(self, workflow_file: Path) -> WorkflowPlan:
+        """
+        Compile a workflow file, using cached plans when the file is unchanged.
+
+        Args:
+            workflow_file: Path to workflow YAML file
+
+        Returns:
+            Validated WorkflowPlan
+
+        Raises:
+            ValueError: If the workflow fails validation
+        """
+        workflow_file = Path(workflow_file)
+        file_hash = self._file_hash(workflow_file)
+
+        plan = self._plans.get(file_hash)
+        if plan is None:
+            plan = self._load_from_disk(file_hash)
+            if plan is None:
+                plan = self._compile_file(workflow_file, file_hash)
+                self._save_to_disk(plan)
+            self._plans[file_hash] = plan
+
+        # Plans are shared by content; the source is whichever file this is
+        if plan.source != str(workflow_file):
+            plan = replace(plan, source=str(workflow_file))
+        return plan
+
+    def _file_hash(self, workflow_file: Path) -> str:
+        stat = workflow_file.stat()
+        path = str(workflow_file)
+
+        cached = self._hashes.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        file_hash = hashlib.sha256(workflow_file.read_bytes()).hexdigest()
+        # One entry per path: a changed file replaces its old hash
+        self._hashes[path] = (stat.st_mtime_ns, stat.st_size, file_hash)
+        return file_hash
+
+    def _compile_file(self, workflow_file: Path, file_hash: str) -> WorkflowPlan:
+        self.logger.debug(f"Validating workflow: {workflow_file}")
+        is_valid, errors = self.validator.validate_workflow(workflow_file)
+        if not is_valid:
+            error_msg = "Workflow validation failed:\n  " + "\n  ".join(errors)
+            self.logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        self.logger.debug(f"Compiling workflow from: {workflow_file}")
+        with open(workflow_file, 'r') as f:
+            workflow = yaml.safe_load(f)
+
+        return compile_workflow(workflow, source=str(workflow_file), file_hash=file_hash)
+
+    def _plan_cache_file(self, file_hash: str) -> Optional[Path]:
+        if not self.cache_dir:
+            return None
+        return self.cache_dir / f"{file_hash}.json"
+
+    def _load_from_disk(self, file_hash: str) -> Optional[WorkflowPlan]:
+        cache_file = self._plan_cache_file(file_hash)
+        if not cache_file or not cache_file.exists():
+            return None
+
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                plan = WorkflowPlan.from_dict(json.load(f))
+            self.logger.debug(f"Loaded compiled workflow plan from cache: {cache_file}")
+            return plan
+        except Exception as e:
+            self.logger.debug(f"Ignoring unreadable plan cache {cache_file}: {e}")
+            return None
+
+    def _save_to_disk(self, plan: WorkflowPlan) -> None:
+        cache_file = self._plan_cache_file(plan.file_hash)
+        if not cache_file:
+            return
+
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(plan.to_dict(), f)
+            tmp_file.replace(cache_file)
+        except Exception as e:
+            self.logger.debug(f"Could not write plan cache {cache_file}: {e}")
+
+    @classmethod
+    def clear_cache(cls):
+        """Clear the in-memory plan caches."""
+        cls._plans.clear()
+        cls._hashes.clear()
+
+
+def compile_workflow(workflow: Dict[str, Any], source: str = '', file_hash: str = '') -> WorkflowPlan:
+    """
+    Compile an already-validated workflow dictionary into a WorkflowPlan.
+
+    Args:
+        workflow: Parsed workflow definition
+        source: Path of the workflow file (informational)
+        file_hash: SHA256 of the workflow file
+
+    Returns:
+        WorkflowPlan
+    """
+    variables = tuple(
+        CompiledVariable(name=key, value=value, ref=parse_reference(value))
+        for key, value in (workflow.get('variables') or {}).items()
+    )
+
+    # Map output variable -> producing step so dependencies resolve to step names
+    producers: Dict[str, str] = {}
+    steps = []
+
+    for idx, step in enumerate(workflow.get('steps', []), 1):
+        input_value = step.get('input', '')
+        depends_on = tuple(
+            producers[var] for var in referenced_variables(input_value) if var in producers
+        )
+
+        steps.append(CompiledStep(
+            index=idx,
+            name=step.get('name'),
+            skill=step.get('skill'),
+            input=input_value,
+            input_ref=parse_reference(input_value),
+            output=step.get('output'),
+            config=MappingProxyType(dict(step.get('config') or {})),
+            depends_on=tuple(dict.fromkeys(depends_on)),
+            timeout=step.get('timeout'),
+            stream_to=step.get('stream_to'),
+        ))
+
+        if step.get('output'):
+            producers[step['output']] = step.get('name')
+
+    return WorkflowPlan(
+        name=workflow.get('name', ''),
+        description=workflow.get('description', 'No description'),
+        source=source,
+        file_hash=file_hash,
+        variables=variables,
+        io=MappingProxyType(dict(workflow.get('io') or {})),
+        steps=tuple(steps),
+        timeout=workflow.get('timeout'),
+    )
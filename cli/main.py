@@ -27,7 +27,8 @@ from .commands.status import status_command
 from .commands.test import test_command
 from .commands.validate import validate_command
 from .commands.workflow import workflow_list_command, workflow_validate_command
-from .utils.logger import get_logger
+from .utils.config import CLIConfig
+from .utils.logger import configure_logging, get_logger
 from .utils.paths import get_project_root
 from .utils.version import get_version as _get_version
 
@@ -71,7 +72,6 @@ def _handle_natural_language(user_input: str, args) -> int:
 
     from .core.intent_parser import IntentParser
     from .core.intent_router import IntentRouter
-    from .utils.config import CLIConfig
 
     config = CLIConfig()
     logger = get_logger()
@@ -198,9 +198,13 @@ def main():
     call_parser.add_argument('skill', help='Skill name')
     call_parser.add_argument('input', nargs='?', help='Input text')
     call_parser.add_argument('--input', dest='input_file', help='Input file path')
-    call_parser.add_argument('--output', help='Output file path')
+    call_parser.add_argument('--output', '--out', dest='output', help='Output file path')
     call_parser.add_argument('--format', choices=['json', 'yaml', 'markdown', 'plain'],
                             default='markdown', help='Output format (default: markdown)')
+    call_parser.add_argument('--batch', metavar='INPUTS_JSONL',
+                            help='Run the skill over every line of a JSONL file; results go to --out as JSONL')
+    call_parser.add_argument('--jobs', '-j', type=int, default=4,
+                            help='Concurrent skill calls in --batch mode (default: 4)')
     call_parser.add_argument('--content-type',
                             choices=['podcast', 'educational', 'marketing', 'social', 'meditation'],
                             help='Content type for narrator skill (podcast/educational/marketing/social/meditation)')
@@ -227,6 +231,8 @@ def main():
     call_parser.add_argument('--no-save',
                             action='store_true',
                             help='Print output only without saving to file')
+    call_parser.add_argument('--stream', action=argparse.BooleanOptionalAction, default=None,
+                            help='Print output as it is generated (default: on when stdout is a terminal)')
 
     run_parser = subparsers.add_parser('run', help='Execute a workflow')
     run_parser.add_argument('workflow', help='Workflow name')
@@ -239,6 +245,8 @@ def main():
                            help='Watch workflow input folder and auto-process new files')
     run_parser.add_argument('--batch', action='store_true',
                            help='Process all files in workflow input folder')
+    run_parser.add_argument('--deferred', action='store_true',
+                           help='With --batch: use the provider batch API (cheaper, results can take hours)')
     run_parser.add_argument('--interval', type=int, default=1,
                            help='Watch interval in seconds (default: 1)')
     run_parser.add_argument('--format', choices=['json', 'yaml', 'markdown', 'plain'],
@@ -314,6 +322,9 @@ def main():
     export_migrate_parser.add_argument('--output', '-o', help='Output file path')
     export_migrate_parser.add_argument('--include-api-keys', action='store_true',
                                        help='Include API keys in export (use with caution)')
+    export_migrate_parser.add_argument('--incremental', nargs='?', const=True, metavar='BASE',
+                                       help='Only pack files changed since the last export '
+                                            '(or since the given package/manifest)')
     
     import_migrate_parser = migrate_subparsers.add_parser('import', help='Import migration package')
     import_migrate_parser.add_argument('input', help='Migration ZIP file path')
@@ -342,6 +353,14 @@ def main():
 
     logger = get_logger(verbose=args.verbose)
 
+    # Apply logging settings without creating a config file on first run
+    config = CLIConfig()
+    if config.config_file.exists():
+        configure_logging(
+            log_format=config.get('logging.format'),
+            debug_sample_rate=config.get('logging.debug_sample_rate')
+        )
+
     # Define known commands for auto-detection
     KNOWN_COMMANDS = {
         'init', 'list', 'show', 'call', 'run',
@@ -412,6 +431,11 @@ def main():
                 kwargs['skip_quota_check'] = True
             if hasattr(args, 'no_save') and args.no_save:
                 kwargs['no_save'] = True
+            if getattr(args, 'stream', None) is not None:
+                kwargs['stream'] = args.stream
+            if getattr(args, 'batch', None):
+                kwargs['batch'] = args.batch
+                kwargs['jobs'] = args.jobs
 
             return call_command(args.skill, args.input, **kwargs)
 
@@ -429,6 +453,8 @@ def main():
                 kwargs['watch'] = True
             if hasattr(args, 'batch') and args.batch:
                 kwargs['batch'] = True
+            if hasattr(args, 'deferred') and args.deferred:
+                kwargs['deferred'] = True
             if hasattr(args, 'interval') and args.interval:
                 kwargs['interval'] = args.interval
             if hasattr(args, 'format') and args.format:
@@ -532,6 +558,8 @@ def main():
                     kwargs['output'] = args.output
                 if hasattr(args, 'include_api_keys') and args.include_api_keys:
                     kwargs['include_api_keys'] = True
+                if getattr(args, 'incremental', None):
+                    kwargs['incremental'] = args.incremental
             elif args.migrate_action == 'import':
                 kwargs['input'] = args.input
                 if hasattr(args, 'dry_run') and args.dry_run:
@@ -84,7 +84,12 @@ class CLIConfig:
                 'provider': 'gemini',
                 'model': 'gemini-flash-latest',
                 'max_tokens': 4000,
-                'temperature': 0.7
+                'temperature': 0.7,
+                'routing': False,
+                'pool': {
+                    'max_connections': 10,
+                    'idle_timeout': 60
+                }
             },
             'intent': {
                 'enabled': True,
@@ -101,7 +106,9 @@ class CLIConfig:
                     '.'
                 ],
                 'use_ripgrep': True,
-                'max_results': 50
+                'max_results': 50,
+                'index_max_age': 30,
+                'max_file_size': 10 * 1024 * 1024
             },
             'output': {
                 'default_format': 'markdown',
@@ -109,9 +116,20 @@ class CLIConfig:
                 'auto_save': True,
                 'directory': './output'
             },
+            'logging': {
+                'format': 'text',
+                'debug_sample_rate': 1.0
+            },
             'workflows': {
                 'auto_save': True,
-                'show_progress': True
+                'show_progress': True,
+                'prewarm': True,
+                'timeout': None,
+                'step_timeout': None,
+                'deferred': {
+                    'poll_interval': 30,
+                    'max_wait': 86400
+                }
             }
         }
 
@@ -2,25 +2,305 @@
 Unified LLM client for intent parsing.
 Supports multiple providers: Gemini, Anthropic, OpenAI
 """
+import asyncio
+import contextvars
+import hashlib
+import json
 import os
+import sys
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
 
+import anthropic
+import httpx
+import openai
 from anthropic import Anthropic, APIConnectionError, APIError, AuthenticationError, RateLimitError
 from google import genai
 from openai import APIError as OpenAIAPIError
 from openai import OpenAI
 
+from superskills.core.deadline import Deadline, DeadlineExceeded, current_deadline
+
+# Normalized provider batch job states
+BATCH_PENDING = 'pending'
+BATCH_COMPLETED = 'completed'
+BATCH_FAILED = 'failed'
+
+
+@dataclass
+class BatchRequest:
+    """A single prompt in a provider batch job."""
+    custom_id: str
+    system_prompt: str
+    user_prompt: str
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one batch request: output text or an error message."""
+    custom_id: str
+    output: Optional[str] = None
+    error: Optional[str] = None
+
+
+class ClientPool:
+    """
+    Process-wide pool of provider SDK clients.
+
+    Each SDK client owns an HTTP connection pool. Sharing one client per
+    provider and credential lets every executor, the intent parser and
+    parallel workers in the same process reuse open TLS connections instead
+    of each provider instance opening its own. SDK clients are thread-safe;
+    the pool itself is guarded by a lock.
+
+    The model is a per-request parameter, so providers for different models
+    of the same API share a client.
+    """
+
+    max_connections: int = 10
+    idle_timeout: float = 60.0
+
+    _clients: Dict[Tuple[str, str], Any] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def configure(cls, max_connections: Optional[int] = None, idle_timeout: Optional[float] = None) -> None:
+        """
+        Set connection limits for clients created from now on.
+
+        Args:
+            max_connections: Maximum open connections per client
+            idle_timeout: Seconds an idle connection is kept alive for reuse
+        """
+        with cls._lock:
+            if isinstance(max_connections, int) and max_connections > 0:
+                cls.max_connections = max_connections
+            if isinstance(idle_timeout, (int, float)) and idle_timeout >= 0:
+                cls.idle_timeout = float(idle_timeout)
+
+    @classmethod
+    def limits(cls, limits_class: type = httpx.Limits) -> Any:
+        """
+        Connection limits for a new client.
+
+        Args:
+            limits_class: Limits type of the HTTP library the SDK is built on
+        """
+        return limits_class(
+            max_connections=cls.max_connections,
+            max_keepalive_connections=cls.max_connections,
+            keepalive_expiry=cls.idle_timeout
+        )
+
+    @classmethod
+    def sdk_http_client(cls, sdk: Any) -> Any:
+        """
+        HTTP client with the pool's limits for the anthropic or openai SDK.
+
+        Uses the SDK's own DefaultHttpxClient so its timeouts, redirects and
+        keep-alive socket options are kept. Returns None (SDK default client)
+        for SDK releases that predate it.
+        """
+        default_client = getattr(sdk, 'DefaultHttpxClient', None)
+        default_limits = getattr(sdk, 'DEFAULT_CONNECTION_LIMITS', None)
+        if default_client is None or default_limits is None:
+            return None
+        return default_client(limits=cls.limits(type(default_limits)))
+
+    @classmethod
+    def get(cls, provider: str, api_key: str, factory: Callable[[], Any]) -> Any:
+        """
+        Return the shared client for a provider and credential.
+
+        Args:
+            provider: Provider name
+            api_key: Credential the client authenticates with
+            factory: Creates the client if none is pooled yet
+
+        Returns:
+            SDK client
+        """
+        # Key on a digest so credentials are not held as dict keys
+        key = (provider, hashlib.sha256(api_key.encode('utf-8')).hexdigest())
+        with cls._lock:
+            client = cls._clients.get(key)
+            if client is None:
+                client = factory()
+                cls._clients[key] = client
+        return client
+
+    @classmethod
+    def clear(cls) -> None:
+        """Close and forget all pooled clients."""
+        with cls._lock:
+            clients = list(cls._clients.values())
+            cls._clients.clear()
+
+        for client in clients:
+            close = getattr(client, 'close', None)
+            if callable(close):
+                try:
+                    close()
+                except Exception:
+                    pass
+
 
 class LLMProvider(ABC):
     """Base class for LLM providers"""
 
+    # Whether submit_batch()/batch_status()/batch_results() are implemented
+    supports_batch = False
+
     @abstractmethod
     def call(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
         """Call the LLM and return response text"""
         pass
 
+    def stream(self, system_prompt: str, user_prompt: str, **kwargs) -> Iterator[str]:
+        """
+        Call the LLM and yield response text as it is generated.
+
+        Providers without native streaming yield the full response as a single
+        chunk. Accepts the same keyword arguments as call().
+        """
+        yield self.call(system_prompt, user_prompt, **kwargs)
+
+    async def astream(self, system_prompt: str, user_prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Async variant of stream().
+
+        The blocking SDK stream runs on a worker thread and chunks are handed
+        to the event loop as they arrive. Closing the async iterator early
+        stops the worker after its current chunk.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        done = object()
+
+        def produce():
+            try:
+                for chunk in self.stream(system_prompt, user_prompt, **kwargs):
+                    if stop.is_set():
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, chunk)
+            except BaseException as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+
+        context = contextvars.copy_context()
+        worker = loop.run_in_executor(None, context.run, produce)
+
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            await worker
+
+    def _stream_with_retry(self, open_stream: Callable[[], Iterator[str]], max_retries: int,
+                           deadline: Optional[Deadline]) -> Iterator[str]:
+        """
+        Yield from a provider stream, retrying transient failures.
+
+        A failed attempt is only retried if it failed before producing any
+        text; once output has been yielded, retrying would duplicate it.
+        """
+        for attempt in range(max_retries):
+            if deadline is not None:
+                deadline.check("LLM call")
+
+            started = False
+            try:
+                for text in open_stream():
+                    if text:
+                        started = True
+                        yield text
+                return
+
+            except Exception as e:
+                self._raise_if_expired(deadline, e)
+                if started or not self._is_transient(e) or attempt == max_retries - 1:
+                    raise ValueError(f"{self.__class__.__name__} streaming failed: {e}") from e
+
+                wait_time = 2 ** attempt
+                # stdout carries the streamed text, keep retry notices off it
+                print(f"Stream failed to start. Retrying in {wait_time} seconds...", file=sys.stderr)
+                self._backoff(wait_time, deadline)
+
+        raise ValueError("Max retries exceeded")
+
+    def _is_transient(self, error: Exception) -> bool:
+        """Whether a failed request is worth retrying (rate limits, network errors)."""
+        return False
+
+    @staticmethod
+    def _request_options(deadline: Optional[Deadline]) -> dict:
+        """Per-request SDK options derived from the deadline."""
+        remaining = deadline.remaining() if deadline is not None else None
+        return {'timeout': remaining} if remaining is not None else {}
+
+    def warm_up(self) -> bool:
+        """
+        Open the provider connection ahead of the first call.
+
+        Issues a lightweight metadata request so DNS, TLS and the HTTP
+        connection pool are ready. Best-effort: failures are ignored.
+
+        Returns:
+            True if the connection was established
+        """
+        return False
+
+    def submit_batch(self, requests: List[BatchRequest]) -> str:
+        """
+        Submit requests to the provider's asynchronous batch API.
+
+        Batch jobs trade latency (results can take up to 24 hours) for lower
+        prices and separate rate limits.
+
+        Returns:
+            Provider batch job ID
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support batch requests")
+
+    def batch_status(self, batch_id: str) -> str:
+        """Return BATCH_PENDING, BATCH_COMPLETED or BATCH_FAILED for a batch job."""
+        raise NotImplementedError(f"{self.__class__.__name__} does not support batch requests")
+
+    def batch_results(self, batch_id: str) -> Dict[str, BatchResult]:
+        """Return results of a completed batch job, keyed by custom_id."""
+        raise NotImplementedError(f"{self.__class__.__name__} does not support batch requests")
+
+    @staticmethod
+    def _deadline(kwargs: dict) -> Optional[Deadline]:
+        """Deadline for a call: explicit `deadline` kwarg, else the active one."""
+        return kwargs.get('deadline') or current_deadline()
+
+    @staticmethod
+    def _backoff(wait_time: float, deadline: Optional[Deadline]) -> None:
+        """Sleep before a retry, refusing to back off past the deadline."""
+        if deadline is None:
+            time.sleep(wait_time)
+        else:
+            deadline.sleep(wait_time, "LLM call")
+
+    @staticmethod
+    def _raise_if_expired(deadline: Optional[Deadline], error: Exception) -> None:
+        """Report request timeouts caused by the deadline as DeadlineExceeded."""
+        if deadline is not None and deadline.expired:
+            raise DeadlineExceeded(f"LLM call exceeded its deadline: {error}") from error
+
     @staticmethod
     def create(provider: str, api_key: Optional[str] = None, model: Optional[str] = None, **kwargs) -> 'LLMProvider':
         """Factory method to create appropriate provider"""
@@ -39,6 +319,8 @@ class LLMProvider(ABC):
 class GeminiProvider(LLMProvider):
     """Google Gemini provider"""
 
+    supports_batch = True
+
     def __init__(self, api_key: Optional[str] = None, model: str = "gemini-2.0-flash-exp",
                  max_tokens: int = 2000, temperature: float = 0.3):
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
@@ -51,13 +333,33 @@ class GeminiProvider(LLMProvider):
             )
 
         try:
-            self.client = genai.Client(api_key=self.api_key)
+            self.client = ClientPool.get('gemini', self.api_key, self._create_client)
             self.model_name = model
             self.max_tokens = max_tokens
             self.temperature = temperature
         except Exception as e:
             raise ValueError(f"Failed to initialize Gemini client: {e}")
 
+        # Batch job name -> custom IDs in request order, to match inline responses
+        self._batch_ids: Dict[str, List[str]] = {}
+
+    def _create_client(self) -> 'genai.Client':
+        try:
+            return genai.Client(
+                api_key=self.api_key,
+                http_options={'client_args': {'limits': ClientPool.limits()}}
+            )
+        except (TypeError, ValueError):
+            # Older google-genai releases cannot configure the HTTP client
+            return genai.Client(api_key=self.api_key)
+
+    def warm_up(self) -> bool:
+        try:
+            self.client.models.get(model=self.model_name)
+            return True
+        except Exception:
+            return False
+
     def call(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
         """Call Gemini API with retry logic"""
         max_retries = kwargs.get('max_retries', 3)
@@ -65,6 +367,8 @@ class GeminiProvider(LLMProvider):
         # Combine system and user prompts for Gemini
         combined_prompt = f"{system_prompt}\n\n---\n\n{user_prompt}"
 
+        deadline = self._deadline(kwargs)
+
         # Build config
         config = {
             "max_output_tokens": kwargs.get('max_tokens', self.max_tokens),
@@ -72,6 +376,13 @@ class GeminiProvider(LLMProvider):
         }
 
         for attempt in range(max_retries):
+            if deadline is not None:
+                deadline.check("LLM call")
+                remaining = deadline.remaining()
+                if remaining is not None:
+                    # Gemini takes request timeouts in milliseconds
+                    config["http_options"] = {"timeout": max(1, int(remaining * 1000))}
+
             try:
                 response = self.client.models.generate_content(
                     model=self.model_name,
@@ -82,6 +393,7 @@ class GeminiProvider(LLMProvider):
                 return response.text
 
             except Exception as e:
+                self._raise_if_expired(deadline, e)
                 error_msg = str(e).lower()
 
                 # Rate limiting
@@ -89,7 +401,7 @@ class GeminiProvider(LLMProvider):
                     if attempt < max_retries - 1:
                         wait_time = 2 ** attempt
                         print(f"Rate limit reached. Retrying in {wait_time} seconds...")
-                        time.sleep(wait_time)
+                        self._backoff(wait_time, deadline)
                         continue
                     else:
                         raise ValueError(
@@ -102,7 +414,7 @@ class GeminiProvider(LLMProvider):
                     if attempt < max_retries - 1:
                         wait_time = 2 ** attempt
                         print(f"Network error. Retrying in {wait_time} seconds...")
-                        time.sleep(wait_time)
+                        self._backoff(wait_time, deadline)
                         continue
                     else:
                         raise ValueError(
@@ -124,10 +436,89 @@ class GeminiProvider(LLMProvider):
 
         raise ValueError("Max retries exceeded")
 
+    def stream(self, system_prompt: str, user_prompt: str, **kwargs) -> Iterator[str]:
+        """Stream Gemini response text with retry logic"""
+        deadline = self._deadline(kwargs)
+        combined_prompt = f"{system_prompt}\n\n---\n\n{user_prompt}"
+
+        def open_stream():
+            config = {
+                "max_output_tokens": kwargs.get('max_tokens', self.max_tokens),
+                "temperature": kwargs.get('temperature', self.temperature),
+            }
+            timeout = self._request_options(deadline).get('timeout')
+            if timeout is not None:
+                config["http_options"] = {"timeout": max(1, int(timeout * 1000))}
+
+            for chunk in self.client.models.generate_content_stream(
+                model=self.model_name,
+                contents=combined_prompt,
+                config=config
+            ):
+                yield chunk.text or ''
+
+        return self._stream_with_retry(open_stream, kwargs.get('max_retries', 3), deadline)
+
+    def _is_transient(self, error: Exception) -> bool:
+        error_msg = str(error).lower()
+        return any(term in error_msg for term in ('rate limit', 'quota', 'connection', 'network'))
+
+    def submit_batch(self, requests: List[BatchRequest]) -> str:
+        """Submit an inline Gemini batch job"""
+        job = self.client.batches.create(
+            model=self.model_name,
+            src=[
+                {
+                    'contents': [{
+                        'role': 'user',
+                        'parts': [{'text': f"{r.system_prompt}\n\n---\n\n{r.user_prompt}"}]
+                    }],
+                    'config': {
+                        'max_output_tokens': r.options.get('max_tokens', self.max_tokens),
+                        'temperature': r.options.get('temperature', self.temperature),
+                    },
+                    'metadata': {'custom_id': r.custom_id},
+                }
+                for r in requests
+            ]
+        )
+        self._batch_ids[job.name] = [r.custom_id for r in requests]
+        return job.name
+
+    def batch_status(self, batch_id: str) -> str:
+        state = self.client.batches.get(name=batch_id).state
+        state_name = getattr(state, 'name', str(state))
+        if state_name in ('JOB_STATE_SUCCEEDED', 'JOB_STATE_PARTIALLY_SUCCEEDED'):
+            return BATCH_COMPLETED
+        if state_name in ('JOB_STATE_FAILED', 'JOB_STATE_CANCELLED', 'JOB_STATE_EXPIRED'):
+            return BATCH_FAILED
+        return BATCH_PENDING
+
+    def batch_results(self, batch_id: str) -> Dict[str, BatchResult]:
+        job = self.client.batches.get(name=batch_id)
+        ordered_ids = self._batch_ids.get(batch_id, [])
+        results = {}
+
+        for idx, response in enumerate(job.dest.inlined_responses or []):
+            custom_id = (response.metadata or {}).get('custom_id')
+            if custom_id is None and idx < len(ordered_ids):
+                custom_id = ordered_ids[idx]
+            if custom_id is None:
+                continue
+
+            if response.error:
+                results[custom_id] = BatchResult(custom_id, error=str(response.error))
+            else:
+                results[custom_id] = BatchResult(custom_id, output=response.response.text)
+
+        return results
+
 
 class AnthropicProvider(LLMProvider):
     """Anthropic Claude provider"""
 
+    supports_batch = True
+
     def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-haiku-20240307",
                  max_tokens: int = 2000, temperature: float = 0.3):
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
@@ -140,7 +531,10 @@ class AnthropicProvider(LLMProvider):
             )
 
         try:
-            self.client = Anthropic(api_key=self.api_key)
+            self.client = ClientPool.get('anthropic', self.api_key, lambda: Anthropic(
+                api_key=self.api_key,
+                http_client=ClientPool.sdk_http_client(anthropic)
+            ))
         except Exception as e:
             raise ValueError(f"Failed to initialize Anthropic client: {e}")
 
@@ -148,14 +542,29 @@ class AnthropicProvider(LLMProvider):
         self.max_tokens = max_tokens
         self.temperature = temperature
 
+    def warm_up(self) -> bool:
+        try:
+            self.client.models.list(limit=1)
+            return True
+        except Exception:
+            return False
+
     def call(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
         """Call Anthropic API with retry logic"""
         max_retries = kwargs.get('max_retries', 3)
         model = kwargs.get('model', self.model)
         max_tokens = kwargs.get('max_tokens', self.max_tokens)
         temperature = kwargs.get('temperature', self.temperature)
+        deadline = self._deadline(kwargs)
 
         for attempt in range(max_retries):
+            request_options = {}
+            if deadline is not None:
+                deadline.check("LLM call")
+                remaining = deadline.remaining()
+                if remaining is not None:
+                    request_options['timeout'] = remaining
+
             try:
                 response = self.client.messages.create(
                     model=model,
@@ -164,7 +573,8 @@ class AnthropicProvider(LLMProvider):
                     system=system_prompt,
                     messages=[
                         {"role": "user", "content": user_prompt}
-                    ]
+                    ],
+                    **request_options
                 )
 
                 return response.content[0].text
@@ -180,7 +590,7 @@ class AnthropicProvider(LLMProvider):
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt
                     print(f"Rate limit reached. Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
+                    self._backoff(wait_time, deadline)
                     continue
                 else:
                     raise ValueError(
@@ -189,10 +599,11 @@ class AnthropicProvider(LLMProvider):
                     )
 
             except APIConnectionError as e:
+                self._raise_if_expired(deadline, e)
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt
                     print(f"Network error. Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
+                    self._backoff(wait_time, deadline)
                     continue
                 else:
                     raise ValueError(
@@ -206,19 +617,83 @@ class AnthropicProvider(LLMProvider):
                     if attempt < max_retries - 1:
                         wait_time = 2 ** attempt
                         print(f"Server error. Retrying in {wait_time} seconds...")
-                        time.sleep(wait_time)
+                        self._backoff(wait_time, deadline)
                         continue
                 raise ValueError(f"API error: {e}")
 
             except Exception as e:
+                self._raise_if_expired(deadline, e)
                 raise ValueError(f"Unexpected error calling Anthropic API: {e}")
 
         raise ValueError("Max retries exceeded")
 
+    def stream(self, system_prompt: str, user_prompt: str, **kwargs) -> Iterator[str]:
+        """Stream Anthropic response text with retry logic"""
+        deadline = self._deadline(kwargs)
+
+        def open_stream():
+            with self.client.messages.stream(
+                model=kwargs.get('model', self.model),
+                max_tokens=kwargs.get('max_tokens', self.max_tokens),
+                temperature=kwargs.get('temperature', self.temperature),
+                system=system_prompt,
+                messages=[
+                    {"role": "user", "content": user_prompt}
+                ],
+                **self._request_options(deadline)
+            ) as response:
+                yield from response.text_stream
+
+        return self._stream_with_retry(open_stream, kwargs.get('max_retries', 3), deadline)
+
+    def _is_transient(self, error: Exception) -> bool:
+        if isinstance(error, (RateLimitError, APIConnectionError)):
+            return True
+        return isinstance(error, APIError) and getattr(error, 'status_code', None) in [500, 502, 503, 504]
+
+    def submit_batch(self, requests: List[BatchRequest]) -> str:
+        """Submit an Anthropic Message Batch"""
+        batch = self.client.messages.batches.create(
+            requests=[
+                {
+                    'custom_id': r.custom_id,
+                    'params': {
+                        'model': r.options.get('model', self.model),
+                        'max_tokens': r.options.get('max_tokens', self.max_tokens),
+                        'temperature': r.options.get('temperature', self.temperature),
+                        'system': r.system_prompt,
+                        'messages': [{'role': 'user', 'content': r.user_prompt}],
+                    },
+                }
+                for r in requests
+            ]
+        )
+        return batch.id
+
+    def batch_status(self, batch_id: str) -> str:
+        batch = self.client.messages.batches.retrieve(batch_id)
+        # Cancelled and expired requests are reported per request once ended
+        return BATCH_COMPLETED if batch.processing_status == 'ended' else BATCH_PENDING
+
+    def batch_results(self, batch_id: str) -> Dict[str, BatchResult]:
+        results = {}
+        for entry in self.client.messages.batches.results(batch_id):
+            if entry.result.type == 'succeeded':
+                results[entry.custom_id] = BatchResult(
+                    entry.custom_id, output=entry.result.message.content[0].text
+                )
+            else:
+                error = getattr(entry.result, 'error', None)
+                message = f"{entry.result.type}: {error}" if error else entry.result.type
+                results[entry.custom_id] = BatchResult(entry.custom_id, error=message)
+        return results
+
 
 class OpenAIProvider(LLMProvider):
     """OpenAI provider"""
 
+    supports_batch = True
+
     def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o-mini",
                  max_tokens: int = 2000, temperature: float = 0.3):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
@@ -231,7 +706,10 @@ class OpenAIProvider(LLMProvider):
             )
 
         try:
-            self.client = OpenAI(api_key=self.api_key)
+            self.client = ClientPool.get('openai', self.api_key, lambda: OpenAI(
+                api_key=self.api_key,
+                http_client=ClientPool.sdk_http_client(openai)
+            ))
         except Exception as e:
             raise ValueError(f"Failed to initialize OpenAI client: {e}")
 
@@ -239,14 +717,29 @@ class OpenAIProvider(LLMProvider):
         self.max_tokens = max_tokens
         self.temperature = temperature
 
+    def warm_up(self) -> bool:
+        try:
+            self.client.models.retrieve(self.model)
+            return True
+        except Exception:
+            return False
+
     def call(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
         """Call OpenAI API with retry logic"""
         max_retries = kwargs.get('max_retries', 3)
         model = kwargs.get('model', self.model)
         max_tokens = kwargs.get('max_tokens', self.max_tokens)
         temperature = kwargs.get('temperature', self.temperature)
+        deadline = self._deadline(kwargs)
 
         for attempt in range(max_retries):
+            request_options = {}
+            if deadline is not None:
+                deadline.check("LLM call")
+                remaining = deadline.remaining()
+                if remaining is not None:
+                    request_options['timeout'] = remaining
+
             try:
                 response = self.client.chat.completions.create(
                     model=model,
@@ -255,19 +748,21 @@ class OpenAIProvider(LLMProvider):
                     messages=[
                         {"role": "system", "content": system_prompt},
                         {"role": "user", "content": user_prompt}
-                    ]
+                    ],
+                    **request_options
                 )
 
                 return response.choices[0].message.content
 
             except OpenAIAPIError as e:
+                self._raise_if_expired(deadline, e)
                 error_msg = str(e).lower()
 
                 if 'rate limit' in error_msg:
                     if attempt < max_retries - 1:
                         wait_time = 2 ** attempt
                         print(f"Rate limit reached. Retrying in {wait_time} seconds...")
-                        time.sleep(wait_time)
+                        self._backoff(wait_time, deadline)
                         continue
                     else:
                         raise ValueError(f"Rate limit exceeded: {e}")
@@ -281,11 +776,102 @@ class OpenAIProvider(LLMProvider):
                 raise ValueError(f"OpenAI API error: {e}")
 
             except Exception as e:
+                self._raise_if_expired(deadline, e)
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt
                     print(f"Error occurred. Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
+                    self._backoff(wait_time, deadline)
                     continue
                 raise ValueError(f"Unexpected error calling OpenAI API: {e}")
 
         raise ValueError("Max retries exceeded")
+
+    def stream(self, system_prompt: str, user_prompt: str, **kwargs) -> Iterator[str]:
+        """Stream OpenAI response text with retry logic"""
+        deadline = self._deadline(kwargs)
+
+        def open_stream():
+            response = self.client.chat.completions.create(
+                model=kwargs.get('model', self.model),
+                max_tokens=kwargs.get('max_tokens', self.max_tokens),
+                temperature=kwargs.get('temperature', self.temperature),
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                stream=True,
+                **self._request_options(deadline)
+            )
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        return self._stream_with_retry(open_stream, kwargs.get('max_retries', 3), deadline)
+
+    def _is_transient(self, error: Exception) -> bool:
+        error_msg = str(error).lower()
+        if 'authentication' in error_msg or 'api key' in error_msg:
+            return False
+        return 'rate limit' in error_msg or not isinstance(error, OpenAIAPIError)
+
+    def submit_batch(self, requests: List[BatchRequest]) -> str:
+        """Upload a JSONL request file and start an OpenAI batch job"""
+        lines = [
+            json.dumps({
+                'custom_id': r.custom_id,
+                'method': 'POST',
+                'url': '/v1/chat/completions',
+                'body': {
+                    'model': r.options.get('model', self.model),
+                    'max_tokens': r.options.get('max_tokens', self.max_tokens),
+                    'temperature': r.options.get('temperature', self.temperature),
+                    'messages': [
+                        {'role': 'system', 'content': r.system_prompt},
+                        {'role': 'user', 'content': r.user_prompt},
+                    ],
+                },
+            })
+            for r in requests
+        ]
+
+        input_file = self.client.files.create(
+            file=('superskills-batch.jsonl', "\n".join(lines).encode('utf-8')),
+            purpose='batch'
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint='/v1/chat/completions',
+            completion_window='24h'
+        )
+        return batch.id
+
+    def batch_status(self, batch_id: str) -> str:
+        status = self.client.batches.retrieve(batch_id).status
+        if status == 'completed':
+            return BATCH_COMPLETED
+        if status in ('failed', 'expired', 'cancelled'):
+            return BATCH_FAILED
+        return BATCH_PENDING
+
+    def batch_results(self, batch_id: str) -> Dict[str, BatchResult]:
+        batch = self.client.batches.retrieve(batch_id)
+        results = {}
+
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                custom_id = entry['custom_id']
+                response = entry.get('response') or {}
+
+                if entry.get('error') or response.get('status_code', 200) >= 400:
+                    error = entry.get('error') or response.get('body', {}).get('error')
+                    results[custom_id] = BatchResult(custom_id, error=str(error))
+                else:
+                    content = response['body']['choices'][0]['message']['content']
+                    results[custom_id] = BatchResult(custom_id, output=content)
+
+        return results
@@ -1,18 +1,98 @@
 """
 Logging system for the CLI.
 """
+import atexit
+import itertools
+import json
 import logging
+import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+# Environment overrides for the `logging` config section
+LOG_FORMAT_ENV = 'SUPERSKILLS_LOG_FORMAT'
+DEBUG_SAMPLE_ENV = 'SUPERSKILLS_LOG_DEBUG_SAMPLE'
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+class JSONFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'time': self.formatTime(record, DATE_FORMAT),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'thread': record.threadName,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload['exception'] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class DebugSampler(logging.Filter):
+    """
+    Keep a fixed fraction of DEBUG records from each call site.
+
+    The first record from a call site is always kept, then one in every
+    1/rate. Sampling is deterministic (a counter per call site), so hot
+    loops are thinned evenly without a random draw per record. Records
+    above DEBUG always pass.
+    """
+
+    def __init__(self, rate: float = 1.0):
+        super().__init__()
+        self.rate = rate
+        self._counters: Dict[Tuple[str, int], 'itertools.count[int]'] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.rate >= 1:
+            return True
+        if self.rate <= 0:
+            return False
+
+        counter = self._counters.get((record.pathname, record.lineno))
+        if counter is None:
+            counter = self._counters.setdefault((record.pathname, record.lineno), itertools.count())
+        n = next(counter)
+        return n == 0 or int(n * self.rate) != int((n - 1) * self.rate)
+
+
+class _QueueHandler(QueueHandler):
+    """QueueHandler that keeps tracebacks separate from the message."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args on the calling thread (they may be mutated later), but
+        # leave formatting, including JSON, to the writer thread
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
 
 
 class CLILogger:
     """
     Centralized logging for SuperSkills CLI.
 
-    Logs to both console (INFO+) and file (DEBUG+) with rotation.
+    Logs to both console (INFO+) and file (DEBUG+) with rotation. File
+    records go through a queue to a background writer thread, so callers
+    never wait on disk I/O or rotation; the console handler stays
+    synchronous to keep its messages in order with printed output.
+
+    The file format ('text' or 'json') and the DEBUG sampling rate come from
+    the `logging` config section or the SUPERSKILLS_LOG_FORMAT and
+    SUPERSKILLS_LOG_DEBUG_SAMPLE environment variables.
     """
 
     _instance: Optional['CLILogger'] = None
@@ -26,7 +106,11 @@ class CLILogger:
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
         self.verbose = verbose
+        self._file_handler: Optional[logging.Handler] = None
+        self._listener: Optional[QueueListener] = None
+        self._sampler = DebugSampler()
         self._setup_logger()
+        self.configure()
 
     def _setup_logger(self):
         """Configure logging with file and console handlers."""
@@ -45,20 +129,48 @@ class CLILogger:
             encoding='utf-8'
         )
         file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(file_formatter)
+        file_handler.setFormatter(logging.Formatter(TEXT_FORMAT, datefmt=DATE_FORMAT))
+        self._file_handler = file_handler
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        self._listener.start()
+        atexit.register(self._listener.stop)
 
         console_handler = logging.StreamHandler(sys.stderr)
         console_handler.setLevel(logging.DEBUG if self.verbose else logging.INFO)
         console_formatter = logging.Formatter('%(levelname)s: %(message)s')
         console_handler.setFormatter(console_formatter)
 
-        self._logger.addHandler(file_handler)
+        # Sample on the logger so dropped records never reach either handler
+        self._logger.addFilter(self._sampler)
+        self._logger.addHandler(_QueueHandler(log_queue))
         self._logger.addHandler(console_handler)
 
+    def configure(self, log_format: Optional[str] = None, debug_sample_rate: Optional[float] = None):
+        """
+        Apply logging settings; environment variables take precedence.
+
+        Args:
+            log_format: 'text' or 'json' for the log file
+            debug_sample_rate: Fraction of DEBUG records to keep per call site
+                (1.0 keeps all, 0.1 keeps one in ten)
+        """
+        log_format = os.getenv(LOG_FORMAT_ENV) or log_format
+        debug_sample_rate = os.getenv(DEBUG_SAMPLE_ENV) or debug_sample_rate
+
+        if log_format and self._file_handler is not None:
+            if log_format.lower() == 'json':
+                self._file_handler.setFormatter(JSONFormatter())
+            else:
+                self._file_handler.setFormatter(logging.Formatter(TEXT_FORMAT, datefmt=DATE_FORMAT))
+
+        if debug_sample_rate is not None:
+            try:
+                self._sampler.rate = min(max(float(debug_sample_rate), 0.0), 1.0)
+            except (TypeError, ValueError):
+                self._logger.warning(f"Ignoring invalid debug sample rate: {debug_sample_rate}")
+
     @classmethod
     def get_logger(cls, verbose: bool = False) -> logging.Logger:
         """
@@ -80,13 +192,26 @@ class CLILogger:
 
         return cls._instance._logger
 
+    @classmethod
+    def flush(cls):
+        """Wait until queued records have been written to the log file."""
+        if cls._instance and cls._instance._listener:
+            cls._instance._listener.stop()
+            cls._instance._listener.start()
+
     @classmethod
     def reset(cls):
         """Reset the logger (useful for testing)."""
         if cls._instance and cls._instance._logger:
+            if cls._instance._listener:
+                cls._instance._listener.stop()
+                atexit.unregister(cls._instance._listener.stop)
+            if cls._instance._file_handler:
+                cls._instance._file_handler.close()
             for handler in cls._instance._logger.handlers[:]:
                 handler.close()
                 cls._instance._logger.removeHandler(handler)
+            cls._instance._logger.removeFilter(cls._instance._sampler)
         cls._instance = None
         cls._logger = None
 
@@ -102,3 +227,15 @@ def get_logger(verbose: bool = False) -> logging.Logger:
         Logger instance
     """
     return CLILogger.get_logger(verbose=verbose)
+
+
+def configure_logging(log_format: Optional[str] = None, debug_sample_rate: Optional[float] = None) -> None:
+    """
+    Apply the `logging` config section to the CLI logger.
+
+    Args:
+        log_format: 'text' or 'json' for the log file
+        debug_sample_rate: Fraction of DEBUG records to keep per call site
+    """
+    CLILogger.get_logger()
+    CLILogger._instance.configure(log_format=log_format, debug_sample_rate=debug_sample_rate)
@@ -30,6 +30,8 @@ class MasterBriefingLoader:
         self.logger = get_logger()
         self._cached_content: Optional[Dict[str, Any]] = None
         self._cache_mtime: Optional[float] = None
+        self._formatted: Optional[str] = None
+        self._formatted_mtime: Optional[float] = None
 
     def load(self) -> Optional[Dict[str, Any]]:
         """
@@ -98,6 +100,10 @@ class MasterBriefingLoader:
         if not briefing:
             return ""
 
+        # Reuse the rendered markdown until the YAML file changes
+        if self._formatted is not None and self._formatted_mtime == self._cache_mtime:
+            return self._formatted
+
         sections = []
 
         # 1. Identity & Context
@@ -263,4 +269,6 @@ class MasterBriefingLoader:
                     sections.append(f"- {item}")
             sections.append("")
 
-        return "\n".join(sections)
+        self._formatted = "\n".join(sections)
+        self._formatted_mtime = self._cache_mtime
+        return self._formatted
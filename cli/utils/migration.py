@@ -3,9 +3,12 @@ Migration utilities for exporting and importing profiles and settings.
 """
 import hashlib
 import json
-from pathlib import Path
-from typing import Dict, List, Tuple, Any
+import os
 import shutil
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from cli.utils.paths import get_project_root, get_user_config_dir
 
@@ -69,6 +72,10 @@ def collect_skill_configs() -> List[Tuple[str, Path]]:
     return configs
 
 
+# Read size for hashing and streaming archive entries
+CHUNK_SIZE = 1024 * 1024
+
+
 def calculate_checksum(file_path: Path) -> str:
     """
     Calculate SHA256 checksum of a file.
@@ -82,12 +89,126 @@ def calculate_checksum(file_path: Path) -> str:
     sha256 = hashlib.sha256()
     
     with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b''):
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            sha256.update(chunk)
+    
+    return sha256.hexdigest()
+
+
+def calculate_checksums(files: Dict[str, Path], max_workers: Optional[int] = None) -> Dict[str, str]:
+    """
+    Calculate SHA256 checksums of many files in parallel.
+    
+    hashlib releases the GIL while hashing, so threads scale with the
+    number of cores.
+    
+    Args:
+        files: Mapping of key (e.g. archive path) to file path
+        max_workers: Thread count (default: based on CPU count)
+        
+    Returns:
+        Mapping of key to hex digest
+    """
+    if not files:
+        return {}
+    
+    workers = max_workers or min(len(files), (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        checksums = pool.map(calculate_checksum, files.values())
+        return dict(zip(files.keys(), checksums))
+
+
+def copy_with_checksum(source, target_path: Path) -> str:
+    """
+    Stream a file object to disk, hashing it on the way.
+    
+    Args:
+        source: Readable binary file object (e.g. an archive entry)
+        target_path: Destination file
+        
+    Returns:
+        Hex digest of SHA256 checksum of the written data
+    """
+    sha256 = hashlib.sha256()
+    
+    with open(target_path, 'wb') as target:
+        for chunk in iter(lambda: source.read(CHUNK_SIZE), b''):
             sha256.update(chunk)
+            target.write(chunk)
     
     return sha256.hexdigest()
 
 
+def last_manifest_path() -> Path:
+    """Where the manifest of the last export is kept, for incremental exports."""
+    return get_user_config_dir() / "migration" / "last-export-manifest.json"
+
+
+def load_manifest(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load a manifest from a migration package or a manifest JSON file.
+    
+    Args:
+        path: Migration ZIP file or manifest JSON file
+        
+    Returns:
+        Parsed manifest, or None if missing or invalid
+    """
+    try:
+        if zipfile.is_zipfile(path):
+            with zipfile.ZipFile(path, 'r') as zipf:
+                manifest = json.loads(zipf.read("manifest.json"))
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+    except (OSError, KeyError, ValueError):
+        return None
+    
+    return manifest if isinstance(manifest, dict) and validate_manifest(manifest) else None
+
+
+def save_manifest(manifest: Dict[str, Any], path: Path) -> None:
+    """Write a manifest JSON file atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def manifest_state(manifest: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Every file a manifest describes, whether packed or not.
+    
+    Incremental packages only pack changed files ('files') and list the
+    rest under 'unchanged'; together they describe the full exported state.
+    """
+    return {**manifest.get('unchanged', {}), **manifest['files']}
+
+
+def diff_manifest(current: Dict[str, Dict[str, Any]],
+                  base: Dict[str, Dict[str, Any]]) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Compare current file entries against a base manifest state.
+    
+    Args:
+        current: Archive path -> {'checksum', 'size'} for the current files
+        base: Archive path -> {'checksum', 'size'} from the base manifest
+        
+    Returns:
+        (changed, unchanged, removed) archive paths; new files count as changed
+    """
+    changed, unchanged = [], []
+    for path, info in current.items():
+        if base.get(path, {}).get('checksum') == info['checksum']:
+            unchanged.append(path)
+        else:
+            changed.append(path)
+    removed = sorted(set(base) - set(current))
+    
+    return changed, unchanged, removed
+
+
 def validate_manifest(manifest_data: Dict[str, Any]) -> bool:
     """
     Validate manifest structure and required fields.
@@ -163,6 +163,29 @@ class ModelResolver:
 
         return None
 
+    @classmethod
+    def get_model_id(cls, model: str) -> str:
+        """
+        Look up the concrete ID for a logical model name without any API calls.
+
+        Args:
+            model: Logical model name, legacy alias or concrete ID
+
+        Returns:
+            Concrete model ID (the input itself if it is not in the registry)
+        """
+        registry = cls._load_registry()
+
+        if model in registry.get('legacy_aliases', {}):
+            model = registry['legacy_aliases'][model]
+
+        return registry.get('models', {}).get(model, {}).get('id', model)
+
+    @classmethod
+    def get_routing(cls) -> Dict[str, Any]:
+        """Return the adaptive routing section of the registry (empty if absent)."""
+        return cls._load_registry().get('routing') or {}
+
     @classmethod
     def clear_cache(cls):
         """Clear the resolution cache"""
@@ -1,10 +1,24 @@
 """Core utilities for SuperSkills."""
 
 from .credentials import check_credentials, get_credential, get_credential_status, load_credentials
+from .deadline import (
+    Deadline,
+    DeadlineExceeded,
+    OperationCancelled,
+    current_deadline,
+    deadline_scope,
+    run_subprocess,
+)
 
 __all__ = [
     'load_credentials',
     'get_credential',
     'check_credentials',
-    'get_credential_status'
+    'get_credential_status',
+    'Deadline',
+    'DeadlineExceeded',
+    'OperationCancelled',
+    'current_deadline',
+    'deadline_scope',
+    'run_subprocess'
 ]
@@ -0,0 +1,191 @@
+"""
+Deadlines and cooperative cancellation for long-running operations.
+
+A Deadline carries an absolute expiry time and a cancellation flag. Workflow
+runs create one per run and derive a child per step; the time left is handed
+to provider calls, retry back-off and subprocesses so nothing outlives the
+caller. Code that cannot receive a deadline argument (e.g. Python skills) can
+pick up the active one with current_deadline().
+"""
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+# How often blocking waits wake up to check for cancellation
+_POLL_INTERVAL = 0.25
+
+_current_deadline: ContextVar[Optional['Deadline']] = ContextVar('superskills_deadline', default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when an operation runs past its deadline."""
+
+
+class OperationCancelled(RuntimeError):
+    """Raised when an operation was cancelled before it finished."""
+
+
+class Deadline:
+    """Absolute time limit plus cooperative cancellation flag."""
+
+    def __init__(self, timeout: Optional[float] = None, parent: Optional['Deadline'] = None):
+        """
+        Create a deadline.
+
+        Args:
+            timeout: Seconds from now (None or 0 for no limit of its own)
+            parent: Enclosing deadline; the child never outlives it and is
+                cancelled when the parent is cancelled
+        """
+        self.parent = parent
+        self._cancelled = threading.Event()
+
+        expires_at = time.monotonic() + timeout if timeout else None
+        if parent is not None and parent.expires_at is not None:
+            expires_at = parent.expires_at if expires_at is None else min(expires_at, parent.expires_at)
+        self.expires_at = expires_at
+
+    def child(self, timeout: Optional[float] = None) -> 'Deadline':
+        """Derive a deadline bounded by both this one and `timeout`."""
+        return Deadline(timeout, parent=self)
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, or None if unbounded."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def timeout(self, default: Optional[float] = None) -> Optional[float]:
+        """
+        Timeout to hand to a blocking call.
+
+        Args:
+            default: Timeout to use when the deadline is unbounded (or longer)
+
+        Returns:
+            Smaller of `default` and the time left (None if both unbounded)
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        if default is None:
+            return remaining
+        return min(default, remaining)
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set() or (self.parent is not None and self.parent.cancelled)
+
+    def cancel(self) -> None:
+        """Request cancellation of everything running under this deadline."""
+        self._cancelled.set()
+
+    def check(self, operation: str = "Operation") -> None:
+        """
+        Raise if the deadline has passed or was cancelled.
+
+        Raises:
+            OperationCancelled: If cancel() was called
+            DeadlineExceeded: If the deadline has passed
+        """
+        if self.cancelled:
+            raise OperationCancelled(f"{operation} was cancelled")
+        if self.expired:
+            raise DeadlineExceeded(f"{operation} exceeded its deadline")
+
+    def sleep(self, seconds: float, operation: str = "Operation") -> None:
+        """
+        Sleep without outliving the deadline.
+
+        Raises:
+            DeadlineExceeded: If the deadline ends before `seconds` have passed
+            OperationCancelled: If cancelled while sleeping
+        """
+        remaining = self.remaining()
+        if remaining is not None and remaining < seconds:
+            raise DeadlineExceeded(
+                f"{operation} exceeded its deadline ({remaining:.1f}s left, needed {seconds:.1f}s)"
+            )
+
+        end = time.monotonic() + seconds
+        while True:
+            self.check(operation)
+            left = end - time.monotonic()
+            if left <= 0:
+                return
+            self._cancelled.wait(min(left, _POLL_INTERVAL))
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Return the deadline active in the current context, if any."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """Make `deadline` the current deadline for the duration of the block."""
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def run_subprocess(args: List[str], deadline: Optional[Deadline] = None, **kwargs) -> subprocess.CompletedProcess:
+    """
+    Drop-in replacement for subprocess.run() that honours a deadline.
+
+    The child is killed when the deadline passes or is cancelled. Without a
+    deadline (argument or current_deadline()) this is plain subprocess.run().
+
+    Args:
+        args: Command to run
+        deadline: Deadline to honour (defaults to current_deadline())
+        **kwargs: subprocess.run() keyword arguments
+
+    Returns:
+        CompletedProcess
+
+    Raises:
+        DeadlineExceeded / OperationCancelled: If the child had to be killed
+        subprocess.CalledProcessError: If check=True and the child failed
+    """
+    deadline = deadline or current_deadline()
+    if deadline is None:
+        return subprocess.run(args, **kwargs)
+
+    check = kwargs.pop('check', False)
+    input_data = kwargs.pop('input', None)
+    if kwargs.pop('capture_output', False):
+        kwargs['stdout'] = subprocess.PIPE
+        kwargs['stderr'] = subprocess.PIPE
+    if input_data is not None:
+        kwargs['stdin'] = subprocess.PIPE
+
+    command_name = str(args[0]) if args else 'subprocess'
+
+    with subprocess.Popen(args, **kwargs) as process:
+        while True:
+            try:
+                stdout, stderr = process.communicate(input_data, timeout=deadline.timeout(_POLL_INTERVAL))
+                break
+            except subprocess.TimeoutExpired:
+                # Input is only written on the first communicate() call
+                input_data = None
+                if deadline.cancelled or deadline.expired:
+                    process.kill()
+                    process.communicate()
+                    deadline.check(command_name)
+
+    if check and process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, args, stdout, stderr)
+
+    return subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
@@ -3,28 +3,34 @@ ObsidianClient.py - Main client for Obsidian vault operations.
 """
 import logging
 import os
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Literal, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Literal, Optional, Tuple
 
 from .ObsidianDocument import (
+    TEXT_FIELDS,
     ObsidianChangesPlan,
     ObsidianNote,
     ObsidianOperationResult,
     PlannedOperation,
+    check_fields,
 )
-from .ObsidianLinkUpdater import LinkIndex, update_links_after_move
+from .ObsidianIndex import ChangeFeed, IndexedNote, VaultIndex
+from .ObsidianLinkUpdater import LinkIndex, link_renames, resolve_link, update_links_after_moves
+from .ObsidianParallel import parse_notes
 from .ObsidianParser import (
-    extract_headings,
-    extract_links,
-    extract_tags_from_frontmatter,
+    analyze_note,
+    file_key,
     find_section,
-    get_title_from_content,
     merge_frontmatter,
     parse_frontmatter,
     serialize_frontmatter,
+    update_link_in_content,
 )
-from .ObsidianSearch import tag_search, text_search
+from .ObsidianSearch import fts_query, parse_query, text_search
+from .ObsidianTransaction import VaultTransaction, recover_transaction
+from .ObsidianWatcher import VaultWatcher
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +43,8 @@ class ObsidianClient:
         vault_path: Optional[str] = None,
         read_only: bool = False,
         auto_update_links: bool = True,
-        verbose: bool = True
+        verbose: bool = True,
+        index_path: Optional[str] = None
     ):
         """
         Initialize Obsidian client.
@@ -47,6 +54,8 @@ class ObsidianClient:
             read_only: If True, prevent all write operations
             auto_update_links: Auto-update wiki links on move/rename
             verbose: Enable verbose logging
+            index_path: Vault index database (default: per vault under
+                ~/.superskills/cache/obsidian)
         """
         self.vault_path = Path(vault_path or os.getenv("OBSIDIAN_VAULT_PATH", ""))
 
@@ -69,10 +78,127 @@ class ObsidianClient:
         self.auto_update_links = auto_update_links
         self.verbose = verbose
 
+        if not self.read_only:
+            outcome = recover_transaction(self.vault_path)
+            if outcome:
+                logger.warning(f"Found an interrupted plan commit in {self.vault_path}: {outcome}")
+
+        self.index = VaultIndex(self.vault_path, Path(index_path) if index_path else None)
         self.link_index = LinkIndex()
+        self._links_loaded = False
+        self.refresh_index()
+
+    def refresh_index(self) -> Dict[str, int]:
+        """
+        Bring the vault index up to date with changes made outside this client.
+
+        Only notes whose mtime or size changed are re-read, and only their
+        links are updated in the link index.
+
+        Returns:
+            Counts: 'notes', 'updated', 'removed'
+        """
+        with self.index.batch():
+            cursor = self.index.cursor()
+            stats = self.index.refresh()
+            if not self._links_loaded:
+                self.link_index.load(self.index.forward_links())
+                self._links_loaded = True
+            elif stats['updated'] or stats['removed']:
+                self._apply_changes(self.index.changes_since(cursor))
         if self.verbose:
-            logger.info(f"Building link index for vault: {self.vault_path}")
-        self.link_index.build_index(self.vault_path)
+            logger.info(
+                f"Vault index for {self.vault_path}: {stats['notes']} notes "
+                f"({stats['updated']} updated, {stats['removed']} removed)"
+            )
+        return stats
+
+    def _apply_changes(self, changes: ChangeFeed) -> None:
+        """Bring the link index in line with notes the vault index re-read."""
+        entries = self.index.get_many(changes.updated)
+        links = {relative_path: None for relative_path in changes.removed}
+        for relative_path in changes.updated:
+            entry = entries.get(relative_path)
+            links[relative_path] = None if entry is None else entry.links
+        self.link_index.update(links)
+
+    def changes_since(self, cursor: Optional[str] = None, refresh: bool = True) -> ChangeFeed:
+        """
+        Notes created, edited, moved or deleted since a cursor.
+
+        For incremental jobs: store the returned cursor and pass it on the
+        next run to get only what changed in between. A move shows up as a
+        removal of the old path and an update of the new one.
+
+        Args:
+            cursor: Cursor from a previous call; None for every note
+            refresh: Pick up edits made outside this client first (not
+                needed while a watcher is running, see watch())
+
+        Returns:
+            ChangeFeed with `updated` and `removed` relative paths and the
+            next `cursor`. If `reset` is set, the cursor was from an index
+            that has since been rebuilt and `updated` lists every note.
+
+        Example:
+            changes = client.changes_since(state.get("cursor"))
+            for path in changes.updated:
+                process(client.get_note(path))
+            state["cursor"] = changes.cursor
+        """
+        if refresh:
+            self.refresh_index()
+        return self.index.changes_since(cursor)
+
+    def watch(self, on_change: Optional[Callable[[ChangeFeed], None]] = None) -> VaultWatcher:
+        """
+        Keep the vault index and link index current while the process runs,
+        by watching the vault for changes (inotify on Linux).
+
+        Args:
+            on_change: Called (from the watcher thread) with the changes
+                each time a batch of file events has been indexed
+
+        Returns:
+            The started watcher; call stop() or use it as a context manager
+
+        Raises:
+            ImportError: If watchdog is not installed
+        """
+        watcher = VaultWatcher(self, on_change=on_change)
+        watcher.start()
+        return watcher
+
+    def _reindex(self, *relative_paths: str) -> None:
+        """
+        Update the vault index and link index after this client wrote,
+        created or moved notes. Costs O(changed notes), not O(vault).
+        """
+        # One batch, so another thread (e.g. a watcher) cannot interleave
+        # its own updates between the two indexes
+        with self.index.batch():
+            if len(relative_paths) > 1:
+                entries = self.index.update_many(relative_paths)
+            else:
+                entries = {path: self.index.update(path) for path in relative_paths}
+
+            self.link_index.update({
+                relative_path: None if entries.get(relative_path) is None else entries[relative_path].links
+                for relative_path in relative_paths
+            })
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group many writes: vault index updates are committed once at the end.
+
+        Example:
+            with client.batch():
+                for path, text in notes.items():
+                    client.create_note(path, text)
+        """
+        with self.index.batch():
+            yield
 
     def _validate_path(self, path: Path) -> Path:
         """Ensure path is within vault."""
@@ -95,72 +221,143 @@ class ObsidianClient:
 
     def _parse_note(self, file_path: Path) -> ObsidianNote:
         """Parse a note file into ObsidianNote object."""
-        content = file_path.read_text(encoding='utf-8')
-        frontmatter, body = parse_frontmatter(content)
-
-        tags = extract_tags_from_frontmatter(frontmatter)
-        headings = extract_headings(body)
-        links = extract_links(body)
-        title = get_title_from_content(body, frontmatter, file_path.stem)
-
         stat = file_path.stat()
-        created_at = datetime.fromtimestamp(stat.st_ctime).isoformat()
-        updated_at = datetime.fromtimestamp(stat.st_mtime).isoformat()
-
+        content = file_path.read_text(encoding='utf-8')
         relative_path = str(file_path.relative_to(self.vault_path))
-        backlinks = self.link_index.get_backlinks(relative_path)
+        fields = analyze_note(content, file_path.stem, file_key(file_path, stat))
+        return self._build_note(relative_path, file_path, content, stat, fields)
 
+    def _build_note(
+        self,
+        relative_path: str,
+        file_path: Path,
+        content: str,
+        stat: os.stat_result,
+        fields: Dict
+    ) -> ObsidianNote:
         return ObsidianNote(
             path=file_path,
             relative_path=relative_path,
-            title=title,
-            frontmatter=frontmatter,
+            title=fields['title'],
+            frontmatter=fields['frontmatter'],
             content=content,
-            body=body,
-            headings=headings,
-            tags=tags,
-            links=links,
-            created_at=created_at,
-            updated_at=updated_at,
-            backlinks=backlinks
+            body=fields['body'],
+            headings=fields['headings'],
+            tags=fields['tags'],
+            links=fields['links'],
+            created_at=datetime.fromtimestamp(stat.st_ctime).isoformat(),
+            updated_at=datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            backlinks=self.link_index.get_backlinks(relative_path)
+        )
+
+    def _parse_notes(self, relative_paths: Iterable[str]) -> Iterator[ObsidianNote]:
+        """Parse many notes in parallel, in order, skipping unreadable ones."""
+        relative_paths = list(relative_paths)
+        parsed_notes = parse_notes(self.vault_path / path for path in relative_paths)
+
+        for relative_path, parsed in zip(relative_paths, parsed_notes):
+            if parsed.error is not None:
+                if self.verbose:
+                    logger.warning(f"Failed to parse {parsed.path}: {parsed.error}")
+                continue
+            yield self._build_note(relative_path, parsed.path, parsed.content, parsed.stat, parsed.fields)
+
+    def _index_note(self, entry: IndexedNote) -> ObsidianNote:
+        """Note built from the vault index; the file is only read if its text is used."""
+        relative_path = entry.path
+
+        def load() -> Dict:
+            file_path = self.vault_path / relative_path
+            stat = file_path.stat()
+            content = file_path.read_text(encoding='utf-8')
+            fields = analyze_note(content, entry.stem, file_key(file_path, stat))
+            fields['content'] = content
+            fields['backlinks'] = self.link_index.get_backlinks(relative_path)
+            return fields
+
+        return ObsidianNote(
+            path=self.vault_path / relative_path,
+            relative_path=relative_path,
+            title=entry.title,
+            frontmatter=entry.frontmatter,
+            headings=entry.headings,
+            tags=entry.tags,
+            links=entry.links,
+            created_at=datetime.fromtimestamp(entry.ctime).isoformat(),
+            updated_at=datetime.fromtimestamp(entry.mtime).isoformat(),
+            loader=load
         )
 
+    def _notes(self, relative_paths: Iterable[str], fields: Optional[Iterable[str]]) -> Iterator[ObsidianNote]:
+        """
+        Notes for the given paths, in order.
+
+        Without a projection (fields=None), or when it includes the note
+        text, the files are read and parsed in parallel. Otherwise notes are
+        built from the vault index alone and nothing is read from disk.
+        """
+        fields = check_fields(fields)
+        if fields is None or TEXT_FIELDS.intersection(fields):
+            yield from self._parse_notes(relative_paths)
+            return
+
+        relative_paths = list(relative_paths)
+        entries = self.index.get_many(relative_paths)
+        for relative_path in relative_paths:
+            if relative_path in entries:
+                yield self._index_note(entries[relative_path])
+
+    def iter_notes(
+        self,
+        folder: Optional[str] = None,
+        recursive: bool = True,
+        fields: Optional[List[str]] = None
+    ) -> Iterator[ObsidianNote]:
+        """
+        Stream notes in vault or specific folder, sorted by path.
+
+        Like list_notes(), but yields each note as soon as it is parsed and
+        never holds more than a few batches of notes in memory.
+
+        Args:
+            folder: Folder path relative to vault root (None for all)
+            recursive: Search subfolders
+            fields: Fields the caller needs (see list_notes)
+
+        Yields:
+            ObsidianNote objects
+        """
+        if folder:
+            search_path = self._validate_path(self.vault_path / folder)
+            folder = str(search_path.relative_to(self.vault_path))
+            if folder == '.':
+                folder = None
+
+        yield from self._notes(self.index.paths(folder, recursive), fields)
+
     def list_notes(
         self,
         folder: Optional[str] = None,
-        recursive: bool = True
+        recursive: bool = True,
+        fields: Optional[List[str]] = None
     ) -> List[ObsidianNote]:
         """
         List all notes in vault or specific folder.
 
+        Notes are read and parsed in parallel. With a `fields` projection
+        that leaves out `content` and `body`, notes come straight from the
+        vault index and their files are only read if the text is accessed.
+
         Args:
             folder: Folder path relative to vault root (None for all)
             recursive: Search subfolders
+            fields: Fields the caller needs, e.g. ["relative_path", "title"]
+                (None for full notes)
 
         Returns:
             List of ObsidianNote objects
         """
-        if folder:
-            search_path = self.vault_path / folder
-            self._validate_path(search_path)
-        else:
-            search_path = self.vault_path
-
-        if recursive:
-            files = search_path.rglob("*.md")
-        else:
-            files = search_path.glob("*.md")
-
-        notes = []
-        for file_path in files:
-            try:
-                note = self._parse_note(file_path)
-                notes.append(note)
-            except Exception as e:
-                if self.verbose:
-                    logger.warning(f"Failed to parse {file_path}: {e}")
-
-        return sorted(notes, key=lambda n: n.relative_path)
+        return list(self.iter_notes(folder, recursive, fields))
 
     def get_note(self, path_or_title: str) -> Optional[ObsidianNote]:
         """
@@ -188,56 +385,119 @@ class ObsidianClient:
             if file_path.exists():
                 return self._parse_note(file_path)
 
-        for md_file in self.vault_path.rglob("*.md"):
-            if md_file.stem == path_or_title:
-                return self._parse_note(md_file)
-
-        # Search by title in frontmatter
-        for md_file in self.vault_path.rglob("*.md"):
-            try:
-                note = self._parse_note(md_file)
-                if note.title == path_or_title:
-                    return note
-            except Exception:
-                continue
+        relative_path = self._resolve_name(path_or_title)
+        if relative_path is None:
+            return None
+
+        try:
+            return self._parse_note(self.vault_path / relative_path)
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def _resolve_name(self, name: str) -> Optional[str]:
+        """Relative path of the note with this filename stem or title (O(1) index lookup)."""
+        matches = self.index.resolve(name)
+        if len(matches) > 1:
+            logger.warning(f"Ambiguous note name '{name}' matches {', '.join(matches)}; using {matches[0]}")
+        return matches[0] if matches else None
+
+    def resolve_link(self, link_text: str) -> List[str]:
+        """
+        Resolve a wiki link target to note paths.
+
+        Args:
+            link_text: Link target from [[...]] (name, title or folder/name)
 
-        return None
+        Returns:
+            Relative paths, best match first (several if ambiguous)
+        """
+        return [
+            str(path.relative_to(self.vault_path))
+            for path in resolve_link(self.vault_path, link_text, self.index)
+        ]
 
     def search_notes(
         self,
         query: str,
         search_in: Literal["content", "title", "both"] = "both",
         case_sensitive: bool = False,
-        limit: int = 50
+        limit: int = 50,
+        fields: Optional[List[str]] = None
     ) -> List[ObsidianNote]:
         """
-        Search notes by text.
+        Search notes by text, best matches first.
+
+        Uses the vault's full-text index: every word must match (as a word
+        prefix), "quoted text" matches as a phrase and -word excludes notes.
+        Results are ranked with BM25, title matches weighing more, and carry
+        a `score` and a `snippet` of the matching text.
 
         Args:
             query: Search query
             search_in: Where to search
             case_sensitive: Case-sensitive search
             limit: Maximum results
+            fields: Fields the caller needs (see list_notes)
 
         Returns:
             List of matching notes
         """
-        file_paths = text_search(self.vault_path, query, search_in, case_sensitive)
+        if not self.index.fts:
+            return self._scan_search(query, search_in, case_sensitive, limit, fields)
+
+        expression = fts_query(query)
+        if not expression:
+            return []
+
+        columns = {"title": ["title"], "content": ["body"]}.get(search_in)
+        # Case-sensitive matches are a subset of the (case-insensitive) index hits
+        hits = self.index.search(expression, columns=columns, limit=None if case_sensitive else limit)
+
+        if case_sensitive:
+            terms, phrases, _ = parse_query(query)
+            hits = [hit for hit in hits if self._contains_case_sensitive(hit.path, terms + phrases, search_in)]
+            hits = hits[:limit]
 
+        hits_by_path = {hit.path: hit for hit in hits}
         notes = []
-        for file_path in file_paths[:limit]:
-            try:
-                note = self._parse_note(file_path)
-                notes.append(note)
-            except Exception:
-                continue
+        for note in self._notes(hits_by_path, fields):
+            hit = hits_by_path[note.relative_path]
+            note.score = round(hit.score, 4)
+            note.snippet = hit.snippet
+            notes.append(note)
 
         return notes
 
+    def _contains_case_sensitive(self, relative_path: str, words: List[str], search_in: str) -> bool:
+        """Whether a note's indexed text contains every word/phrase exactly."""
+        text = self.index.text(relative_path)
+        if text is None:
+            return False
+        title, body = text
+        haystack = {"title": title, "content": body}.get(search_in, f"{title}\n{body}")
+        return all(word in haystack for word in words)
+
+    def _scan_search(
+        self,
+        query: str,
+        search_in: Literal["content", "title", "both"],
+        case_sensitive: bool,
+        limit: int,
+        fields: Optional[List[str]] = None
+    ) -> List[ObsidianNote]:
+        """Substring search by reading every note (no full-text index)."""
+        file_paths = text_search(self.vault_path, query, search_in, case_sensitive)
+
+        return list(self._notes(
+            (str(file_path.relative_to(self.vault_path)) for file_path in file_paths[:limit]),
+            fields
+        ))
+
     def find_by_tag(
         self,
         tag: str,
-        exact_match: bool = False
+        exact_match: bool = False,
+        fields: Optional[List[str]] = None
     ) -> List[ObsidianNote]:
         """
         Find notes by tag.
@@ -245,33 +505,30 @@ class ObsidianClient:
         Args:
             tag: Tag to search for (e.g., "topic/ai" or "topic")
             exact_match: If False, match tag prefix
+            fields: Fields the caller needs (see list_notes)
 
         Returns:
             List of matching notes
         """
-        file_paths = tag_search(self.vault_path, tag, exact_match)
-
-        notes = []
-        for file_path in file_paths:
-            try:
-                note = self._parse_note(file_path)
-                notes.append(note)
-            except Exception:
-                continue
-
-        return notes
+        return list(self._notes(self.index.find_tag(tag, exact_match), fields))
 
     def find_by_tags(
         self,
         tags: List[str],
-        match_all: bool = True
+        match_all: bool = True,
+        fields: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None
     ) -> List[ObsidianNote]:
         """
         Find notes matching multiple tags.
 
+        Tags match hierarchically: `topic` also matches `topic/ai`.
+
         Args:
             tags: List of tags
             match_all: If True, note must have all tags (AND). If False, any tag (OR).
+            fields: Fields the caller needs (see list_notes)
+            exclude: Leave out notes with any of these tags (NOT)
 
         Returns:
             List of matching notes
@@ -279,27 +536,31 @@ class ObsidianClient:
         if not tags:
             return []
 
-        tag_results = [set(tag_search(self.vault_path, tag, exact_match=False)) for tag in tags]
-
         if match_all:
-            matching_paths = set.intersection(*tag_results)
+            matching_paths = self.index.query_tags(all_of=tags, none_of=exclude or ())
         else:
-            matching_paths = set.union(*tag_results)
+            matching_paths = self.index.query_tags(any_of=tags, none_of=exclude or ())
 
-        notes = []
-        for file_path in matching_paths:
-            try:
-                note = self._parse_note(file_path)
-                notes.append(note)
-            except Exception:
-                continue
+        return list(self._notes(matching_paths, fields))
 
-        return notes
+    def tag_counts(self, prefix: Optional[str] = None, rollup: bool = False) -> Dict[str, int]:
+        """
+        Count notes per tag, e.g. for tag facets.
+
+        Args:
+            prefix: Only this tag and the tags below it (e.g. "topic")
+            rollup: Count notes with child tags towards their parents too
+
+        Returns:
+            Tag (lower-cased) -> number of notes, sorted by tag
+        """
+        return self.index.tag_counts(prefix, rollup)
 
     def find_by_folder(
         self,
         folder: str,
-        recursive: bool = True
+        recursive: bool = True,
+        fields: Optional[List[str]] = None
     ) -> List[ObsidianNote]:
         """
         Find notes in a specific folder.
@@ -307,34 +568,25 @@ class ObsidianClient:
         Args:
             folder: Folder path relative to vault root
             recursive: Search subfolders
+            fields: Fields the caller needs (see list_notes)
 
         Returns:
             List of notes in folder
         """
-        return self.list_notes(folder=folder, recursive=recursive)
+        return self.list_notes(folder=folder, recursive=recursive, fields=fields)
 
-    def find_backlinks(self, note_path: str) -> List[ObsidianNote]:
+    def find_backlinks(self, note_path: str, fields: Optional[List[str]] = None) -> List[ObsidianNote]:
         """
         Find all notes that link to the specified note.
 
         Args:
             note_path: Relative path or title of note
+            fields: Fields the caller needs (see list_notes)
 
         Returns:
             List of notes linking to this note
         """
-        backlink_paths = self.link_index.get_backlinks(note_path)
-
-        notes = []
-        for rel_path in backlink_paths:
-            try:
-                file_path = self.vault_path / rel_path
-                note = self._parse_note(file_path)
-                notes.append(note)
-            except Exception:
-                continue
-
-        return notes
+        return list(self._notes(sorted(self.link_index.get_backlinks(note_path)), fields))
 
     def create_note(
         self,
@@ -361,15 +613,7 @@ class ObsidianClient:
         """
         self._check_read_only()
 
-        if not path.endswith('.md'):
-            path = f"{path}.md"
-
-        if folder:
-            file_path = self.vault_path / folder / Path(path).name
-        else:
-            file_path = self.vault_path / path
-
-        file_path = self._validate_path(file_path)
+        path, file_path = self._new_note_path(path, folder)
 
         if file_path.exists():
             return ObsidianOperationResult(
@@ -381,6 +625,38 @@ class ObsidianClient:
 
         self._ensure_folder_exists(file_path.parent)
 
+        full_content = self._new_note_content(content, title, tags, frontmatter)
+
+        file_path.write_text(full_content, encoding='utf-8')
+        self._reindex(str(file_path.relative_to(self.vault_path)))
+
+        return ObsidianOperationResult(
+            success=True,
+            operation="create",
+            message=f"Note created: {path}",
+            note_path=str(file_path.relative_to(self.vault_path))
+        )
+
+    def _new_note_path(self, path: str, folder: Optional[str] = None) -> Tuple[str, Path]:
+        """Path (with .md) and validated file of a note to create."""
+        if not path.endswith('.md'):
+            path = f"{path}.md"
+
+        if folder:
+            file_path = self.vault_path / folder / Path(path).name
+        else:
+            file_path = self.vault_path / path
+
+        return path, self._validate_path(file_path)
+
+    @staticmethod
+    def _new_note_content(
+        content: str,
+        title: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        frontmatter: Optional[Dict] = None
+    ) -> str:
+        """Full text of a new note."""
         fm = frontmatter or {}
         fm['created'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         fm['modified'] = fm['created']
@@ -391,18 +667,30 @@ class ObsidianClient:
         if tags:
             fm['tags'] = tags
 
-        full_content = serialize_frontmatter(fm) + "\n" + content
+        return serialize_frontmatter(fm) + "\n" + content
 
-        file_path.write_text(full_content, encoding='utf-8')
+    @staticmethod
+    def _updated_note_content(
+        existing_fm: Dict,
+        existing_body: str,
+        content: Optional[str] = None,
+        frontmatter: Optional[Dict] = None,
+        merge_frontmatter_flag: bool = True
+    ) -> str:
+        """Full text of a note after update_note."""
+        if frontmatter:
+            if merge_frontmatter_flag:
+                new_fm = merge_frontmatter(existing_fm, frontmatter)
+            else:
+                new_fm = frontmatter.copy()
+                new_fm['modified'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        else:
+            new_fm = existing_fm.copy()
+            new_fm['modified'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        self.link_index.build_index(self.vault_path)
+        new_body = content if content is not None else existing_body
 
-        return ObsidianOperationResult(
-            success=True,
-            operation="create",
-            message=f"Note created: {path}",
-            note_path=str(file_path.relative_to(self.vault_path))
-        )
+        return serialize_frontmatter(new_fm) + "\n" + new_body
 
     def update_note(
         self,
@@ -433,23 +721,12 @@ class ObsidianClient:
                 message=f"Note not found: {path}"
             )
 
-        existing_fm, existing_body = parse_frontmatter(note.content)
-
-        if frontmatter:
-            if merge_frontmatter_flag:
-                new_fm = merge_frontmatter(existing_fm, frontmatter)
-            else:
-                new_fm = frontmatter.copy()
-                new_fm['modified'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        else:
-            new_fm = existing_fm.copy()
-            new_fm['modified'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        new_body = content if content is not None else existing_body
-
-        full_content = serialize_frontmatter(new_fm) + "\n" + new_body
+        full_content = self._updated_note_content(
+            note.frontmatter, note.body, content, frontmatter, merge_frontmatter_flag
+        )
 
         note.path.write_text(full_content, encoding='utf-8')
+        self._reindex(note.relative_path)
 
         return ObsidianOperationResult(
             success=True,
@@ -496,12 +773,13 @@ class ObsidianClient:
         start_idx, end_idx = section_range
         new_body = note.body[:start_idx] + "\n" + new_content + "\n" + note.body[end_idx:]
 
-        frontmatter, _ = parse_frontmatter(note.content)
+        frontmatter = note.frontmatter
         frontmatter['modified'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         full_content = serialize_frontmatter(frontmatter) + "\n" + new_body
 
         note.path.write_text(full_content, encoding='utf-8')
+        self._reindex(note.relative_path)
 
         return ObsidianOperationResult(
             success=True,
@@ -535,13 +813,14 @@ class ObsidianClient:
                 message=f"Note not found: {path}"
             )
 
-        frontmatter, body = parse_frontmatter(note.content)
+        frontmatter, body = note.frontmatter, note.body
         frontmatter['modified'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         new_body = body.rstrip() + "\n\n" + content
         full_content = serialize_frontmatter(frontmatter) + "\n" + new_body
 
         note.path.write_text(full_content, encoding='utf-8')
+        self._reindex(note.relative_path)
 
         return ObsidianOperationResult(
             success=True,
@@ -567,61 +846,89 @@ class ObsidianClient:
         Returns:
             Operation result with affected files
         """
-        self._check_read_only()
+        return self.move_notes([(source, destination)], update_links=update_links)[0]
 
-        note = self.get_note(source)
-        if not note:
-            return ObsidianOperationResult(
-                success=False,
-                operation="move",
-                message=f"Note not found: {source}"
-            )
+    def move_notes(
+        self,
+        moves: List[Tuple[str, str]],
+        update_links: Optional[bool] = None
+    ) -> List[ObsidianOperationResult]:
+        """
+        Move or rename several notes, updating wiki links in one pass.
 
-        if not destination.endswith('.md'):
-            destination = f"{destination}.md"
+        Only notes that link to a moved note are rewritten, each of them once.
 
-        dest_path = self.vault_path / destination
-        dest_path = self._validate_path(dest_path)
+        Args:
+            moves: (source path or title, destination path) pairs
+            update_links: Update wiki links (uses auto_update_links if None)
 
-        if dest_path.exists():
-            return ObsidianOperationResult(
-                success=False,
-                operation="move",
-                message=f"Destination already exists: {destination}"
-            )
+        Returns:
+            One operation result per move, in order
+        """
+        self._check_read_only()
 
-        self._ensure_folder_exists(dest_path.parent)
+        results: List[ObsidianOperationResult] = []
+        moved: Dict[str, ObsidianOperationResult] = {}
+        should_update_links = update_links if update_links is not None else self.auto_update_links
 
-        old_title = note.path.stem
-        new_title = dest_path.stem
-        old_relative = note.relative_path
-        new_relative = str(dest_path.relative_to(self.vault_path))
+        with self.batch():
+            for source, destination in moves:
+                note = self.get_note(source)
+                if not note:
+                    results.append(ObsidianOperationResult(
+                        success=False,
+                        operation="move",
+                        message=f"Note not found: {source}"
+                    ))
+                    continue
 
-        note.path.rename(dest_path)
+                if not destination.endswith('.md'):
+                    destination = f"{destination}.md"
 
-        affected_files = []
-        should_update_links = update_links if update_links is not None else self.auto_update_links
+                dest_path = self.vault_path / destination
+                dest_path = self._validate_path(dest_path)
 
-        if should_update_links and old_title != new_title:
-            if self.verbose:
-                logger.info(f"Updating links: {old_title} -> {new_title}")
-            affected_files = update_links_after_move(
-                self.vault_path,
-                old_relative,
-                new_relative,
-                old_title,
-                new_title
-            )
+                if dest_path.exists():
+                    results.append(ObsidianOperationResult(
+                        success=False,
+                        operation="move",
+                        message=f"Destination already exists: {destination}"
+                    ))
+                    continue
 
-        self.link_index.build_index(self.vault_path)
+                self._ensure_folder_exists(dest_path.parent)
 
-        return ObsidianOperationResult(
-            success=True,
-            operation="move",
-            message=f"Note moved: {old_relative} -> {new_relative}",
-            note_path=new_relative,
-            affected_files=affected_files
-        )
+                old_relative = note.relative_path
+                new_relative = str(dest_path.relative_to(self.vault_path))
+
+                note.path.rename(dest_path)
+                self._reindex(old_relative, new_relative)
+
+                result = ObsidianOperationResult(
+                    success=True,
+                    operation="move",
+                    message=f"Note moved: {old_relative} -> {new_relative}",
+                    note_path=new_relative,
+                    affected_files=[]
+                )
+                results.append(result)
+
+                if should_update_links and note.path.stem != dest_path.stem:
+                    if self.verbose:
+                        logger.info(f"Updating links: {note.path.stem} -> {dest_path.stem}")
+                    moved[old_relative] = result
+
+            if moved:
+                affected = update_links_after_moves(
+                    self.vault_path,
+                    [(old_relative, result.note_path) for old_relative, result in moved.items()],
+                    self.link_index
+                )
+                for old_relative, result in moved.items():
+                    result.affected_files = affected[old_relative]
+                self._reindex(*sorted({path for paths in affected.values() for path in paths}))
+
+        return results
 
     def add_tag(
         self,
@@ -656,7 +963,7 @@ class ObsidianClient:
                 message=f"Note not found: {path}"
             )
 
-        frontmatter, body = parse_frontmatter(note.content)
+        frontmatter, body = note.frontmatter, note.body
 
         existing_tags = frontmatter.get('tags', [])
         if isinstance(existing_tags, str):
@@ -669,6 +976,7 @@ class ObsidianClient:
         full_content = serialize_frontmatter(frontmatter) + "\n" + body
 
         note.path.write_text(full_content, encoding='utf-8')
+        self._reindex(note.relative_path)
 
         return ObsidianOperationResult(
             success=True,
@@ -702,7 +1010,7 @@ class ObsidianClient:
                 message=f"Note not found: {path}"
             )
 
-        frontmatter, body = parse_frontmatter(note.content)
+        frontmatter, body = note.frontmatter, note.body
 
         existing_tags = frontmatter.get('tags', [])
         if isinstance(existing_tags, str):
@@ -715,6 +1023,7 @@ class ObsidianClient:
         full_content = serialize_frontmatter(frontmatter) + "\n" + body
 
         note.path.write_text(full_content, encoding='utf-8')
+        self._reindex(note.relative_path)
 
         return ObsidianOperationResult(
             success=True,
@@ -748,13 +1057,14 @@ class ObsidianClient:
                 message=f"Note not found: {path}"
             )
 
-        frontmatter, body = parse_frontmatter(note.content)
+        frontmatter, body = note.frontmatter, note.body
         frontmatter['tags'] = tags
         frontmatter['modified'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         full_content = serialize_frontmatter(frontmatter) + "\n" + body
 
         note.path.write_text(full_content, encoding='utf-8')
+        self._reindex(note.relative_path)
 
         return ObsidianOperationResult(
             success=True,
@@ -794,7 +1104,7 @@ class ObsidianClient:
 
         link_text = f"[[{target_note}]]"
 
-        frontmatter, body = parse_frontmatter(note.content)
+        frontmatter, body = note.frontmatter, note.body
 
         if position == "end":
             new_body = body.rstrip() + f"\n\n{link_text}"
@@ -816,8 +1126,7 @@ class ObsidianClient:
         full_content = serialize_frontmatter(frontmatter) + "\n" + new_body
 
         note.path.write_text(full_content, encoding='utf-8')
-
-        self.link_index.build_index(self.vault_path)
+        self._reindex(note.relative_path)
 
         return ObsidianOperationResult(
             success=True,
@@ -859,12 +1168,13 @@ class ObsidianClient:
             groups: Dict[str, List[str]] = {}
 
             for note_path in linked_notes:
-                note = self.get_note(note_path)
-                if not note:
+                matches = resolve_link(self.vault_path, note_path, self.index)
+                entry = self.index.get(str(matches[0].relative_to(self.vault_path))) if matches else None
+                if not entry:
                     continue
 
                 tag_found = False
-                for tag in note.tags:
+                for tag in entry.tags:
                     if tag.startswith(f"{group_by_tag}/"):
                         group_name = tag
                         if group_name not in groups:
@@ -938,46 +1248,209 @@ class ObsidianClient:
         plan: ObsidianChangesPlan
     ) -> List[ObsidianOperationResult]:
         """
-        Execute a change plan.
+        Execute a change plan as one transaction: all of it or nothing.
+
+        Every operation is checked and its outcome computed in memory
+        before anything is written; if one fails, none is applied. The new
+        note texts are then written to temp files in parallel and swapped
+        in with atomic renames, backed by a rollback journal, and the
+        indexes are updated once (see ObsidianTransaction).
 
         Args:
             plan: Change plan to execute
 
         Returns:
-            List of operation results
+            One result per operation, in order; if any operation (or the
+            commit) failed, every result has success=False
         """
-        results = []
+        self._check_read_only()
 
-        for op in plan.operations:
-            if op.action == "create":
-                result = self.create_note(
-                    path=op.target_path,
-                    content=op.changes.get('content', '') if op.changes else '',
-                    **op.changes if op.changes else {}
-                )
-            elif op.action == "update":
-                result = self.update_note(
-                    path=op.target_path,
-                    **op.changes if op.changes else {}
-                )
-            elif op.action == "move":
-                result = self.move_note(
-                    source=op.changes.get('source') if op.changes else op.target_path,
-                    destination=op.target_path
-                )
-            elif op.action == "delete":
-                result = ObsidianOperationResult(
+        transaction = VaultTransaction(self.vault_path)
+        results = [self._stage_operation(transaction, op) for op in plan.operations]
+
+        failed = [str(number) for number, result in enumerate(results, 1) if not result.success]
+        if failed:
+            return [
+                result if not result.success else ObsidianOperationResult(
                     success=False,
-                    operation="delete",
-                    message="Delete operation not implemented for safety"
+                    operation=result.operation,
+                    message=f"Not applied: plan operation(s) {', '.join(failed)} failed",
+                    note_path=result.note_path
                 )
-            else:
-                result = ObsidianOperationResult(
+                for result in results
+            ]
+
+        try:
+            transaction.commit()
+        except OSError as e:
+            logger.error(f"Plan rolled back: {e}")
+            return [
+                ObsidianOperationResult(
                     success=False,
-                    operation=op.action,
-                    message=f"Unknown operation: {op.action}"
+                    operation=result.operation,
+                    message=f"Not applied: plan rolled back ({e})",
+                    note_path=result.note_path
                 )
+                for result in results
+            ]
 
-            results.append(result)
+        with self.batch():
+            self._reindex(*transaction.changed_paths())
 
         return results
+
+    def _stage_operation(self, transaction: VaultTransaction, op: PlannedOperation) -> ObsidianOperationResult:
+        """Check one planned operation and stage its changes."""
+        changes = dict(op.changes or {})
+
+        try:
+            if op.action == "create":
+                return self._stage_create(transaction, op.target_path, **changes)
+            if op.action == "update":
+                return self._stage_update(transaction, op.target_path, **changes)
+            if op.action == "move":
+                return self._stage_move(transaction, changes.get('source', op.target_path), op.target_path)
+        except TypeError as e:
+            message = f"Invalid changes for {op.action}: {e}"
+        except (ValueError, OSError) as e:
+            message = str(e)
+        else:
+            if op.action == "delete":
+                message = "Delete operation not implemented for safety"
+            else:
+                message = f"Unknown operation: {op.action}"
+
+        return ObsidianOperationResult(
+            success=False,
+            operation=op.action,
+            message=message
+        )
+
+    def _stage_target(self, transaction: VaultTransaction, path_or_title: str) -> Optional[str]:
+        """Relative path of an existing note, as of the staged changes (see get_note)."""
+        candidates = [path_or_title]
+        if not path_or_title.endswith('.md'):
+            candidates.append(f"{path_or_title}.md")
+
+        for candidate in candidates:
+            relative_path = str(self._validate_path(self.vault_path / candidate).relative_to(self.vault_path))
+            if relative_path.endswith('.md') and transaction.exists(relative_path):
+                return relative_path
+
+        matches = transaction.resolve(path_or_title, self.index.resolve(path_or_title))
+        if len(matches) > 1:
+            logger.warning(f"Ambiguous note name '{path_or_title}' matches {', '.join(matches)}; using {matches[0]}")
+        return matches[0] if matches else None
+
+    def _stage_create(
+        self,
+        transaction: VaultTransaction,
+        path: str,
+        content: str = '',
+        title: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        frontmatter: Optional[Dict] = None,
+        folder: Optional[str] = None
+    ) -> ObsidianOperationResult:
+        path, file_path = self._new_note_path(path, folder)
+        relative_path = str(file_path.relative_to(self.vault_path))
+
+        if transaction.exists(relative_path):
+            return ObsidianOperationResult(
+                success=False,
+                operation="create",
+                message=f"Note already exists: {path}",
+                note_path=relative_path
+            )
+
+        transaction.write(relative_path, self._new_note_content(content, title, tags, frontmatter))
+
+        return ObsidianOperationResult(
+            success=True,
+            operation="create",
+            message=f"Note created: {path}",
+            note_path=relative_path
+        )
+
+    def _stage_update(
+        self,
+        transaction: VaultTransaction,
+        path: str,
+        content: Optional[str] = None,
+        frontmatter: Optional[Dict] = None,
+        merge_frontmatter_flag: bool = True
+    ) -> ObsidianOperationResult:
+        relative_path = self._stage_target(transaction, path)
+        if relative_path is None:
+            return ObsidianOperationResult(
+                success=False,
+                operation="update",
+                message=f"Note not found: {path}"
+            )
+
+        existing_fm, existing_body = parse_frontmatter(transaction.read(relative_path))
+        transaction.write(relative_path, self._updated_note_content(
+            existing_fm, existing_body, content, frontmatter, merge_frontmatter_flag
+        ))
+
+        return ObsidianOperationResult(
+            success=True,
+            operation="update",
+            message=f"Note updated: {relative_path}",
+            note_path=relative_path
+        )
+
+    def _stage_move(self, transaction: VaultTransaction, source: str, destination: str) -> ObsidianOperationResult:
+        old_relative = self._stage_target(transaction, source)
+        if old_relative is None:
+            return ObsidianOperationResult(
+                success=False,
+                operation="move",
+                message=f"Note not found: {source}"
+            )
+
+        if not destination.endswith('.md'):
+            destination = f"{destination}.md"
+
+        dest_path = self._validate_path(self.vault_path / destination)
+        new_relative = str(dest_path.relative_to(self.vault_path))
+
+        if transaction.exists(new_relative):
+            return ObsidianOperationResult(
+                success=False,
+                operation="move",
+                message=f"Destination already exists: {destination}"
+            )
+
+        transaction.move(old_relative, new_relative)
+        affected = []
+
+        if self.auto_update_links and Path(old_relative).stem != dest_path.stem:
+            if self.verbose:
+                logger.info(f"Updating links: {Path(old_relative).stem} -> {dest_path.stem}")
+
+            renames = link_renames(old_relative, new_relative)
+            old_targets = [old for old, _ in renames]
+            # Notes linking to it on disk (wherever the plan puts them) and
+            # notes the plan itself writes
+            candidates = {
+                transaction.location(path) for path in self.link_index.sources_for(old_targets)
+            }
+            candidates.update(transaction.links.sources_for(old_targets))
+
+            for relative_path in sorted(path for path in candidates if path and transaction.exists(path)):
+                content = transaction.read(relative_path)
+                updated = content
+                for old_target, new_target in renames:
+                    updated = update_link_in_content(updated, old_target, new_target)
+                if updated != content:
+                    transaction.write(relative_path, updated)
+                    affected.append(relative_path)
+
+        return ObsidianOperationResult(
+            success=True,
+            operation="move",
+            message=f"Note moved: {old_relative} -> {new_relative}",
+            note_path=new_relative,
+            affected_files=affected
+        )
@@ -1,31 +1,160 @@
 """
 Data models for Obsidian vault operations.
 """
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Literal, Optional, Tuple
+
+_MISSING = object()
+
+NOTE_FIELDS = (
+    "path", "relative_path", "title", "frontmatter", "content", "body", "headings",
+    "tags", "links", "backlinks", "created_at", "updated_at", "score", "snippet",
+)
+# Fields that need the note file itself, not just the vault index
+TEXT_FIELDS = frozenset({"content", "body"})
+LAZY_FIELDS = (
+    "title", "frontmatter", "content", "body", "headings", "tags", "links",
+    "backlinks", "created_at", "updated_at",
+)
+
+
+def check_fields(fields: Optional[Iterable[str]]) -> Optional[Tuple[str, ...]]:
+    """
+    Validate a `fields=` projection.
+
+    Args:
+        fields: Note field names, or None for all fields
+
+    Returns:
+        The field names as a tuple (None stays None)
+
+    Raises:
+        ValueError: On unknown field names
+    """
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = [name.strip() for name in fields.split(',') if name.strip()]
+    fields = tuple(fields)
+    unknown = [name for name in fields if name not in NOTE_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown note fields: {', '.join(unknown)} (available: {', '.join(NOTE_FIELDS)})")
+    return fields
+
+
+def _lazy_field(name: str) -> property:
+    slot = f"_{name}"
+
+    def get(self):
+        value = getattr(self, slot)
+        if value is _MISSING:
+            self._load(name)
+            value = getattr(self, slot)
+        return value
+
+    def set(self, value):
+        setattr(self, slot, value)
+
+    return property(get, set)
 
 
-@dataclass
 class ObsidianNote:
-    """Represents an Obsidian note."""
-    path: Path
-    relative_path: str
-    title: str
-    frontmatter: Dict
-    content: str
-    body: str
-    headings: List[Tuple[int, str]]
-    tags: List[str]
-    links: List[str]
-    created_at: str
-    updated_at: str
-    backlinks: List[str] = field(default_factory=list)
+    """
+    Represents an Obsidian note.
 
-    def dict(self) -> Dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
+    Fields left out of the constructor are filled in on first access by
+    `loader`, a callable returning a dict of field values. Notes built from
+    the vault index use this to read the note file only if `content` or
+    `body` is actually used.
+    """
+
+    __slots__ = ("path", "relative_path", "score", "snippet", "_loader") + tuple(f"_{name}" for name in LAZY_FIELDS)
+
+    def __init__(
+        self,
+        path: Path,
+        relative_path: str,
+        title: str = _MISSING,
+        frontmatter: Dict = _MISSING,
+        content: str = _MISSING,
+        body: str = _MISSING,
+        headings: List[Tuple[int, str]] = _MISSING,
+        tags: List[str] = _MISSING,
+        links: List[str] = _MISSING,
+        created_at: str = _MISSING,
+        updated_at: str = _MISSING,
+        backlinks: Optional[List[str]] = None,
+        score: Optional[float] = None,  # Search relevance (search results only)
+        snippet: Optional[str] = None,  # Matching excerpt (search results only)
+        loader: Optional[Callable[[], Dict]] = None
+    ):
+        self.path = path
+        self.relative_path = relative_path
+        self._title = title
+        self._frontmatter = frontmatter
+        self._content = content
+        self._body = body
+        self._headings = headings
+        self._tags = tags
+        self._links = links
+        self._created_at = created_at
+        self._updated_at = updated_at
+        if backlinks is None:
+            backlinks = _MISSING if loader else []
+        self._backlinks = backlinks
+        self.score = score
+        self.snippet = snippet
+        self._loader = loader
+
+    title = _lazy_field("title")
+    frontmatter = _lazy_field("frontmatter")
+    content = _lazy_field("content")
+    body = _lazy_field("body")
+    headings = _lazy_field("headings")
+    tags = _lazy_field("tags")
+    links = _lazy_field("links")
+    backlinks = _lazy_field("backlinks")
+    created_at = _lazy_field("created_at")
+    updated_at = _lazy_field("updated_at")
+
+    def _load(self, name: str) -> None:
+        if self._loader is None:
+            raise AttributeError(f"Note field not loaded: {name}")
+        values = self._loader()
+        self._loader = None
+        for field_name in LAZY_FIELDS:
+            if getattr(self, f"_{field_name}") is _MISSING and field_name in values:
+                setattr(self, f"_{field_name}", values[field_name])
+        if getattr(self, f"_{name}") is _MISSING:
+            raise AttributeError(f"Note field not loaded: {name}")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ObsidianNote):
+            return NotImplemented
+        return self.dict() == other.dict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ObsidianNote(relative_path={self.relative_path!r}, title={self.title!r})"
+
+    def dict(self, fields: Optional[Iterable[str]] = None) -> Dict:
+        """
+        Convert to dictionary for JSON serialization.
+
+        Args:
+            fields: Only include (and, for lazy notes, only load) these
+                fields; see NOTE_FIELDS
+        """
+        if fields is not None:
+            return {
+                name: str(self.path) if name == "path" else getattr(self, name)
+                for name in check_fields(fields)
+            }
+
+        data = {
             "path": str(self.path),
             "relative_path": self.relative_path,
             "title": self.title,
@@ -39,6 +168,10 @@ class ObsidianNote:
             "created_at": self.created_at,
             "updated_at": self.updated_at,
         }
+        if self.score is not None:
+            data["score"] = self.score
+            data["snippet"] = self.snippet
+        return data
 
 
 @dataclass
@@ -0,0 +1,756 @@
+"""
+Persistent vault index for Obsidian vault operations.
+
+Stores one row per note (path, mtime, size, title, frontmatter, tags,
+headings and links) in SQLite, so listings, tag queries, title lookups and
+the link index are answered without re-reading the vault. `refresh()` walks
+the vault and only re-parses notes whose mtime or size changed; the client's
+own writes update single entries with `update()`. Every change is also
+recorded in a change log, so `changes_since()` can hand incremental jobs
+just the notes that changed since their last run.
+
+Indexes live under `~/.superskills/cache/obsidian/`, one per vault.
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .ObsidianParallel import parse_notes
+from .ObsidianParser import analyze_note, file_key
+from .ObsidianTags import TagIndex
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 3
+CACHE_DIR = Path.home() / ".superskills" / "cache" / "obsidian"
+
+# Cached indexes not opened for this long are deleted, in seconds
+CACHE_MAX_AGE = 90 * 24 * 3600
+# An index's last-opened time is recorded at most this often
+_OPENED_RESOLUTION = 24 * 3600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS notes (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    ctime REAL NOT NULL,
+    stem TEXT NOT NULL,
+    title TEXT NOT NULL,
+    frontmatter TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    headings TEXT NOT NULL,
+    links TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS note_tags (
+    note_id INTEGER NOT NULL REFERENCES notes(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS note_tags_tag ON note_tags(tag);
+CREATE INDEX IF NOT EXISTS note_tags_note ON note_tags(note_id);
+CREATE TABLE IF NOT EXISTS changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL UNIQUE,
+    removed INTEGER NOT NULL
+);
+"""
+
+# Full-text index: title (plus filename) and body per note, rowid = notes.id.
+# FTS5 keeps positional postings, so it answers phrase queries and ranks
+# with BM25; it also stores the text, so snippets need no file reads.
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
+    title, body, tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS notes_fts_delete AFTER DELETE ON notes BEGIN
+    DELETE FROM notes_fts WHERE rowid = old.id;
+END;
+"""
+
+# Relative weight of title matches over body matches in BM25 ranking
+TITLE_WEIGHT = 5.0
+
+
+@dataclass(frozen=True)
+class IndexedNote:
+    """Indexed metadata of one note."""
+    path: str
+    mtime_ns: int
+    size: int
+    ctime: float
+    stem: str
+    title: str
+    frontmatter: Dict
+    tags: List[str]
+    headings: List[Tuple[int, str]]
+    links: List[str]
+
+    @property
+    def mtime(self) -> float:
+        return self.mtime_ns / 1e9
+
+
+@dataclass(frozen=True)
+class TextHit:
+    """A full-text search hit."""
+    path: str
+    title: str
+    score: float
+    snippet: str
+
+
+@dataclass(frozen=True)
+class ChangeFeed:
+    """Notes changed since a change-feed cursor."""
+    cursor: str
+    updated: List[str]
+    removed: List[str]
+    # The cursor belonged to another (or a rebuilt) index: `updated` lists
+    # every note and removals are unknown
+    reset: bool = False
+
+
+def default_index_path(vault_path: Path) -> Path:
+    """
+    Where the index for a vault is stored.
+
+    Indexes are kept per machine under ~/.superskills rather than in the
+    vault's `.obsidian` folder, which sync services copy between machines
+    (a synced SQLite file can be corrupted, and mtimes differ per machine).
+
+    Args:
+        vault_path: Resolved vault root
+
+    Returns:
+        Path of the index database for this vault
+    """
+    digest = hashlib.sha1(str(vault_path).encode('utf-8')).hexdigest()[:16]
+    return CACHE_DIR / f"{digest}.db"
+
+
+def _prune_cache(index_path: Path, vault_path: Path) -> None:
+    """
+    Record when a cached index was last opened, and delete cached indexes
+    that have not been opened for CACHE_MAX_AGE. A vault that is missing
+    for now (an unmounted drive, a sync folder) keeps its index.
+    """
+    registry_path = index_path.parent / "vaults.json"
+    try:
+        registry = json.loads(registry_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        registry = {}
+
+    now = time.time()
+    entry = registry.get(index_path.name)
+    if (isinstance(entry, dict) and entry.get('vault') == str(vault_path)
+            and now - entry.get('opened', 0) < _OPENED_RESOLUTION):
+        return
+
+    for name, other in list(registry.items()):
+        if not isinstance(other, dict):
+            # Registries from before opened times were kept: start counting now
+            registry[name] = other = {'vault': other, 'opened': now}
+        if name != index_path.name and now - other.get('opened', now) > CACHE_MAX_AGE:
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    (index_path.parent / f"{name}{suffix}").unlink()
+                except OSError:
+                    pass
+            del registry[name]
+
+    registry[index_path.name] = {'vault': str(vault_path), 'opened': now}
+    try:
+        tmp_path = registry_path.with_name(f".{registry_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(registry, indent=2), encoding='utf-8')
+        os.replace(tmp_path, registry_path)
+    except OSError as e:
+        logger.debug(f"Cannot update {registry_path}: {e}")
+
+
+class VaultIndex:
+    """SQLite index of note metadata, refreshed incrementally by mtime."""
+
+    def __init__(self, vault_path: Path, index_path: Optional[Path] = None):
+        """
+        Open (or create) the index for a vault.
+
+        Args:
+            vault_path: Resolved vault root
+            index_path: Index database file (default: see default_index_path)
+        """
+        self.vault_path = Path(vault_path)
+        self.index_path = Path(index_path) if index_path else default_index_path(self.vault_path)
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        # path -> (stem, title) and lower-cased stem/title -> paths, built on
+        # first lookup and kept current by every write (see resolve)
+        self._names: Optional[Dict[str, Tuple[str, str]]] = None
+        self._stems: Dict[str, Set[str]] = {}
+        self._titles: Dict[str, Set[str]] = {}
+        # Tag posting bitmaps, built on first tag query (see find_tag)
+        self._tag_index: Optional[TagIndex] = None
+        self.conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            if self.index_path.parent == CACHE_DIR:
+                _prune_cache(self.index_path, self.vault_path)
+            conn = self._open(str(self.index_path))
+        except (OSError, sqlite3.Error) as e:
+            # An index is a cache: fall back to memory rather than fail
+            logger.warning(f"Cannot open vault index at {self.index_path} ({e}); using an in-memory index")
+            conn = self._open(":memory:")
+        return conn
+
+    def _open(self, database: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(database, check_same_thread=False)
+        conn.execute("PRAGMA foreign_keys = ON")
+        if database != ":memory:":
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+
+        version = None
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            version = int(row[0]) if row else None
+        except sqlite3.Error:
+            pass
+
+        if version != SCHEMA_VERSION:
+            try:
+                # Drop the virtual table before its shadow tables
+                conn.execute("DROP TABLE IF EXISTS notes_fts")
+            except sqlite3.Error:
+                pass
+            for (table,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall():
+                if not table.startswith('sqlite_'):
+                    conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+
+        conn.executescript(SCHEMA)
+        try:
+            conn.executescript(FTS_SCHEMA)
+            self.fts = True
+        except sqlite3.OperationalError as e:
+            # SQLite built without FTS5: search falls back to scanning files
+            logger.debug(f"Full-text index unavailable: {e}")
+            self.fts = False
+        conn.execute("INSERT OR REPLACE INTO meta(key, value) VALUES ('schema_version', ?)",
+                     (str(SCHEMA_VERSION),))
+        # Identifies this change log: cursors from a rebuilt index are invalid
+        conn.execute("INSERT OR IGNORE INTO meta(key, value) VALUES ('feed_id', ?)", (uuid.uuid4().hex,))
+        self.feed_id = conn.execute("SELECT value FROM meta WHERE key = 'feed_id'").fetchone()[0]
+        conn.commit()
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self) -> 'VaultIndex':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group index updates into one transaction.
+
+        Inside the block, update() and remove() do not commit; everything
+        is committed once when the outermost block exits (or rolled back
+        if it raises). Holds the index lock for the duration.
+        """
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield
+            except BaseException:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.conn.rollback()
+                    self._names = None
+                    self._tag_index = None
+                raise
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.conn.commit()
+
+    def _commit(self) -> None:
+        if not self._batch_depth:
+            self.conn.commit()
+
+    # -- Maintenance -------------------------------------------------------
+
+    def scan(self) -> Dict[str, os.stat_result]:
+        """
+        Walk the vault for Markdown notes.
+
+        Hidden folders (`.obsidian`, `.trash`, `.git`, ...) are skipped, as
+        Obsidian itself does.
+
+        Returns:
+            Relative path -> stat result
+        """
+        found: Dict[str, os.stat_result] = {}
+        stack = [str(self.vault_path)]
+        root_len = len(str(self.vault_path)) + 1
+
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.'):
+                            continue
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.name.endswith('.md') and entry.is_file():
+                                found[entry.path[root_len:]] = entry.stat()
+                        except OSError:
+                            continue
+            except OSError as e:
+                logger.debug(f"Cannot list {directory}: {e}")
+
+        return found
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Bring the index up to date with the vault.
+
+        Only notes whose mtime or size changed are read and parsed, in
+        parallel (see ObsidianParallel.parse_notes).
+
+        Returns:
+            Counts: 'notes' (in vault), 'updated' (re-parsed), 'removed'
+        """
+        on_disk = self.scan()
+
+        with self._lock:
+            known = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in self.conn.execute("SELECT path, mtime_ns, size FROM notes")
+            }
+
+            changed = [
+                path for path, stat in on_disk.items()
+                if known.get(path) != (stat.st_mtime_ns, stat.st_size)
+            ]
+
+            updated = 0
+            for path, parsed in zip(changed, parse_notes(self.vault_path / path for path in changed)):
+                if parsed.error is not None:
+                    logger.debug(f"Cannot index {path}: {parsed.error}")
+                    self._delete(path)
+                    continue
+                self._store(path, parsed.stat, parsed.fields)
+                updated += 1
+
+            removed = [path for path in known if path not in on_disk]
+            for path in removed:
+                self._delete(path)
+
+            self._commit()
+
+        if updated or removed:
+            logger.debug(f"Vault index refreshed: {updated} updated, {len(removed)} removed")
+
+        return {'notes': len(on_disk), 'updated': updated, 'removed': len(removed)}
+
+    def update(self, path: str) -> Optional[IndexedNote]:
+        """
+        Re-index one note after it was written, or drop it if it is gone.
+
+        Args:
+            path: Path relative to the vault root
+
+        Returns:
+            The indexed note, or None if it no longer exists
+        """
+        try:
+            stat = os.stat(self.vault_path / path)
+        except OSError:
+            self.remove(path)
+            return None
+
+        with self._lock:
+            self._index_file(path, stat)
+            self._commit()
+        return self.get(path)
+
+    def update_many(self, paths: Iterable[str]) -> Dict[str, IndexedNote]:
+        """
+        Re-index several notes (see update), reading and parsing them in
+        parallel and committing once.
+
+        Args:
+            paths: Paths relative to the vault root
+
+        Returns:
+            Path -> indexed note, for the notes that still exist
+        """
+        paths = list(dict.fromkeys(paths))
+        existing = [path for path in paths if (self.vault_path / path).is_file()]
+
+        with self._lock:
+            for path in paths:
+                if path not in existing:
+                    self._delete(path)
+            for path, parsed in zip(existing, parse_notes(self.vault_path / path for path in existing)):
+                if parsed.error is not None:
+                    logger.debug(f"Cannot index {path}: {parsed.error}")
+                    self._delete(path)
+                    continue
+                self._store(path, parsed.stat, parsed.fields)
+            self._commit()
+
+        return self.get_many(existing)
+
+    def remove(self, path: str) -> None:
+        """Drop one note from the index."""
+        with self._lock:
+            self._delete(path)
+            self._commit()
+
+    def _index_file(self, path: str, stat: os.stat_result) -> bool:
+        try:
+            content = (self.vault_path / path).read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            logger.debug(f"Cannot index {path}: {e}")
+            self._delete(path)
+            return False
+
+        fields = analyze_note(content, Path(path).stem, file_key(self.vault_path / path, stat))
+        self._store(path, stat, fields)
+        return True
+
+    def _store(self, path: str, stat: os.stat_result, fields: Dict) -> None:
+        stem = Path(path).stem
+        self._unindex(path)
+        self._record(path, removed=False)
+        cursor = self.conn.execute(
+            "INSERT INTO notes(path, mtime_ns, size, ctime, stem, title, frontmatter, tags, headings, links) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                path, stat.st_mtime_ns, stat.st_size, stat.st_ctime, stem, fields['title'],
+                json.dumps(fields['frontmatter'], default=str),
+                json.dumps(fields['tags']),
+                json.dumps(fields['headings']),
+                json.dumps(fields['links']),
+            )
+        )
+        self.conn.executemany(
+            "INSERT INTO note_tags(note_id, tag) VALUES (?, ?)",
+            [(cursor.lastrowid, tag.lower()) for tag in set(fields['tags'])]
+        )
+        if self.fts:
+            self.conn.execute(
+                "INSERT INTO notes_fts(rowid, title, body) VALUES (?, ?, ?)",
+                (cursor.lastrowid, f"{fields['title']} {stem}", fields['body'])
+            )
+        if self._names is not None:
+            self._add_name(path, stem, fields['title'])
+        if self._tag_index is not None:
+            self._tag_index.set_tags(path, fields['tags'])
+
+    def _delete(self, path: str) -> None:
+        if self._unindex(path):
+            self._record(path, removed=True)
+
+    def _unindex(self, path: str) -> bool:
+        deleted = self.conn.execute("DELETE FROM notes WHERE path = ?", (path,)).rowcount
+        if self._tag_index is not None:
+            self._tag_index.remove(path)
+        if self._names is not None and path in self._names:
+            stem, title = self._names.pop(path)
+            self._discard(self._stems, stem.lower(), path)
+            self._discard(self._titles, title.lower(), path)
+        return deleted > 0
+
+    def _record(self, path: str, removed: bool) -> None:
+        # One row per path: replacing it moves the path to the end of the log
+        self.conn.execute("INSERT OR REPLACE INTO changes(path, removed) VALUES (?, ?)", (path, int(removed)))
+
+    def _add_name(self, path: str, stem: str, title: str) -> None:
+        self._names[path] = (stem, title)
+        self._stems.setdefault(stem.lower(), set()).add(path)
+        self._titles.setdefault(title.lower(), set()).add(path)
+
+    @staticmethod
+    def _discard(names: Dict[str, Set[str]], key: str, path: str) -> None:
+        paths = names.get(key)
+        if paths is not None:
+            paths.discard(path)
+            if not paths:
+                del names[key]
+
+    # -- Queries -----------------------------------------------------------
+
+    def paths(self, folder: Optional[str] = None, recursive: bool = True) -> List[str]:
+        """
+        Relative paths of indexed notes, sorted.
+
+        Args:
+            folder: Only notes under this folder (relative to the vault root)
+            recursive: Include notes in subfolders of `folder`
+        """
+        with self._lock:
+            if folder:
+                prefix = folder.rstrip(os.sep) + os.sep
+                # Range scan on the unique path index: everything starting with prefix
+                rows = self.conn.execute(
+                    "SELECT path FROM notes WHERE path >= ? AND path < ? ORDER BY path",
+                    (prefix, prefix[:-1] + chr(ord(os.sep) + 1))
+                ).fetchall()
+            else:
+                prefix = ""
+                rows = self.conn.execute("SELECT path FROM notes ORDER BY path").fetchall()
+
+        paths = [row[0] for row in rows]
+        if not recursive:
+            paths = [path for path in paths if os.sep not in path[len(prefix):]]
+        return paths
+
+    def get(self, path: str) -> Optional[IndexedNote]:
+        """Indexed metadata of one note, or None."""
+        with self._lock:
+            row = self.conn.execute(f"SELECT {self._COLUMNS} FROM notes WHERE path = ?", (path,)).fetchone()
+        return self._note(row) if row else None
+
+    def get_many(self, paths: List[str]) -> Dict[str, IndexedNote]:
+        """Indexed metadata of several notes (missing ones are left out)."""
+        found: Dict[str, IndexedNote] = {}
+        with self._lock:
+            # Stay under SQLite's host-parameter limit
+            for start in range(0, len(paths), 500):
+                batch = paths[start:start + 500]
+                rows = self.conn.execute(
+                    f"SELECT {self._COLUMNS} FROM notes WHERE path IN ({', '.join('?' * len(batch))})",
+                    batch
+                ).fetchall()
+                for row in rows:
+                    found[row[0]] = self._note(row)
+        return found
+
+    def notes(self) -> Iterator[IndexedNote]:
+        """All indexed notes, sorted by path."""
+        with self._lock:
+            rows = self.conn.execute(f"SELECT {self._COLUMNS} FROM notes ORDER BY path").fetchall()
+        for row in rows:
+            yield self._note(row)
+
+    def resolve(self, name: str) -> List[str]:
+        """
+        Paths of the notes a bare name refers to, best match first.
+
+        Filename stems win over titles, like Obsidian's link resolution.
+        Matching is case-insensitive, with exact-case matches first; among
+        equals, the shallowest path wins. More than one result means the
+        name is ambiguous.
+
+        Args:
+            name: Note name or title (no folder, no .md)
+
+        Returns:
+            Relative paths, empty if nothing matches
+        """
+        name = name.strip()
+        key = name.lower()
+
+        with self._lock:
+            if self._names is None:
+                self._names, self._stems, self._titles = {}, {}, {}
+                for path, stem, title in self.conn.execute("SELECT path, stem, title FROM notes"):
+                    self._add_name(path, stem, title)
+
+            if key in self._stems:
+                field, paths = 0, self._stems[key]
+            else:
+                field, paths = 1, self._titles.get(key, ())
+
+            return sorted(
+                paths,
+                key=lambda path: (self._names[path][field] != name, path.count(os.sep), path)
+            )
+
+    def forward_links(self) -> Dict[str, List[str]]:
+        """Relative path -> wiki link targets, for every note."""
+        with self._lock:
+            rows = self.conn.execute("SELECT path, links FROM notes").fetchall()
+        return {path: json.loads(links) for path, links in rows}
+
+    def _tags(self) -> TagIndex:
+        if self._tag_index is None:
+            tag_index = TagIndex()
+            tags: Dict[str, List[str]] = {path: [] for (path,) in self.conn.execute("SELECT path FROM notes")}
+            rows = self.conn.execute("SELECT n.path, t.tag FROM note_tags t JOIN notes n ON n.id = t.note_id")
+            for path, tag in rows:
+                tags[path].append(tag)
+            for path, note_tags in tags.items():
+                tag_index.set_tags(path, note_tags)
+            self._tag_index = tag_index
+        return self._tag_index
+
+    def find_tag(self, tag: str, exact_match: bool = False) -> List[str]:
+        """
+        Paths of notes with a tag (case-insensitive), sorted.
+
+        Args:
+            tag: Tag to look up; `topic/` matches child tags only
+            exact_match: If False, also match child tags (`topic` matches `topic/ai`)
+        """
+        with self._lock:
+            tags = self._tags()
+            return tags.paths(tags.match(tag, exact_match))
+
+    def query_tags(
+        self,
+        all_of: Iterable[str] = (),
+        any_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+        exact_match: bool = False
+    ) -> List[str]:
+        """
+        Paths of notes with every tag in `all_of`, at least one in `any_of`
+        (if given) and none in `none_of`, sorted. Tags match hierarchically
+        unless `exact_match`.
+        """
+        with self._lock:
+            return self._tags().query(all_of, any_of, none_of, exact_match)
+
+    def tag_counts(self, prefix: Optional[str] = None, rollup: bool = False) -> Dict[str, int]:
+        """
+        Number of notes per tag (lower-cased), sorted by tag.
+
+        Args:
+            prefix: Only this tag and the tags below it
+            rollup: Count notes with child tags towards their parent tags too
+        """
+        with self._lock:
+            return self._tags().counts(prefix, rollup)
+
+    def search(
+        self,
+        query: str,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = 50,
+        snippet_tokens: int = 12
+    ) -> List[TextHit]:
+        """
+        Ranked full-text search.
+
+        Args:
+            query: FTS5 query expression (see ObsidianSearch.fts_query)
+            columns: Restrict matching to 'title' and/or 'body'
+            limit: Maximum hits (None for all)
+            snippet_tokens: Approximate snippet length in tokens
+
+        Returns:
+            Hits, best BM25 score first
+        """
+        if columns:
+            query = "{" + " ".join(columns) + "} : (" + query + ")"
+
+        sql = (
+            "SELECT n.path, n.title, bm25(notes_fts, ?, 1.0) AS score, "
+            "snippet(notes_fts, 1, '**', '**', '...', ?) "
+            "FROM notes_fts JOIN notes n ON n.id = notes_fts.rowid "
+            "WHERE notes_fts MATCH ? ORDER BY score"
+        )
+        args: list = [TITLE_WEIGHT, snippet_tokens, query]
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(limit)
+
+        with self._lock:
+            rows = self.conn.execute(sql, args).fetchall()
+
+        # bm25() is lower-is-better; report higher-is-better scores
+        return [TextHit(path=path, title=title, score=-score, snippet=snippet)
+                for path, title, score, snippet in rows]
+
+    def text(self, path: str) -> Optional[Tuple[str, str]]:
+        """Indexed (title, body) text of a note, or None."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT f.title, f.body FROM notes_fts f JOIN notes n ON n.id = f.rowid WHERE n.path = ?",
+                (path,)
+            ).fetchone()
+        return tuple(row) if row else None
+
+    def cursor(self) -> str:
+        """Change-feed cursor for the current state of the index."""
+        with self._lock:
+            return self._cursor()
+
+    def _cursor(self) -> str:
+        seq = self.conn.execute("SELECT COALESCE(MAX(seq), 0) FROM changes").fetchone()[0]
+        return f"{self.feed_id}:{seq}"
+
+    def changes_since(self, cursor: Optional[str] = None) -> ChangeFeed:
+        """
+        Notes updated or removed since a cursor.
+
+        Covers every change the index has seen, whether written through the
+        client or picked up by refresh(). Each note is listed once, however
+        often it changed.
+
+        Args:
+            cursor: Cursor returned by an earlier call (or cursor()); None
+                to start from scratch
+
+        Returns:
+            ChangeFeed with the changed paths, in order of their last change,
+            and the cursor to pass next time
+        """
+        feed_id, _, seq = (cursor or "").partition(":")
+        with self._lock:
+            latest = self._cursor()
+            if feed_id == self.feed_id and seq.isdigit() and int(seq) <= int(latest.partition(":")[2]):
+                rows = self.conn.execute(
+                    "SELECT path, removed FROM changes WHERE seq > ? ORDER BY seq", (int(seq),)
+                ).fetchall()
+                return ChangeFeed(
+                    cursor=latest,
+                    updated=[path for path, removed in rows if not removed],
+                    removed=[path for path, removed in rows if removed],
+                )
+
+            if cursor is not None:
+                logger.debug(f"Change-feed cursor {cursor!r} is not from this index; starting over")
+            updated = [row[0] for row in self.conn.execute("SELECT path FROM changes WHERE removed = 0 ORDER BY seq")]
+            return ChangeFeed(cursor=latest, updated=updated, removed=[], reset=cursor is not None)
+
+    _COLUMNS = "path, mtime_ns, size, ctime, stem, title, frontmatter, tags, headings, links"
+
+    @staticmethod
+    def _note(row) -> IndexedNote:
+        path, mtime_ns, size, ctime, stem, title, frontmatter, tags, headings, links = row
+        return IndexedNote(
+            path=path,
+            mtime_ns=mtime_ns,
+            size=size,
+            ctime=ctime,
+            stem=stem,
+            title=title,
+            frontmatter=json.loads(frontmatter),
+            tags=json.loads(tags),
+            headings=[tuple(heading) for heading in json.loads(headings)],
+            links=json.loads(links),
+        )
@@ -1,18 +1,30 @@
 """
 Link tracking and updating for Obsidian vault.
 """
+import os
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
-from .ObsidianParser import extract_links, parse_frontmatter, update_link_in_content
+from .ObsidianParser import extract_links, file_key, parse_frontmatter, update_link_in_content
+
+if TYPE_CHECKING:
+    from .ObsidianIndex import VaultIndex
 
 
 class LinkIndex:
-    """Manages link index for fast backlink queries."""
+    """
+    Manages link index for fast backlink queries.
+
+    Safe to share between threads (e.g. a VaultWatcher updating it while
+    other threads look up backlinks): every method holds the index's lock.
+    """
 
     def __init__(self):
         self.forward_links: Dict[str, List[str]] = {}
         self.backlinks: Dict[str, Set[str]] = {}
+        self._lock = threading.RLock()
 
     def build_index(self, vault_path: Path) -> None:
         """
@@ -21,25 +33,108 @@ class LinkIndex:
         Args:
             vault_path: Path to vault root
         """
-        self.forward_links = {}
-        self.backlinks = {}
+        forward_links = {}
 
         for md_file in vault_path.rglob("*.md"):
             try:
+                stat = md_file.stat()
                 content = md_file.read_text(encoding='utf-8')
-                _, body = parse_frontmatter(content)
-                links = extract_links(body)
+                _, body = parse_frontmatter(content, file_key(md_file, stat))
+                forward_links[str(md_file.relative_to(vault_path))] = extract_links(body)
+            except Exception:
+                continue
 
-                relative_path = str(md_file.relative_to(vault_path))
-                self.forward_links[relative_path] = links
+        self.load(forward_links)
 
-                for link_target in links:
-                    if link_target not in self.backlinks:
-                        self.backlinks[link_target] = set()
-                    self.backlinks[link_target].add(relative_path)
+    def load(self, forward_links: Dict[str, List[str]]) -> None:
+        """
+        Build the index from already-extracted links (e.g. the vault index).
 
-            except Exception:
+        Args:
+            forward_links: Relative path -> wiki link targets
+        """
+        with self._lock:
+            self.forward_links = {}
+            self.backlinks = {}
+
+            for relative_path, links in forward_links.items():
+                self.set_links(relative_path, links)
+
+    def set_links(self, relative_path: str, links: List[str]) -> None:
+        """
+        Replace one note's forward links and fix up the reverse map.
+
+        Args:
+            relative_path: Relative path of the note
+            links: Its current wiki link targets
+        """
+        with self._lock:
+            self._unlink(relative_path)
+            self.forward_links[relative_path] = links
+
+            for link_target in links:
+                if link_target not in self.backlinks:
+                    self.backlinks[link_target] = set()
+                self.backlinks[link_target].add(relative_path)
+
+    def remove_note(self, relative_path: str) -> None:
+        """Drop a deleted or moved-away note's forward links."""
+        with self._lock:
+            self._unlink(relative_path)
+            self.forward_links.pop(relative_path, None)
+
+    def update(self, links: Dict[str, Optional[List[str]]]) -> None:
+        """
+        Apply several notes' changes at once; readers see all or none of them.
+
+        Args:
+            links: Relative path -> its current wiki link targets, or None
+                for a note that no longer exists
+        """
+        with self._lock:
+            for relative_path, note_links in links.items():
+                if note_links is None:
+                    self.remove_note(relative_path)
+                else:
+                    self.set_links(relative_path, note_links)
+
+    def get_links(self, relative_path: str) -> Optional[List[str]]:
+        """A note's wiki link targets, or None if it is not indexed."""
+        with self._lock:
+            links = self.forward_links.get(relative_path)
+            return None if links is None else list(links)
+
+    def _unlink(self, relative_path: str) -> None:
+        for link_target in self.forward_links.get(relative_path, []):
+            sources = self.backlinks.get(link_target)
+            if sources is None:
                 continue
+            sources.discard(relative_path)
+            if not sources:
+                del self.backlinks[link_target]
+
+    def sources_for(self, link_targets: Iterable[str]) -> Set[str]:
+        """
+        Get the notes linking to any of the given targets.
+
+        Matches case-insensitively, like Obsidian (and update_link_in_content)
+        does, so one pass over the reverse map serves a whole batch of moves.
+
+        Args:
+            link_targets: Note titles or extensionless paths
+
+        Returns:
+            Relative paths of the linking notes
+        """
+        wanted = {target.strip().lower() for target in link_targets}
+        sources: Set[str] = set()
+
+        with self._lock:
+            for link_target, linking in self.backlinks.items():
+                if link_target.lower() in wanted:
+                    sources.update(linking)
+
+        return sources
 
     def get_backlinks(self, note_path: str) -> List[str]:
         """
@@ -55,21 +150,135 @@ class LinkIndex:
 
         backlinks = set()
 
-        if note_path in self.backlinks:
-            backlinks.update(self.backlinks[note_path])
+        with self._lock:
+            if note_path in self.backlinks:
+                backlinks.update(self.backlinks[note_path])
 
-        if note_title in self.backlinks:
-            backlinks.update(self.backlinks[note_title])
+            if note_title in self.backlinks:
+                backlinks.update(self.backlinks[note_title])
 
         return list(backlinks)
 
 
+def atomic_write_text(path: Path, content: str) -> None:
+    """
+    Write a file via a temporary sibling and an atomic rename, so readers
+    (and Obsidian's sync) never see a half-written note.
+
+    Args:
+        path: File to write
+        content: New text content
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as handle:
+            handle.write(content)
+        if path.exists():
+            os.chmod(tmp_name, path.stat().st_mode & 0o7777)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def link_renames(
+    old_path: str,
+    new_path: str,
+    old_title: Optional[str] = None,
+    new_title: Optional[str] = None
+) -> List[Tuple[str, str]]:
+    """(old target, new target) pairs to rewrite for one moved note."""
+    old_title = old_title or Path(old_path).stem
+    new_title = new_title or Path(new_path).stem
+    old_target = Path(old_path).with_suffix('').as_posix()
+    new_target = Path(new_path).with_suffix('').as_posix()
+
+    return [
+        (old, new)
+        for old, new in [(old_title, new_title), (old_target, new_target)]
+        if old != new
+    ]
+
+
+def _rewrite_links(
+    vault_path: Path,
+    moves: Sequence[Tuple[str, str, List[Tuple[str, str]]]],
+    link_index: Optional[LinkIndex]
+) -> Dict[str, List[str]]:
+    """Rewrite links for (old path, new path, renames) moves in one pass."""
+    affected: Dict[str, List[str]] = {old_path: [] for old_path, _, _ in moves}
+    moved_to = {old_path: new_path for old_path, new_path, _ in moves}
+
+    if link_index is not None:
+        old_targets = [old for _, _, renames in moves for old, _ in renames]
+        candidates = sorted(
+            moved_to.get(path, path) for path in link_index.sources_for(old_targets)
+        )
+    else:
+        candidates = sorted(
+            str(md_file.relative_to(vault_path)) for md_file in vault_path.rglob("*.md")
+        )
+
+    for relative_path in candidates:
+        md_file = vault_path / relative_path
+
+        try:
+            content = md_file.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            continue
+
+        original_content = content
+
+        for old_path, _, renames in moves:
+            before = content
+            for old_target, new_target in renames:
+                content = update_link_in_content(content, old_target, new_target)
+            if content != before:
+                affected[old_path].append(relative_path)
+
+        if content != original_content:
+            atomic_write_text(md_file, content)
+
+    return affected
+
+
+def update_links_after_moves(
+    vault_path: Path,
+    moves: Sequence[Tuple[str, str]],
+    link_index: Optional[LinkIndex] = None
+) -> Dict[str, List[str]]:
+    """
+    Update wiki links after moving/renaming several notes, in one pass.
+
+    Each affected note is read and written once, however many of the moved
+    notes it links to.
+
+    Args:
+        vault_path: Path to vault root
+        moves: (old relative path, new relative path) pairs, already moved
+        link_index: Link index of the vault; limits the rewrite to notes
+            linking to a moved note. Without it, every note is checked.
+
+    Returns:
+        Old relative path -> relative paths of the files rewritten for it
+    """
+    return _rewrite_links(
+        vault_path,
+        [(old_path, new_path, link_renames(old_path, new_path)) for old_path, new_path in moves],
+        link_index
+    )
+
+
 def update_links_after_move(
     vault_path: Path,
     old_path: str,
     new_path: str,
     old_title: str,
-    new_title: str
+    new_title: str,
+    link_index: Optional[LinkIndex] = None
 ) -> List[str]:
     """
     Update all wiki links after moving/renaming a note.
@@ -80,64 +289,48 @@ def update_links_after_move(
         new_path: New relative path
         old_title: Old note title (filename without extension)
         new_title: New note title (filename without extension)
+        link_index: Link index of the vault; limits the rewrite to notes
+            linking to the old title or path
 
     Returns:
         List of affected file paths
     """
-    affected_files = []
-
-    for md_file in vault_path.rglob("*.md"):
-        relative_path = str(md_file.relative_to(vault_path))
-
-        if relative_path == new_path:
-            continue
-
-        try:
-            content = md_file.read_text(encoding='utf-8')
-            original_content = content
-
-            content = update_link_in_content(content, old_title, new_title)
-
-            old_path_without_ext = old_path.replace('.md', '')
-            new_path_without_ext = new_path.replace('.md', '')
-            content = update_link_in_content(content, old_path_without_ext, new_path_without_ext)
+    renames = link_renames(old_path, new_path, old_title, new_title)
+    return _rewrite_links(vault_path, [(old_path, new_path, renames)], link_index)[old_path]
 
-            if content != original_content:
-                md_file.write_text(content, encoding='utf-8')
-                affected_files.append(relative_path)
 
-        except Exception:
-            continue
-
-    return affected_files
-
-
-def resolve_link(vault_path: Path, link_text: str) -> List[Path]:
+def resolve_link(
+    vault_path: Path,
+    link_text: str,
+    index: Optional['VaultIndex'] = None
+) -> List[Path]:
     """
     Resolve wiki link to actual file path(s).
 
     Args:
         vault_path: Path to vault root
         link_text: Link text from [[...]]
+        index: Vault index; name lookups become a hash lookup instead of
+            a vault scan, and also match note titles
 
     Returns:
-        List of matching file paths (can be multiple if ambiguous)
+        List of matching file paths (can be multiple if ambiguous), best
+        match first
     """
-    matches = []
-
-    link_text = link_text.strip()
-
-    if link_text.endswith('.md'):
-        exact_path = vault_path / link_text
-        if exact_path.exists():
-            return [exact_path]
-    else:
-        exact_path = vault_path / f"{link_text}.md"
-        if exact_path.exists():
-            return [exact_path]
-
-    for md_file in vault_path.rglob("*.md"):
-        if md_file.stem == link_text:
-            matches.append(md_file)
-
-    return matches
+    link_text = link_text.split('|', 1)[0].split('#', 1)[0].strip()
+    if not link_text:
+        return []
+
+    exact_path = vault_path / (link_text if link_text.endswith('.md') else f"{link_text}.md")
+    if exact_path.is_file():
+        return [exact_path]
+
+    if index is not None:
+        matches = index.resolve(Path(link_text).name.removesuffix('.md'))
+        if '/' in link_text:
+            # [[Folder/Name]]: keep the notes whose path ends that way
+            suffix = link_text.removesuffix('.md').lower()
+            matches = [path for path in matches if Path(path).with_suffix('').as_posix().lower().endswith(suffix)]
+        return [vault_path / path for path in matches]
+
+    return sorted(md_file for md_file in vault_path.rglob("*.md") if md_file.stem == link_text)
@@ -0,0 +1,158 @@
+"""
+Parallel note reading and parsing for bulk vault operations.
+
+Files are read (and stat'ed) ahead of the consumer by a thread pool.
+Parsing - YAML frontmatter plus the heading, tag and link extraction - is
+CPU-bound: for large batches on multi-core machines the reader threads hand
+it to a process pool; otherwise it runs in the consuming thread, so no
+threads contend for the GIL over it. Work is submitted in chunks through a
+bounded window, so only a few chunks of note text are held in memory at
+once, and results are yielded in input order.
+"""
+import logging
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .ObsidianParser import analyze_note, file_key
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64
+READ_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+# Below this many notes, starting worker processes costs more than it saves
+PROCESS_MIN_NOTES = 1000
+
+
+@dataclass
+class ParsedNote:
+    """One note file, read and parsed (or the error that prevented it)."""
+    path: Path
+    content: Optional[str] = None
+    stat: Optional[os.stat_result] = None
+    fields: Optional[Dict] = None
+    error: Optional[Exception] = None
+
+
+def _read(path: Path) -> ParsedNote:
+    try:
+        stat = path.stat()
+        return ParsedNote(path=path, content=path.read_text(encoding='utf-8'), stat=stat)
+    except (OSError, UnicodeDecodeError) as e:
+        return ParsedNote(path=path, error=e)
+
+
+def _analyze_chunk(items: List[Tuple[str, str, Tuple]]) -> List[Tuple[Optional[Dict], Optional[str]]]:
+    """Parse (content, stem, cache key) items; may run in a worker process, so errors travel as text."""
+    results = []
+    for content, stem, cache_key in items:
+        try:
+            results.append((analyze_note(content, stem, cache_key), None))
+        except Exception as e:
+            results.append((None, f"{type(e).__name__}: {e}"))
+    return results
+
+
+def _read_chunk(paths: List[Path], parsers: Optional[Executor]) -> List[ParsedNote]:
+    """Read a chunk of notes and, with a process pool, parse them there."""
+    notes = [_read(path) for path in paths]
+    if parsers is not None:
+        try:
+            _apply(notes, parsers.submit(_analyze_chunk, _items(notes)).result())
+        except (BrokenProcessPool, OSError) as e:
+            logger.debug(f"Process pool unavailable, parsing in thread: {e}")
+    return notes
+
+
+def _parse_chunk(notes: List[ParsedNote]) -> List[ParsedNote]:
+    """Parse whatever the readers left unparsed."""
+    unparsed = [note for note in notes if note.error is None and note.fields is None]
+    if unparsed:
+        _apply(unparsed, _analyze_chunk(_items(unparsed)))
+    return notes
+
+
+def _items(notes: List[ParsedNote]) -> List[Tuple[str, str, Tuple]]:
+    return [
+        (note.content, note.path.stem, file_key(note.path, note.stat))
+        for note in notes if note.error is None
+    ]
+
+
+def _apply(notes: List[ParsedNote], results: List[Tuple[Optional[Dict], Optional[str]]]) -> None:
+    readable = [note for note in notes if note.error is None]
+    for note, (fields, error) in zip(readable, results):
+        if error is None:
+            note.fields = fields
+        else:
+            note.error = ValueError(error)
+
+
+def _process_pool(workers: int) -> Optional[Executor]:
+    try:
+        # spawn, not fork: the caller may be running threads of its own
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    except (OSError, ValueError, NotImplementedError) as e:
+        logger.debug(f"Cannot start parser processes: {e}")
+        return None
+
+
+def parse_notes(
+    paths: Iterable[Path],
+    workers: Optional[int] = None,
+    processes: Optional[bool] = None
+) -> Iterator[ParsedNote]:
+    """
+    Read and parse note files in parallel, yielding them in input order.
+
+    Args:
+        paths: Note files to parse
+        workers: Parser processes (default: CPU count)
+        processes: Force the process pool on or off (default: only for
+            batches of PROCESS_MIN_NOTES or more on multi-core machines)
+
+    Yields:
+        ParsedNote for each path, with `error` set if it could not be read
+        or parsed
+    """
+    paths = list(paths)
+    if not paths:
+        return
+
+    workers = workers or os.cpu_count() or 1
+    if processes is None:
+        processes = workers > 1 and len(paths) >= PROCESS_MIN_NOTES
+
+    chunks = [paths[i:i + CHUNK_SIZE] for i in range(0, len(paths), CHUNK_SIZE)]
+
+    if len(chunks) == 1 and not processes:
+        yield from _parse_chunk(_read_chunk(chunks[0], None))
+        return
+
+    parsers = _process_pool(workers) if processes else None
+    readers = ThreadPoolExecutor(max_workers=READ_WORKERS, thread_name_prefix="obsidian-parse")
+    max_pending = READ_WORKERS * 2
+    pending = deque()
+
+    try:
+        remaining = iter(chunks)
+        for chunk in remaining:
+            pending.append(readers.submit(_read_chunk, chunk, parsers))
+            if len(pending) >= max_pending:
+                break
+
+        while pending:
+            notes = pending.popleft().result()
+            next_chunk = next(remaining, None)
+            if next_chunk is not None:
+                pending.append(readers.submit(_read_chunk, next_chunk, parsers))
+            yield from _parse_chunk(notes)
+    finally:
+        readers.shutdown(wait=True, cancel_futures=True)
+        if parsers is not None:
+            parsers.shutdown(wait=True, cancel_futures=True)
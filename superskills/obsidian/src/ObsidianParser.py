@@ -1,23 +1,99 @@
 """
 Parser utilities for Obsidian Markdown files.
 """
+import copy
+import os
 import re
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+# libyaml's C loader is several times faster; PyYAML may be built without it
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def parse_frontmatter(content: str) -> Tuple[Dict, str]:
-    """
-    Extract YAML frontmatter from Markdown content.
+FRONTMATTER_CACHE_SIZE = 4096
 
-    Args:
-        content: Full Markdown content
+_frontmatter_cache: "OrderedDict[Tuple[str, int, int], Tuple[Any, int]]" = OrderedDict()
+_frontmatter_cache_lock = threading.Lock()
 
-    Returns:
-        Tuple of (frontmatter_dict, content_without_frontmatter)
+# Scalar-only fast path: `key: value` lines and `- item` lists of plain words
+_SIMPLE_KEY = re.compile(r'([A-Za-z_][\w-]*):(?: +(.*?))? *$')
+_SIMPLE_ITEM = re.compile(r'( *)- +(.*?) *$')
+_PLAIN_SCALAR = re.compile(r'[^\W\d][\w /.-]*')
+_INT_SCALAR = re.compile(r'-?(?:0|[1-9][0-9]*)')
+# Plain words YAML 1.1 (PyYAML) resolves to booleans or null
+_RESERVED_SCALARS = frozenset({'yes', 'no', 'true', 'false', 'on', 'off', 'null'})
+
+
+def file_key(path: Path, stat: os.stat_result) -> Tuple[str, int, int]:
+    """Cache key of a note file's current version: (path, mtime_ns, size)."""
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _simple_scalar(text: str) -> Any:
+    if _INT_SCALAR.fullmatch(text):
+        return int(text)
+    if _PLAIN_SCALAR.fullmatch(text) and text.lower() not in _RESERVED_SCALARS:
+        return text
+    raise ValueError(text)
+
+
+def _parse_simple_yaml(text: str) -> Optional[Dict]:
     """
+    Parse frontmatter made only of `key: scalar` lines and block lists of
+    scalars, without a YAML parser. Returns None for anything else
+    (quotes, nesting, dates, booleans, comments, ...), so the caller can fall
+    back to YAML and get identical results.
+    """
+    data: Dict[str, Any] = {}
+    current_list: Optional[List] = None
+    list_indent: Optional[str] = None
+
+    try:
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+
+            item = _SIMPLE_ITEM.fullmatch(line)
+            if item:
+                indent, value = item.groups()
+                if current_list is None or list_indent not in (None, indent):
+                    return None
+                list_indent = indent
+                current_list.append(_simple_scalar(value))
+                continue
+
+            match = _SIMPLE_KEY.fullmatch(line)
+            if not match:
+                return None
+
+            key, value = match.groups()
+            if value:
+                data[key] = _simple_scalar(value)
+                current_list = None
+            else:
+                # `key:` alone is null, unless list items follow
+                current_list, list_indent = [], None
+                data[key] = current_list
+    except ValueError:
+        return None
+
+    # Empty lists stand for bare `key:` lines, which YAML reads as null
+    return {key: (value if value != [] else None) for key, value in data.items()}
+
+
+def _load_frontmatter(text: str) -> Any:
+    simple = _parse_simple_yaml(text)
+    if simple is not None:
+        return simple
+    return yaml.load(text, Loader=YamlLoader)
+
+
+def _parse_frontmatter(content: str) -> Tuple[Any, str]:
     if not content.startswith('---'):
         return {}, content
 
@@ -26,13 +102,47 @@ def parse_frontmatter(content: str) -> Tuple[Dict, str]:
         return {}, content
 
     try:
-        frontmatter = yaml.safe_load(parts[1]) or {}
+        frontmatter = _load_frontmatter(parts[1]) or {}
         body = parts[2].lstrip('\n')
         return frontmatter, body
     except yaml.YAMLError:
         return {}, content
 
 
+def parse_frontmatter(content: str, cache_key: Optional[Tuple[str, int, int]] = None) -> Tuple[Dict, str]:
+    """
+    Extract YAML frontmatter from Markdown content.
+
+    Args:
+        content: Full Markdown content
+        cache_key: file_key() of the file the content was read from; the
+            parsed frontmatter is then memoized for that file version
+
+    Returns:
+        Tuple of (frontmatter_dict, content_without_frontmatter)
+    """
+    if cache_key is None:
+        return _parse_frontmatter(content)
+
+    with _frontmatter_cache_lock:
+        cached = _frontmatter_cache.get(cache_key)
+        if cached is not None:
+            _frontmatter_cache.move_to_end(cache_key)
+
+    if cached is not None and cached[1] <= len(content):
+        frontmatter, body_start = cached
+        return copy.deepcopy(frontmatter), content[body_start:]
+
+    frontmatter, body = _parse_frontmatter(content)
+
+    with _frontmatter_cache_lock:
+        _frontmatter_cache[cache_key] = (copy.deepcopy(frontmatter), len(content) - len(body))
+        if len(_frontmatter_cache) > FRONTMATTER_CACHE_SIZE:
+            _frontmatter_cache.popitem(last=False)
+
+    return frontmatter, body
+
+
 def serialize_frontmatter(frontmatter: Dict) -> str:
     """
     Convert frontmatter dict to YAML string with delimiters.
@@ -237,3 +347,29 @@ def get_title_from_content(content: str, frontmatter: Dict, filename: str) -> st
         return headings[0][1]
 
     return filename
+
+
+def analyze_note(content: str, stem: str, cache_key: Optional[Tuple[str, int, int]] = None) -> Dict:
+    """
+    Extract the indexed fields from note content.
+
+    Args:
+        content: Full Markdown content
+        stem: Filename without extension (title fallback)
+        cache_key: file_key() of the note file (see parse_frontmatter)
+
+    Returns:
+        Dict with frontmatter, body, title, tags, headings and links
+    """
+    frontmatter, body = parse_frontmatter(content, cache_key)
+    if not isinstance(frontmatter, dict):
+        frontmatter = {}
+
+    return {
+        'frontmatter': frontmatter,
+        'body': body,
+        'title': get_title_from_content(body, frontmatter, stem),
+        'tags': extract_tags_from_frontmatter(frontmatter),
+        'headings': extract_headings(body),
+        'links': extract_links(body),
+    }
@@ -3,9 +3,70 @@ Search functionality for Obsidian vault.
 """
 import re
 from pathlib import Path
-from typing import List, Literal
+from typing import List, Literal, Tuple
 
-from .ObsidianParser import extract_tags_from_frontmatter, parse_frontmatter
+from .ObsidianParser import extract_tags_from_frontmatter, file_key, parse_frontmatter
+
+# Token characters, matching the index's unicode61 tokenizer
+TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+QUERY_PATTERN = re.compile(r'(-?)"([^"]*)"|(-?)(\S+)')
+
+
+def parse_query(query: str) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Split a search query into terms, phrases and excluded terms.
+
+    Bare words are terms, "quoted text" is a phrase, and a leading `-`
+    excludes a word or phrase.
+
+    Args:
+        query: Search query
+
+    Returns:
+        (terms, phrases, excluded)
+    """
+    terms, phrases, excluded = [], [], []
+
+    for match in QUERY_PATTERN.finditer(query):
+        if match.group(2) is not None:
+            words = TOKEN_PATTERN.findall(match.group(2))
+            if words:
+                (excluded if match.group(1) else phrases).append(" ".join(words))
+        else:
+            words = TOKEN_PATTERN.findall(match.group(4))
+            if match.group(3):
+                if words:
+                    excluded.append(" ".join(words))
+            else:
+                terms.extend(words)
+
+    return terms, phrases, excluded
+
+
+def fts_query(query: str) -> str:
+    """
+    Build a full-text index query from a search query.
+
+    All terms and phrases must match; terms also match as word prefixes
+    ("adopt" finds "adoption"), phrases match exactly.
+
+    Args:
+        query: Search query (see parse_query)
+
+    Returns:
+        FTS5 query expression, or "" if the query has no searchable words
+    """
+    terms, phrases, excluded = parse_query(query)
+
+    required = [f'"{term}"*' for term in terms] + [f'"{phrase}"' for phrase in phrases]
+    if not required:
+        return ""
+
+    expression = " AND ".join(required)
+    if excluded:
+        excluded_expression = " OR ".join(f'"{text}"' for text in excluded)
+        expression = f"({expression}) NOT ({excluded_expression})"
+    return expression
 
 
 def text_search(
@@ -32,10 +93,11 @@ def text_search(
 
     for md_file in vault_path.rglob("*.md"):
         try:
+            stat = md_file.stat()
             content = md_file.read_text(encoding='utf-8')
 
             if search_in in ("title", "both"):
-                frontmatter, _ = parse_frontmatter(content)
+                frontmatter, _ = parse_frontmatter(content, file_key(md_file, stat))
                 title = frontmatter.get('title', md_file.stem)
                 if pattern.search(str(title)):
                     matches.append(md_file)
@@ -72,8 +134,9 @@ def tag_search(
 
     for md_file in vault_path.rglob("*.md"):
         try:
+            stat = md_file.stat()
             content = md_file.read_text(encoding='utf-8')
-            frontmatter, _ = parse_frontmatter(content)
+            frontmatter, _ = parse_frontmatter(content, file_key(md_file, stat))
             note_tags = extract_tags_from_frontmatter(frontmatter)
 
             for note_tag in note_tags:
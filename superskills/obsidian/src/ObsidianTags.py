@@ -0,0 +1,189 @@
+"""
+In-memory tag index for Obsidian vault queries.
+
+Each note gets a slot number, and each tag a posting bitmap (a Python int
+with one bit per note slot), so AND/OR/NOT over tags are single integer
+operations and tag counts are popcounts. Tags are kept in a sorted list
+for hierarchical prefix matches (`topic` -> `topic`, `topic/ai`, ...).
+Tags are case-insensitive, as in Obsidian.
+"""
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def _bit_count(bitmap: int) -> int:
+    return bin(bitmap).count("1")
+
+
+class TagIndex:
+    """Tag -> note posting bitmaps with hierarchical prefix matching."""
+
+    def __init__(self):
+        self._slots: Dict[str, int] = {}
+        self._paths: List[Optional[str]] = []
+        self._free_slots: List[int] = []
+        self._note_tags: Dict[str, Tuple[str, ...]] = {}
+        self._postings: Dict[str, int] = {}
+        self._sorted_tags: Optional[List[str]] = None
+        self._all = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def set_tags(self, path: str, tags: Iterable[str]) -> None:
+        """
+        Add a note, or replace its tags.
+
+        Args:
+            path: Relative path of the note
+            tags: Its tags (any case)
+        """
+        slot = self._slots.get(path)
+        if slot is not None:
+            self._clear_tags(path, slot)
+        elif self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = len(self._paths)
+            self._paths.append(None)
+
+        self._paths[slot] = path
+        self._slots[path] = slot
+        bit = 1 << slot
+        self._all |= bit
+
+        note_tags = tuple(sorted({tag.lower() for tag in tags}))
+        self._note_tags[path] = note_tags
+        for tag in note_tags:
+            if tag not in self._postings:
+                self._sorted_tags = None
+                self._postings[tag] = 0
+            self._postings[tag] |= bit
+
+    def remove(self, path: str) -> None:
+        """Drop a note from the index."""
+        slot = self._slots.pop(path, None)
+        if slot is None:
+            return
+
+        self._clear_tags(path, slot)
+        del self._note_tags[path]
+        self._paths[slot] = None
+        self._free_slots.append(slot)
+        self._all &= ~(1 << slot)
+
+    def _clear_tags(self, path: str, slot: int) -> None:
+        mask = ~(1 << slot)
+        for tag in self._note_tags[path]:
+            self._postings[tag] &= mask
+            if not self._postings[tag]:
+                del self._postings[tag]
+                self._sorted_tags = None
+
+    def tags(self) -> List[str]:
+        """All indexed tags (lower-cased), sorted."""
+        if self._sorted_tags is None:
+            self._sorted_tags = sorted(self._postings)
+        return self._sorted_tags
+
+    def _tags_under(self, prefix: str) -> List[str]:
+        """Indexed tags strictly below `prefix` in the hierarchy."""
+        tags = self.tags()
+        start = bisect_left(tags, prefix + '/')
+        # '0' sorts right after '/', so this ends the `prefix/...` range
+        end = bisect_left(tags, prefix + '0', lo=start)
+        return tags[start:end]
+
+    def match(self, tag: str, exact_match: bool = False) -> int:
+        """
+        Bitmap of the notes with a tag.
+
+        Args:
+            tag: Tag to match; a trailing `/` matches child tags only
+            exact_match: If False, child tags match too (`topic` matches `topic/ai`)
+        """
+        tag = tag.lower().lstrip('#')
+        if tag.endswith('/'):
+            tag = tag.rstrip('/')
+            bitmap = 0
+        else:
+            bitmap = self._postings.get(tag, 0)
+            if exact_match:
+                return bitmap
+
+        for child in self._tags_under(tag):
+            bitmap |= self._postings[child]
+        return bitmap
+
+    def query(
+        self,
+        all_of: Iterable[str] = (),
+        any_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+        exact_match: bool = False
+    ) -> List[str]:
+        """
+        Notes matching a tag expression: every tag in `all_of`, at least one
+        in `any_of` (if given) and none in `none_of`.
+
+        Returns:
+            Relative paths, sorted
+        """
+        bitmap = self._all
+        for tag in all_of:
+            bitmap &= self.match(tag, exact_match)
+            if not bitmap:
+                return []
+
+        any_of = list(any_of)
+        if any_of:
+            alternatives = 0
+            for tag in any_of:
+                alternatives |= self.match(tag, exact_match)
+            bitmap &= alternatives
+
+        for tag in none_of:
+            bitmap &= ~self.match(tag, exact_match)
+
+        return self.paths(bitmap)
+
+    def paths(self, bitmap: int) -> List[str]:
+        """Relative paths of the notes in a bitmap, sorted."""
+        bits = bin(bitmap)[:1:-1]  # bit i at index i
+        paths = []
+        slot = bits.find('1')
+        while slot != -1:
+            paths.append(self._paths[slot])
+            slot = bits.find('1', slot + 1)
+        return sorted(paths)
+
+    def counts(self, prefix: Optional[str] = None, rollup: bool = False) -> Dict[str, int]:
+        """
+        Number of notes per tag.
+
+        Args:
+            prefix: Only this tag and the tags below it
+            rollup: Count notes with child tags towards their parents too
+                (`topic` counts notes tagged `topic/ai`), each note once
+
+        Returns:
+            Tag -> note count, sorted by tag
+        """
+        if prefix:
+            prefix = prefix.lower().lstrip('#').rstrip('/')
+            tags = ([prefix] if prefix in self._postings else []) + self._tags_under(prefix)
+        else:
+            tags = self.tags()
+
+        if not rollup:
+            return {tag: _bit_count(self._postings[tag]) for tag in tags}
+
+        bitmaps: Dict[str, int] = {}
+        for tag in tags:
+            parts = tag.split('/')
+            for depth in range(1, len(parts) + 1):
+                parent = '/'.join(parts[:depth])
+                if prefix and len(parent) < len(prefix):
+                    continue
+                bitmaps[parent] = bitmaps.get(parent, 0) | self._postings[tag]
+        return {tag: _bit_count(bitmaps[tag]) for tag in sorted(bitmaps)}
@@ -0,0 +1,446 @@
+"""
+All-or-nothing multi-file changes to an Obsidian vault.
+
+A VaultTransaction collects note writes and moves in memory, as a view of
+what the vault will look like, without touching the disk. commit() then:
+
+1. writes every new note text to a hidden temp file next to its target,
+   in parallel;
+2. records a rollback journal (`.superskills-transaction.json` in the
+   vault root);
+3. renames every file the transaction replaces or moves to a hidden stash
+   file, then renames the temp files (and moved notes) into place;
+4. deletes the stashes and the journal.
+
+If a step fails, the stashes are renamed back and the vault is as before.
+If the process dies halfway, recover_transaction() finishes the job from
+the journal: rolling back an interrupted commit, or cleaning up after a
+completed one. ObsidianClient runs it when it opens a vault.
+
+A commit holds an exclusive lock on `.superskills-transaction.lock` in the
+vault root, which the OS releases when the process exits. Commits and
+recovery take it first, so a journal is only ever recovered once its
+owner is gone, and two processes cannot commit to a vault at once.
+"""
+import json
+import logging
+import os
+import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+    import msvcrt
+
+from .ObsidianLinkUpdater import LinkIndex
+from .ObsidianParser import extract_links, get_title_from_content, parse_frontmatter
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_NAME = ".superskills-transaction.json"
+LOCK_NAME = ".superskills-transaction.lock"
+WRITE_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+
+
+class VaultTransaction:
+    """Staged note writes and moves, committed together or not at all."""
+
+    def __init__(self, vault_path: Path):
+        """
+        Args:
+            vault_path: Resolved vault root
+        """
+        self.vault_path = Path(vault_path)
+        # Final relative path -> (on-disk file it starts from or None, new
+        # text or None to keep that file's text)
+        self._final: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        # On-disk paths whose file was moved away
+        self._vacated: Set[str] = set()
+        # On-disk path -> where its file is now
+        self._moved: Dict[str, str] = {}
+        # Wiki links of the notes written in the transaction
+        self.links = LinkIndex()
+        # Final path -> (stem, title or None if unchanged) of the notes
+        # written or moved, and lower-cased stem/title -> final paths, for
+        # names the vault index does not know yet (see resolve)
+        self._names: Dict[str, Tuple[str, Optional[str]]] = {}
+        self._stems: Dict[str, Set[str]] = {}
+        self._titles: Dict[str, Set[str]] = {}
+
+    def exists(self, relative_path: str) -> bool:
+        """Whether a note exists at a path, once the transaction is applied."""
+        if relative_path in self._final:
+            return True
+        if relative_path in self._vacated:
+            return False
+        return (self.vault_path / relative_path).is_file()
+
+    def read(self, relative_path: str) -> Optional[str]:
+        """
+        Text of a note once the transaction is applied, or None if none
+        exists at that path.
+
+        Raises:
+            OSError, UnicodeDecodeError: If the note cannot be read
+        """
+        if relative_path in self._final:
+            origin, content = self._final[relative_path]
+            if content is not None:
+                return content
+            relative_path = origin
+        elif not self.exists(relative_path):
+            return None
+        return (self.vault_path / relative_path).read_text(encoding='utf-8')
+
+    def location(self, relative_path: str) -> Optional[str]:
+        """Where the note now at an on-disk path ends up (None if removed)."""
+        if relative_path in self._moved:
+            return self._moved[relative_path]
+        return None if relative_path in self._vacated else relative_path
+
+    def write(self, relative_path: str, content: str) -> None:
+        """Create or replace a note."""
+        if relative_path in self._final:
+            origin, _ = self._final[relative_path]
+        elif relative_path not in self._vacated and (self.vault_path / relative_path).is_file():
+            origin = relative_path
+        else:
+            origin = None
+        self._final[relative_path] = (origin, content)
+        self.links.set_links(relative_path, extract_links(content))
+
+        stem = Path(relative_path).stem
+        frontmatter, body = parse_frontmatter(content)
+        self._name(relative_path, stem, get_title_from_content(body, frontmatter, stem))
+
+    def move(self, source: str, destination: str) -> None:
+        """Move a note; the destination must not exist."""
+        if not self.exists(source):
+            raise FileNotFoundError(f"Note not found: {source}")
+        if destination != source and self.exists(destination):
+            raise FileExistsError(f"Destination already exists: {destination}")
+        entry = self._final.pop(source, (source, None))
+        self._final[destination] = entry
+        self._vacated.add(source)
+        self._vacated.discard(destination)
+        if entry[0] is not None:
+            self._moved[entry[0]] = destination
+        links = self.links.get_links(source)
+        if links is not None:
+            self.links.update({source: None, destination: links})
+
+        _, title = self._unname(source) or (None, None)
+        self._name(destination, Path(destination).stem, title)
+
+    def resolve(self, name: str, indexed: List[str]) -> List[str]:
+        """
+        Paths of the notes a bare name refers to, once the transaction is
+        applied, best match first.
+
+        Notes written or moved in the transaction are matched by their new
+        filename stem and title; the vault index's matches are moved along
+        with their notes, and dropped if the note was removed or no longer
+        has that name. Stems win over titles, like VaultIndex.resolve.
+
+        Args:
+            name: Note name or title (no folder, no .md)
+            indexed: VaultIndex.resolve(name), for the vault on disk
+
+        Returns:
+            Relative paths, empty if nothing matches
+        """
+        name = name.strip()
+        key = name.lower()
+
+        def ranked(paths: Set[str], field: int) -> List[str]:
+            return sorted(
+                paths,
+                key=lambda path: (self._names[path][field] != name, path.count(os.sep), path)
+            )
+
+        by_stem = ranked(self._stems.get(key, set()), 0)
+        if by_stem:
+            return by_stem
+
+        on_disk = []
+        for path in indexed:
+            location = self.location(path)
+            if location is None or location in self._names and self._names[location][1] is not None:
+                # Removed, or retitled: staged titles are matched below
+                continue
+            if location != path and Path(path).stem.lower() == key:
+                # Matched the filename (or the title taken from it) the note
+                # had before it was moved
+                continue
+            on_disk.append(location)
+
+        return on_disk or ranked(self._titles.get(key, set()), 1)
+
+    def _name(self, relative_path: str, stem: str, title: Optional[str]) -> None:
+        self._unname(relative_path)
+        self._names[relative_path] = (stem, title)
+        self._stems.setdefault(stem.lower(), set()).add(relative_path)
+        if title is not None:
+            self._titles.setdefault(title.lower(), set()).add(relative_path)
+
+    def _unname(self, relative_path: str) -> Optional[Tuple[str, Optional[str]]]:
+        names = self._names.pop(relative_path, None)
+        if names is not None:
+            stem, title = names
+            _discard(self._stems, stem.lower(), relative_path)
+            if title is not None:
+                _discard(self._titles, title.lower(), relative_path)
+        return names
+
+    def changed_paths(self) -> List[str]:
+        """Relative paths written, created or vacated by the transaction."""
+        changed = {
+            path for path, (origin, content) in self._final.items()
+            if content is not None or origin != path
+        }
+        changed.update(path for path in self._vacated if path not in self._final)
+        return sorted(changed)
+
+    def commit(self) -> None:
+        """
+        Apply every staged change, or none of them.
+
+        Raises:
+            BlockingIOError: If another process is committing to the vault
+            FileExistsError: If an interrupted commit had to be recovered
+                first; nothing was applied
+            OSError: If the changes could not be applied; the vault has been
+                restored to its state before the commit
+        """
+        placements = [
+            (path, origin, content) for path, (origin, content) in self._final.items()
+            if content is not None or origin != path
+        ]
+        if not placements and not self._vacated:
+            return
+
+        with _transaction_lock(self.vault_path) as locked:
+            if not locked:
+                raise BlockingIOError(f"Another transaction is in progress in {self.vault_path}")
+            # Holding the lock, a journal can only be left by a process that
+            # died; recovering it changes notes this transaction was built from
+            outcome = _recover(self.vault_path)
+            if outcome:
+                raise FileExistsError(f"Found an interrupted plan commit in {self.vault_path} ({outcome})")
+            self._commit(placements)
+
+    def _commit(self, placements: List[Tuple[str, Optional[str], Optional[str]]]) -> None:
+        """commit(), with the transaction lock held."""
+        token = uuid.uuid4().hex[:8]
+        journal = {
+            'state': 'writing',
+            'stashes': {},
+            'placements': [],
+            'folders': [],
+        }
+        journal_path = self.vault_path / JOURNAL_NAME
+
+        try:
+            for path, _, _ in placements:
+                journal['folders'].extend(self._make_folders((self.vault_path / path).parent))
+
+            on_disk = {origin for _, origin, _ in placements if origin is not None} | self._vacated
+            on_disk.update(path for path, _, _ in placements if (self.vault_path / path).exists())
+            journal['stashes'] = {
+                path: _sibling(path, f".{token}.bak") for path in sorted(on_disk)
+                if (self.vault_path / path).exists()
+            }
+
+            with ThreadPoolExecutor(max_workers=WRITE_WORKERS, thread_name_prefix="obsidian-write") as writers:
+                staged = [writers.submit(self._stage, placement, journal['stashes']) for placement in placements]
+                errors = []
+                for future in staged:
+                    try:
+                        journal['placements'].append(future.result())
+                    except OSError as e:
+                        errors.append(e)
+                if errors:
+                    raise errors[0]
+
+            _save_journal(journal_path, journal, 'stashing')
+            for path, stash in journal['stashes'].items():
+                os.rename(self.vault_path / path, self.vault_path / stash)
+
+            _save_journal(journal_path, journal, 'placing')
+            for path, source in journal['placements']:
+                os.replace(self.vault_path / source, self.vault_path / path)
+        except BaseException:
+            # If the rollback fails too, the journal stays for recover_transaction()
+            _roll_back(self.vault_path, journal)
+            _remove(journal_path)
+            raise
+
+        _save_journal(journal_path, journal, 'committed')
+        _clean_up(self.vault_path, journal)
+        _remove(journal_path)
+
+    def _stage(self, placement: Tuple[str, Optional[str], Optional[str]], stashes: Dict[str, str]) -> List[str]:
+        """Write one note's new text to a temp file; returns [path, file to rename into place]."""
+        path, origin, content = placement
+        if content is None:
+            return [path, stashes[origin]]
+
+        target = self.vault_path / path
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as handle:
+            handle.write(content)
+        if origin is not None:
+            os.chmod(tmp_name, (self.vault_path / origin).stat().st_mode & 0o7777)
+        return [path, str(Path(tmp_name).relative_to(self.vault_path))]
+
+    def _make_folders(self, folder: Path) -> List[str]:
+        """Create a folder and its parents; returns the ones created, innermost first."""
+        missing = []
+        while not folder.exists():
+            missing.append(folder)
+            folder = folder.parent
+        for created in reversed(missing):
+            created.mkdir()
+        return [str(created.relative_to(self.vault_path)) for created in missing]
+
+
+@contextmanager
+def _transaction_lock(vault_path: Path) -> Iterator[bool]:
+    """Hold the vault's transaction lock if no other process does; yields whether it was taken."""
+    fd = os.open(vault_path / LOCK_NAME, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            locked = True
+        except OSError:
+            locked = False
+        try:
+            yield locked
+        finally:
+            if locked and fcntl is None:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    finally:
+        # Closing the file releases a flock
+        os.close(fd)
+
+
+def _discard(names: Dict[str, Set[str]], key: str, path: str) -> None:
+    paths = names.get(key)
+    if paths is not None:
+        paths.discard(path)
+        if not paths:
+            del names[key]
+
+
+def _sibling(relative_path: str, suffix: str) -> str:
+    path = Path(relative_path)
+    return str(path.with_name(f".{path.name}{suffix}"))
+
+
+def _save_journal(journal_path: Path, journal: Dict, state: str) -> None:
+    journal['state'] = state
+    tmp_path = journal_path.with_name(f"{journal_path.name}.tmp")
+    tmp_path.write_text(json.dumps(journal, indent=2), encoding='utf-8')
+    os.replace(tmp_path, journal_path)
+
+
+def _remove(path: Path) -> None:
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _roll_back(vault_path: Path, journal: Dict) -> None:
+    """Undo a commit that did not finish, as far as it got."""
+    stash_names = set(journal['stashes'].values())
+
+    if journal['state'] == 'placing':
+        # Every file that was in the way is stashed, so anything at a
+        # placement's path was put there by this commit
+        for path, source in reversed(journal['placements']):
+            target, staged = vault_path / path, vault_path / source
+            if not staged.exists() and target.exists():
+                if source in stash_names:
+                    os.rename(target, staged)
+                else:
+                    target.unlink()
+
+    for path, stash in journal['stashes'].items():
+        if (vault_path / stash).exists():
+            os.replace(vault_path / stash, vault_path / path)
+
+    for _, source in journal['placements']:
+        if source not in stash_names:
+            _remove(vault_path / source)
+
+    for folder in journal['folders']:
+        try:
+            (vault_path / folder).rmdir()
+        except OSError:
+            pass
+
+
+def _clean_up(vault_path: Path, journal: Dict) -> None:
+    """Delete what a finished commit left behind: stashes and temp files."""
+    for stash in journal['stashes'].values():
+        _remove(vault_path / stash)
+    for _, source in journal['placements']:
+        _remove(vault_path / source)
+
+
+def recover_transaction(vault_path: Path) -> Optional[str]:
+    """
+    Finish a transaction interrupted by a crash, using its journal.
+
+    Does nothing while another process holds the vault's transaction lock:
+    its journal belongs to a commit still in progress.
+
+    Args:
+        vault_path: Resolved vault root
+
+    Returns:
+        'rolled back' or 'completed' if a journal was recovered, else None
+    """
+    vault_path = Path(vault_path)
+    if not (vault_path / JOURNAL_NAME).exists():
+        return None
+
+    with _transaction_lock(vault_path) as locked:
+        if not locked:
+            logger.debug(f"Not recovering {vault_path / JOURNAL_NAME}: a commit is in progress")
+            return None
+        return _recover(vault_path)
+
+
+def _recover(vault_path: Path) -> Optional[str]:
+    """recover_transaction(), with the transaction lock held."""
+    journal_path = vault_path / JOURNAL_NAME
+    try:
+        journal = json.loads(journal_path.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Cannot read transaction journal {journal_path}: {e}")
+        return None
+
+    if journal.get('state') == 'committed':
+        _clean_up(vault_path, journal)
+        outcome = 'completed'
+    else:
+        _roll_back(vault_path, journal)
+        outcome = 'rolled back'
+
+    _remove(journal_path)
+    return outcome
@@ -0,0 +1,201 @@
+"""
+Filesystem watcher that keeps an ObsidianClient's indexes current.
+
+For long-running processes: file events (inotify on Linux, FSEvents on
+macOS, via watchdog) are collected until the vault has been quiet for a
+moment, then applied in one batch, re-reading only the notes that changed.
+Hidden folders and non-Markdown files are ignored, as in the vault index.
+"""
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Set
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from .ObsidianClient import ObsidianClient
+    from .ObsidianIndex import ChangeFeed
+
+logger = logging.getLogger(__name__)
+
+# Seconds without file events before changes are indexed; editors and sync
+# clients often write a note several times in quick succession
+DEBOUNCE_SECONDS = 0.5
+
+# Events that do not change file contents
+_IGNORED_EVENTS = {"opened", "closed_no_write"}
+
+
+class _EventHandler(FileSystemEventHandler):
+    def __init__(self, watcher: 'VaultWatcher'):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_any_event(self, event) -> None:
+        if event.event_type in _IGNORED_EVENTS:
+            return
+        paths = [event.src_path, getattr(event, 'dest_path', '')]
+        if event.is_directory:
+            # A folder appearing, moving or vanishing changes every note in it
+            if event.event_type != "modified":
+                self.watcher._queue((), rescan=True)
+            return
+        self.watcher._queue(os.fsdecode(path) for path in paths if path)
+
+
+class VaultWatcher:
+    """Applies file changes in a vault to a client's vault and link index."""
+
+    def __init__(
+        self,
+        client: 'ObsidianClient',
+        on_change: Optional[Callable[['ChangeFeed'], None]] = None,
+        debounce: float = DEBOUNCE_SECONDS
+    ):
+        """
+        Args:
+            client: Client whose indexes to keep current
+            on_change: Called with the changes after each applied batch
+            debounce: Quiet period before a batch is applied, in seconds
+        """
+        self.client = client
+        self.on_change = on_change
+        self.debounce = debounce
+        self._root = str(client.vault_path)
+        self._pending: Set[str] = set()
+        self._rescan = False
+        self._last_event = 0.0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._observer = None
+        self._worker: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None
+
+    def start(self) -> None:
+        """
+        Start watching the vault.
+
+        Raises:
+            ImportError: If watchdog is not installed
+        """
+        if not WATCHDOG_AVAILABLE:
+            raise ImportError("Watching a vault requires watchdog: pip install watchdog")
+        if self.running:
+            return
+
+        self._stopping = False
+        self._observer = Observer()
+        self._observer.schedule(_EventHandler(self), self._root, recursive=True)
+        self._observer.start()
+        self._worker = threading.Thread(target=self._run, name="obsidian-watcher", daemon=True)
+        self._worker.start()
+        logger.debug(f"Watching {self._root}")
+
+    def stop(self) -> None:
+        """Stop watching, after indexing any changes still pending."""
+        if not self.running:
+            return
+
+        self._observer.stop()
+        self._observer.join()
+        self._stopping = True
+        self._wake.set()
+        self._worker.join()
+        self._observer = None
+        self._worker = None
+
+    def __enter__(self) -> 'VaultWatcher':
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _queue(self, paths: Iterable[str], rescan: bool = False) -> None:
+        """Record changed files (absolute paths); called from the observer thread."""
+        notes = [note for note in map(self._relative, paths) if note]
+        if not notes and not rescan:
+            return
+        with self._lock:
+            self._pending.update(notes)
+            self._rescan = self._rescan or rescan
+            self._last_event = time.monotonic()
+        self._wake.set()
+
+    def _relative(self, path: str) -> Optional[str]:
+        if not path.endswith('.md') or not path.startswith(self._root + os.sep):
+            return None
+        relative = path[len(self._root) + 1:]
+        if any(part.startswith('.') for part in Path(relative).parts):
+            return None
+        return relative
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+
+            # Wait for the vault to go quiet
+            while not self._stopping:
+                with self._lock:
+                    quiet_for = time.monotonic() - self._last_event
+                if quiet_for >= self.debounce:
+                    break
+                self._wake.wait(self.debounce - quiet_for)
+                self._wake.clear()
+
+            with self._lock:
+                paths, rescan = sorted(self._pending), self._rescan
+                self._pending, self._rescan = set(), False
+
+            if paths or rescan:
+                try:
+                    self._apply(paths, rescan)
+                except Exception as e:
+                    logger.warning(f"Cannot index vault changes: {e}")
+
+            if self._stopping:
+                return
+
+    def _apply(self, paths: Iterable[str], rescan: bool) -> None:
+        index = self.client.index
+        with self.client.batch():
+            cursor = index.cursor()
+            if rescan:
+                self.client.refresh_index()
+            else:
+                self.client._reindex(*self._stale(paths))
+            changes = index.changes_since(cursor)
+
+        if self.on_change is not None and (changes.updated or changes.removed):
+            self.on_change(changes)
+
+    def _stale(self, paths: Iterable[str]) -> List[str]:
+        """Paths whose indexed entry is out of date; skips the client's own writes."""
+        paths = list(paths)
+        entries = self.client.index.get_many(paths)
+        stale = []
+        for path in paths:
+            entry = entries.get(path)
+            try:
+                stat = os.stat(os.path.join(self._root, path))
+            except OSError:
+                if entry is not None:
+                    stale.append(path)
+                continue
+            if entry is None or (entry.mtime_ns, entry.size) != (stat.st_mtime_ns, stat.st_size):
+                stale.append(path)
+        return stale
@@ -35,43 +35,68 @@ def execute(action: str, **kwargs) -> dict:
 
     client = ObsidianClient(vault_path=vault_path, read_only=read_only)
 
+    # Optional field projection for note listings, e.g. fields="relative_path,title"
+    fields = kwargs.get("fields")
+    projection = {"fields": fields} if fields else {}
+
     if action == "list":
         notes = client.list_notes(
             folder=kwargs.get("folder"),
-            recursive=kwargs.get("recursive", True)
+            recursive=kwargs.get("recursive", True),
+            **projection
         )
-        return {"notes": [note.dict() for note in notes]}
+        return {"notes": [note.dict(fields) for note in notes]}
 
     elif action == "get":
         note = client.get_note(kwargs["path"])
-        return {"note": note.dict() if note else None}
+        return {"note": note.dict(fields) if note else None}
 
     elif action == "search":
         notes = client.search_notes(
             query=kwargs["query"],
             search_in=kwargs.get("search_in", "both"),
             case_sensitive=kwargs.get("case_sensitive", False),
-            limit=kwargs.get("limit", 50)
+            limit=kwargs.get("limit", 50),
+            **projection
         )
-        return {"results": [note.dict() for note in notes]}
+        return {"results": [note.dict(fields) for note in notes]}
 
     elif action == "find_by_tag":
         notes = client.find_by_tag(
             tag=kwargs["tag"],
-            exact_match=kwargs.get("exact_match", False)
+            exact_match=kwargs.get("exact_match", False),
+            **projection
         )
-        return {"results": [note.dict() for note in notes]}
+        return {"results": [note.dict(fields) for note in notes]}
 
     elif action == "find_by_tags":
         notes = client.find_by_tags(
             tags=kwargs["tags"],
-            match_all=kwargs.get("match_all", True)
+            match_all=kwargs.get("match_all", True),
+            **projection,
+            **({"exclude": kwargs["exclude"]} if kwargs.get("exclude") else {})
+        )
+        return {"results": [note.dict(fields) for note in notes]}
+
+    elif action == "tag_counts":
+        counts = client.tag_counts(
+            prefix=kwargs.get("prefix"),
+            rollup=kwargs.get("rollup", False)
         )
-        return {"results": [note.dict() for note in notes]}
+        return {"tags": counts}
+
+    elif action == "changes":
+        changes = client.changes_since(kwargs.get("cursor"))
+        return {
+            "cursor": changes.cursor,
+            "updated": changes.updated,
+            "removed": changes.removed,
+            "reset": changes.reset
+        }
 
     elif action == "find_backlinks":
-        notes = client.find_backlinks(kwargs["path"])
-        return {"backlinks": [note.dict() for note in notes]}
+        notes = client.find_backlinks(kwargs["path"], **projection)
+        return {"backlinks": [note.dict(fields) for note in notes]}
 
     elif action == "create":
         result = client.create_note(
@@ -177,7 +202,7 @@ def execute(action: str, **kwargs) -> dict:
             "message": f"Unknown action: {action}",
             "available_actions": [
                 "list", "get", "search", "find_by_tag", "find_by_tags",
-                "find_backlinks", "create", "update", "update_section",
+                "tag_counts", "changes", "find_backlinks", "create", "update", "update_section",
                 "append", "move", "add_tag", "add_tags", "remove_tag",
                 "set_tags", "add_link", "create_hub", "plan", "apply_plan"
             ]
@@ -7,6 +7,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+from superskills.core.deadline import run_subprocess
+
 
 @dataclass
 class VideoEditResult:
@@ -316,14 +318,15 @@ class VideoEditor:
         if not self.verbose:
             cmd.extend(["-loglevel", "error"])
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # Killed if the calling workflow step times out or is cancelled
+        result = run_subprocess(cmd, capture_output=True, text=True)
 
         if result.returncode != 0:
             raise RuntimeError(f"FFmpeg error: {result.stderr}")
 
     def _get_duration(self, video_path: str) -> float:
         """Get video duration in seconds."""
-        result = subprocess.run(
+        result = run_subprocess(
             [
                 "ffprobe",
                 "-v", "error",
@@ -338,7 +341,7 @@ class VideoEditor:
 
     def _get_resolution(self, video_path: str) -> str:
         """Get video resolution."""
-        result = subprocess.run(
+        result = run_subprocess(
             [
                 "ffprobe",
                 "-v", "error",
@@ -0,0 +1,285 @@
+"""
+Local stand-in for the OpenAI and Anthropic batch APIs.
+
+Implements just enough of both HTTP APIs for the real SDK clients to submit
+batch jobs, poll them and download results, without network access or cost:
+
+    OpenAI:     POST /v1/files, POST /v1/batches, GET /v1/batches/{id},
+                GET /v1/files/{id}/content
+    Anthropic:  POST /v1/messages/batches, GET /v1/messages/batches/{id},
+                GET /v1/messages/batches/{id}/results
+
+Jobs report "in progress" for the first `polls_until_done` status checks.
+Each request is answered with `processed: <user prompt>`, unless the prompt
+contains "FAIL", in which case that request errors.
+
+Use it from tests with the context manager, or run it standalone and point
+the SDKs at it:
+
+    python tests/batch_api_stub.py --port 8765
+    export OPENAI_BASE_URL=http://127.0.0.1:8765/v1
+    export ANTHROPIC_BASE_URL=http://127.0.0.1:8765
+"""
+import argparse
+import itertools
+import json
+import threading
+import time
+from email import policy
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+
+class BatchAPIStub:
+    """In-process HTTP server emulating provider batch endpoints."""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, polls_until_done: int = 1):
+        self.polls_until_done = polls_until_done
+        self.files: Dict[str, bytes] = {}
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        self.submitted: List[Dict[str, Any]] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class Handler(_Handler):
+            server_stub = stub
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'BatchAPIStub':
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> 'BatchAPIStub':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def new_id(self, prefix: str) -> str:
+        with self._lock:
+            return f"{prefix}_{next(self._ids)}"
+
+    @staticmethod
+    def respond(user_prompt: str) -> str:
+        if 'FAIL' in user_prompt:
+            raise ValueError("stub failure requested")
+        return f"processed: {user_prompt}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_stub: BatchAPIStub
+
+    def log_message(self, format, *args):
+        pass
+
+    # Routing
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+        if self.path == '/v1/files':
+            return self._openai_upload(body)
+        if self.path == '/v1/batches':
+            return self._openai_create_batch(json.loads(body))
+        if self.path == '/v1/messages/batches':
+            return self._anthropic_create_batch(json.loads(body))
+        self._send_json({'error': {'message': f"Unknown path {self.path}"}}, status=404)
+
+    def do_GET(self):
+        parts = self.path.split('?')[0].strip('/').split('/')
+
+        if parts[:2] == ['v1', 'batches'] and len(parts) == 3:
+            return self._openai_get_batch(parts[2])
+        if parts[:2] == ['v1', 'files'] and len(parts) == 4 and parts[3] == 'content':
+            return self._send_bytes(self.server_stub.files[parts[2]])
+        if parts[:3] == ['v1', 'messages', 'batches'] and len(parts) == 4:
+            return self._anthropic_get_batch(parts[3])
+        if parts[:3] == ['v1', 'messages', 'batches'] and len(parts) == 5 and parts[4] == 'results':
+            return self._send_bytes(self.server_stub.batches[parts[3]]['results'])
+        self._send_json({'error': {'message': f"Unknown path {self.path}"}}, status=404)
+
+    # OpenAI
+
+    def _openai_upload(self, body: bytes):
+        stub = self.server_stub
+        content_type = self.headers['Content-Type'].encode()
+        headers = b"Content-Type: " + content_type + b"\r\n\r\n"
+        message = BytesParser(policy=policy.default).parsebytes(headers + body)
+
+        content, filename = b"", "upload.jsonl"
+        for part in message.iter_parts():
+            if part.get_param('name', header='content-disposition') == 'file':
+                content = part.get_payload(decode=True)
+                filename = part.get_filename() or filename
+
+        file_id = stub.new_id('file')
+        stub.files[file_id] = content
+        self._send_json(self._openai_file(file_id, filename, len(content)))
+
+    def _openai_create_batch(self, payload: Dict[str, Any]):
+        stub = self.server_stub
+        lines = []
+
+        for line in stub.files[payload['input_file_id']].decode('utf-8').splitlines():
+            request = json.loads(line)
+            stub.submitted.append(request)
+            user_prompt = request['body']['messages'][-1]['content']
+            try:
+                text = stub.respond(user_prompt)
+                response = {
+                    'status_code': 200,
+                    'body': {'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': text}}]}
+                }
+            except ValueError as e:
+                response = {'status_code': 400, 'body': {'error': {'message': str(e)}}}
+            lines.append({'custom_id': request['custom_id'], 'response': response, 'error': None})
+
+        output_file_id = stub.new_id('file')
+        stub.files[output_file_id] = "\n".join(json.dumps(line) for line in lines).encode('utf-8')
+
+        batch_id = stub.new_id('batch')
+        stub.batches[batch_id] = {
+            'polls': 0,
+            'input_file_id': payload['input_file_id'],
+            'output_file_id': output_file_id,
+            'endpoint': payload['endpoint'],
+            'completion_window': payload['completion_window'],
+        }
+        self._send_json(self._openai_batch(batch_id))
+
+    def _openai_get_batch(self, batch_id: str):
+        self.server_stub.batches[batch_id]['polls'] += 1
+        self._send_json(self._openai_batch(batch_id))
+
+    def _openai_batch(self, batch_id: str) -> Dict[str, Any]:
+        batch = self.server_stub.batches[batch_id]
+        done = batch['polls'] >= self.server_stub.polls_until_done
+        return {
+            'id': batch_id,
+            'object': 'batch',
+            'endpoint': batch['endpoint'],
+            'completion_window': batch['completion_window'],
+            'input_file_id': batch['input_file_id'],
+            'created_at': int(time.time()),
+            'status': 'completed' if done else 'in_progress',
+            'output_file_id': batch['output_file_id'] if done else None,
+            'error_file_id': None,
+        }
+
+    @staticmethod
+    def _openai_file(file_id: str, filename: str, size: int) -> Dict[str, Any]:
+        return {
+            'id': file_id,
+            'object': 'file',
+            'bytes': size,
+            'created_at': int(time.time()),
+            'filename': filename,
+            'purpose': 'batch',
+            'status': 'processed',
+        }
+
+    # Anthropic
+
+    def _anthropic_create_batch(self, payload: Dict[str, Any]):
+        stub = self.server_stub
+        lines = []
+
+        for request in payload['requests']:
+            stub.submitted.append(request)
+            params = request['params']
+            try:
+                text = stub.respond(params['messages'][-1]['content'])
+                result = {
+                    'type': 'succeeded',
+                    'message': {
+                        'id': stub.new_id('msg'),
+                        'type': 'message',
+                        'role': 'assistant',
+                        'model': params['model'],
+                        'content': [{'type': 'text', 'text': text}],
+                        'stop_reason': 'end_turn',
+                        'stop_sequence': None,
+                        'usage': {'input_tokens': 1, 'output_tokens': 1},
+                    },
+                }
+            except ValueError as e:
+                result = {
+                    'type': 'errored',
+                    'error': {'type': 'error', 'error': {'type': 'invalid_request_error', 'message': str(e)}},
+                }
+            lines.append({'custom_id': request['custom_id'], 'result': result})
+
+        batch_id = stub.new_id('msgbatch')
+        stub.batches[batch_id] = {
+            'polls': 0,
+            'count': len(lines),
+            'results': "\n".join(json.dumps(line) for line in lines).encode('utf-8'),
+        }
+        self._send_json(self._anthropic_batch(batch_id))
+
+    def _anthropic_get_batch(self, batch_id: str):
+        self.server_stub.batches[batch_id]['polls'] += 1
+        self._send_json(self._anthropic_batch(batch_id))
+
+    def _anthropic_batch(self, batch_id: str) -> Dict[str, Any]:
+        batch = self.server_stub.batches[batch_id]
+        done = batch['polls'] >= self.server_stub.polls_until_done
+        now = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        return {
+            'id': batch_id,
+            'type': 'message_batch',
+            'processing_status': 'ended' if done else 'in_progress',
+            'request_counts': {
+                'processing': 0 if done else batch['count'],
+                'succeeded': batch['count'] if done else 0,
+                'errored': 0,
+                'canceled': 0,
+                'expired': 0,
+            },
+            'created_at': now,
+            'expires_at': now,
+            'ended_at': now if done else None,
+            'archived_at': None,
+            'cancel_initiated_at': None,
+            'results_url': f"{self.server_stub.url}/v1/messages/batches/{batch_id}/results" if done else None,
+        }
+
+    # Responses
+
+    def _send_json(self, payload: Dict[str, Any], status: int = 200):
+        self._send_bytes(json.dumps(payload).encode('utf-8'), status, 'application/json')
+
+    def _send_bytes(self, data: bytes, status: int = 200, content_type: str = 'application/octet-stream'):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Local stand-in for provider batch APIs')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--polls', type=int, default=1, help='Status checks before a job completes')
+    args = parser.parse_args()
+
+    stub = BatchAPIStub(port=args.port, polls_until_done=args.polls)
+    print(f"Batch API stub listening on {stub.url}")
+    try:
+        stub.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
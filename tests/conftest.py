@@ -1,4 +1,5 @@
 """Pytest configuration and shared fixtures."""
+import importlib
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, Mock
@@ -88,3 +89,14 @@ def sample_social_content():
         "hashtags": ["AIProductivity", "Superworker", "AILeadership"],
         "link": "https://coachsteff.com/ai-course"
     }
+
+
+@pytest.fixture(autouse=True)
+def obsidian_cache_dir(request, monkeypatch, tmp_path):
+    """Keep vault indexes and the vault registry of Obsidian tests out of the home directory."""
+    if not request.module.__name__.rpartition(".")[2].startswith("test_obsidian"):
+        return None
+    obsidian_index = importlib.import_module("superskills.obsidian.src.ObsidianIndex")
+    cache_dir = tmp_path / "obsidian-cache"
+    monkeypatch.setattr(obsidian_index, "CACHE_DIR", cache_dir)
+    return cache_dir
@@ -0,0 +1,141 @@
+"""
+Tests for bulk JSONL execution (`superskills call --batch`).
+"""
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from cli.commands.call import call_command
+from cli.core.batch_runner import BatchRunner, completed_ids, read_batch_inputs
+
+
+def _write_inputs(path, lines):
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\n")
+    return path
+
+
+def _read_results(path):
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+@pytest.fixture
+def executor():
+    mock_executor = MagicMock()
+    mock_executor.execute.side_effect = lambda skill, text, **kwargs: {
+        'output': text.upper(),
+        'metadata': {'skill': skill}
+    }
+    return mock_executor
+
+
+def test_read_batch_inputs(tmp_path):
+    path = _write_inputs(tmp_path / "in.jsonl", [
+        {"id": "a", "input": "first", "options": {"tone": "casual"}},
+        {"text": "second"},
+        "third",
+    ])
+
+    items = list(read_batch_inputs(path))
+
+    assert [i.id for i in items] == ["a", "line-2", "line-3"]
+    assert [i.input for i in items] == ["first", "second", "third"]
+    assert items[0].options == {"tone": "casual"}
+
+
+def test_read_batch_inputs_rejects_missing_input(tmp_path):
+    path = _write_inputs(tmp_path / "in.jsonl", [{"id": "a"}])
+
+    with pytest.raises(ValueError, match=":1:"):
+        list(read_batch_inputs(path))
+
+
+def test_run_writes_tagged_results(tmp_path, executor):
+    inputs = _write_inputs(tmp_path / "in.jsonl", [{"id": str(i), "input": f"item {i}"} for i in range(10)])
+    out = tmp_path / "out.jsonl"
+
+    summary = BatchRunner(executor, "copywriter", jobs=3, options={"tone": "formal"}).run(inputs, out)
+
+    results = {r['id']: r for r in _read_results(out)}
+    assert summary.succeeded == 10
+    assert results["7"]['output'] == "ITEM 7"
+    assert executor.execute.call_args.kwargs == {"tone": "formal"}
+    executor.warm_up.assert_called_once_with(["copywriter"])
+
+
+def test_run_bounds_concurrency(tmp_path):
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def execute(skill, text, **kwargs):
+        with lock:
+            active.append(text)
+            peak.append(len(active))
+        time.sleep(0.02)
+        with lock:
+            active.remove(text)
+        return {'output': text}
+
+    slow_executor = MagicMock()
+    slow_executor.execute.side_effect = execute
+    inputs = _write_inputs(tmp_path / "in.jsonl", [f"item {i}" for i in range(12)])
+
+    BatchRunner(slow_executor, "copywriter", jobs=2).run(inputs, tmp_path / "out.jsonl")
+
+    assert max(peak) <= 2
+
+
+def test_failures_are_recorded_and_retried_on_resume(tmp_path, executor):
+    inputs = _write_inputs(tmp_path / "in.jsonl", [{"id": "ok", "input": "fine"}, {"id": "bad", "input": "boom"}])
+    out = tmp_path / "out.jsonl"
+
+    def flaky(skill, text, **kwargs):
+        if text == "boom":
+            raise ValueError("provider down")
+        return {'output': text}
+
+    executor.execute.side_effect = flaky
+    first = BatchRunner(executor, "copywriter").run(inputs, out)
+    assert (first.succeeded, first.failed) == (1, 1)
+    assert completed_ids(out) == {"ok"}
+
+    executor.execute.side_effect = lambda skill, text, **kwargs: {'output': text}
+    executor.execute.reset_mock()
+    second = BatchRunner(executor, "copywriter").run(inputs, out)
+
+    assert (second.succeeded, second.skipped) == (1, 1)
+    executor.execute.assert_called_once()
+    assert completed_ids(out) == {"ok", "bad"}
+
+
+def test_resume_after_partial_write(tmp_path, executor):
+    inputs = _write_inputs(tmp_path / "in.jsonl", [{"id": "a", "input": "x"}, {"id": "b", "input": "y"}])
+    out = tmp_path / "out.jsonl"
+    out.write_text(json.dumps({"id": "a", "status": "success", "output": "X"}) + "\n" + '{"id": "b", "sta')
+
+    summary = BatchRunner(executor, "copywriter").run(inputs, out)
+
+    assert (summary.succeeded, summary.skipped) == (1, 1)
+    assert completed_ids(out) == {"a", "b"}
+
+
+def test_call_command_batch(tmp_path, executor, capsys):
+    inputs = _write_inputs(tmp_path / "prompts.jsonl", [{"id": "1", "input": "hello"}])
+
+    with patch('cli.commands.call.SkillExecutor', return_value=executor), \
+         patch('cli.commands.call.CLIConfig'):
+        result = call_command("copywriter", batch=str(inputs), jobs=2, format='markdown')
+
+    assert result == 0
+    results = _read_results(tmp_path / "prompts.results.jsonl")
+    assert results == [{'id': '1', 'status': 'success', 'output': 'HELLO', 'metadata': {'skill': 'copywriter'}}]
+    # Batch-only flags are not forwarded to the skill
+    assert executor.execute.call_args.kwargs == {}
@@ -0,0 +1,73 @@
+"""
+Tests for the process-wide provider client pool.
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from cli.utils.llm_client import AnthropicProvider, ClientPool, GeminiProvider, OpenAIProvider
+
+
+@pytest.fixture(autouse=True)
+def clean_pool():
+    ClientPool.clear()
+    limits = (ClientPool.max_connections, ClientPool.idle_timeout)
+    yield
+    ClientPool.clear()
+    ClientPool.max_connections, ClientPool.idle_timeout = limits
+
+
+@pytest.mark.parametrize("provider_class", [GeminiProvider, AnthropicProvider, OpenAIProvider])
+def test_providers_share_client_per_credential(provider_class):
+    first = provider_class(api_key="key-a", model="model-1")
+    second = provider_class(api_key="key-a", model="model-2")
+    other = provider_class(api_key="key-b", model="model-1")
+
+    assert first.client is second.client
+    assert first.client is not other.client
+
+
+def test_concurrent_requests_create_one_client():
+    factory = MagicMock(side_effect=lambda: time.sleep(0.01) or object())
+    clients = []
+
+    threads = [
+        threading.Thread(target=lambda: clients.append(ClientPool.get('openai', 'key', factory)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    factory.assert_called_once()
+    assert len({id(client) for client in clients}) == 1
+
+
+def test_configure_sets_limits_for_new_clients():
+    ClientPool.configure(max_connections=3, idle_timeout=15)
+
+    limits = ClientPool.limits()
+    assert limits.max_connections == 3
+    assert limits.keepalive_expiry == 15
+
+    # Invalid values (e.g. unset config) keep the current limits
+    ClientPool.configure(max_connections=0, idle_timeout=None)
+    assert ClientPool.max_connections == 3
+
+
+def test_clear_closes_clients():
+    client = MagicMock()
+    ClientPool.get('anthropic', 'key', lambda: client)
+
+    ClientPool.clear()
+
+    client.close.assert_called_once()
+    assert ClientPool.get('anthropic', 'key', object) is not client
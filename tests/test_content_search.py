@@ -0,0 +1,98 @@
+"""
+Tests for the built-in content search used by `superskills search`.
+"""
+import os
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from cli.commands import search
+from cli.core.content_search import ContentSearch
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "docs"
+    root.mkdir()
+    (root / "focused.md").write_text("# Pricing\n\nOur pricing model.\nPricing tiers below.\n")
+    (root / "long.md").write_text("intro\n" + "filler line\n" * 500 + "one mention of pricing\n")
+    (root / "other.txt").write_text("nothing relevant here\n")
+    (root / "image.png").write_bytes(b"\x89PNG\0\0pricing")
+    (root / "empty.txt").write_text("")
+    return root
+
+
+def _files(root):
+    return [str(path) for path in sorted(root.iterdir())]
+
+
+def test_ranks_by_density_with_line_numbers(tree):
+    matches = ContentSearch().search("pricing", _files(tree))
+
+    assert [os.path.basename(match.path) for match in matches] == ["focused.md", "long.md"]
+    assert matches[0].hits == 3
+    assert matches[0].lines == [(1, "# Pricing"), (3, "Our pricing model."), (4, "Pricing tiers below.")]
+    assert matches[1].lines == [(502, "one mention of pricing")]
+
+
+def test_smart_case(tree):
+    matches = ContentSearch().search("Pricing", _files(tree))
+
+    assert [os.path.basename(match.path) for match in matches] == ["focused.md"]
+    assert matches[0].hits == 2
+
+
+def test_smart_case_folds_non_ascii_letters(tmp_path):
+    (tmp_path / "menu.md").write_text("CAFÉ OPENS\nÜber café\nstraße STRASSE\n", encoding="utf-8")
+    files = [str(tmp_path / "menu.md")]
+
+    assert ContentSearch().search("café", files)[0].lines == [(1, "CAFÉ OPENS"), (2, "Über café")]
+    assert ContentSearch().search("über", files)[0].lines == [(2, "Über café")]
+    assert ContentSearch().search("straße", files)[0].hits == 2
+    assert ContentSearch().search("Über", files)[0].lines == [(2, "Über café")]
+    assert ContentSearch().search("Café", files) == []
+
+
+def test_skips_binary_and_oversized_files(tree):
+    assert ContentSearch().search("PNG", _files(tree)) == []
+    assert ContentSearch(max_file_size=100).search("mention", _files(tree)) == []
+
+
+def test_stops_at_max_results(tmp_path):
+    for i in range(20):
+        (tmp_path / f"note{i}.md").write_text("match\n" * 10)
+
+    matches = ContentSearch(max_results=15, workers=2).search("match", _files(tmp_path))
+
+    assert sum(len(match.lines) for match in matches) == 15
+
+
+def test_search_command_uses_builtin_engine_without_ripgrep(tree, tmp_path, capsys, monkeypatch):
+    monkeypatch.chdir(tree)
+    config = MagicMock()
+    config.cache_dir = tmp_path / "cache"
+    config.get = MagicMock(side_effect=lambda key, default=None: {
+        'search.paths': [str(tree)],
+    }.get(key, default))
+
+    with patch.object(search, '_is_command_available', return_value=False):
+        assert search._search_content("pricing", config) == 0
+
+    output = capsys.readouterr().out
+    assert "focused.md:3:Our pricing model." in output
+    assert output.index("focused.md") < output.index("long.md")
+
+
+def test_command_availability_is_cached():
+    search._is_command_available.cache_clear()
+    with patch.object(search.shutil, 'which', return_value=None) as which:
+        assert not search._is_command_available('rg')
+        assert not search._is_command_available('rg')
+
+    which.assert_called_once_with('rg')
+    search._is_command_available.cache_clear()
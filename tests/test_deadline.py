@@ -0,0 +1,181 @@
+"""
+Tests for deadlines, cancellation and workflow timeouts.
+"""
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from cli.core.workflow_engine import WorkflowEngine
+from cli.core.workflow_plan import compile_workflow
+from cli.utils.llm_client import LLMProvider
+from superskills.core.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    OperationCancelled,
+    current_deadline,
+    deadline_scope,
+    run_subprocess,
+)
+
+
+class TestDeadline:
+    def test_unbounded(self):
+        deadline = Deadline()
+        assert deadline.remaining() is None
+        assert deadline.timeout(5) == 5
+        assert not deadline.expired
+        deadline.check()
+
+    def test_child_never_outlives_parent(self):
+        parent = Deadline(1)
+        child = parent.child(60)
+        assert child.remaining() <= 1
+        assert parent.child().expires_at == parent.expires_at
+        assert parent.child(0.1).remaining() <= 0.1
+
+    def test_cancel_propagates_to_children(self):
+        parent = Deadline()
+        child = parent.child(10)
+        parent.cancel()
+        assert child.cancelled
+        with pytest.raises(OperationCancelled):
+            child.check()
+
+    def test_expired_check_raises(self):
+        deadline = Deadline(0.01)
+        time.sleep(0.02)
+        assert deadline.expired
+        with pytest.raises(DeadlineExceeded):
+            deadline.check()
+
+    def test_sleep_refuses_to_outlive_deadline(self):
+        deadline = Deadline(0.5)
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            deadline.sleep(5)
+        assert time.monotonic() - start < 0.1
+
+    def test_scope_sets_current_deadline(self):
+        deadline = Deadline(5)
+        assert current_deadline() is None
+        with deadline_scope(deadline):
+            assert current_deadline() is deadline
+        assert current_deadline() is None
+
+
+class TestRunSubprocess:
+    def test_completes_within_deadline(self):
+        result = run_subprocess(
+            [sys.executable, "-c", "print('ok')"],
+            deadline=Deadline(10),
+            capture_output=True,
+            text=True
+        )
+        assert result.returncode == 0
+        assert result.stdout.strip() == "ok"
+
+    def test_kills_child_on_timeout(self):
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            run_subprocess(
+                [sys.executable, "-c", "import time; time.sleep(30)"],
+                deadline=Deadline(0.3),
+                capture_output=True
+            )
+        assert time.monotonic() - start < 5
+
+    def test_uses_current_deadline(self):
+        deadline = Deadline()
+        deadline.cancel()
+        with deadline_scope(deadline), pytest.raises(OperationCancelled):
+            run_subprocess([sys.executable, "-c", "import time; time.sleep(30)"])
+
+
+def test_provider_backoff_respects_deadline(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(time, 'sleep', sleeps.append)
+
+    LLMProvider._backoff(2, None)
+    assert sleeps == [2]
+
+    with pytest.raises(DeadlineExceeded):
+        LLMProvider._backoff(2, Deadline(0.5))
+
+
+def _engine(tmp_path, settings=None):
+    config = MagicMock()
+    config.cache_dir = tmp_path
+    config.get.side_effect = lambda key, default=None: {
+        'workflows.prewarm': False,
+        **(settings or {})
+    }.get(key, default)
+
+    engine = WorkflowEngine(config, show_progress=False)
+    engine.executor = MagicMock()
+    return engine
+
+
+def _plan(step_timeout=None, timeout=None):
+    step = {"name": "slow", "skill": "author", "input": "${input}", "output": "out"}
+    if step_timeout:
+        step["timeout"] = step_timeout
+    workflow = {"name": "timed", "steps": [step]}
+    if timeout:
+        workflow["timeout"] = timeout
+    return compile_workflow(workflow)
+
+
+def _slow_execute(skill, input_text, deadline=None, **kwargs):
+    # Cooperative skill: polls its deadline like provider retries do
+    for _ in range(100):
+        deadline.sleep(0.05)
+    return {'output': 'done'}
+
+
+def test_step_timeout_stops_cooperative_step(tmp_path):
+    engine = _engine(tmp_path)
+    engine.executor.execute.side_effect = _slow_execute
+
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        engine.execute_plan(_plan(step_timeout=0.2), {'input': 'x'})
+
+    assert time.monotonic() - start < 2
+
+
+def test_step_timeout_abandons_uncooperative_step(tmp_path):
+    engine = _engine(tmp_path)
+    engine.executor.execute.side_effect = lambda *args, **kwargs: time.sleep(2)
+
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded, match="slow"):
+        engine.execute_plan(_plan(step_timeout=0.2), {'input': 'x'})
+
+    assert time.monotonic() - start < 1
+    deadline = engine.executor.execute.call_args.kwargs['deadline']
+    assert deadline.cancelled
+
+
+def test_workflow_timeout_from_config(tmp_path):
+    engine = _engine(tmp_path, {'workflows.timeout': 0.2})
+    engine.executor.execute.side_effect = _slow_execute
+
+    with pytest.raises(DeadlineExceeded):
+        engine.execute_plan(_plan(), {'input': 'x'})
+
+
+def test_unbounded_step_runs_inline(tmp_path):
+    engine = _engine(tmp_path)
+    engine.executor.execute.return_value = {'output': 'done'}
+
+    result = engine.execute_plan(_plan(), {'input': 'x'})
+
+    assert result['final_output'] == 'done'
+    deadline = engine.executor.execute.call_args.kwargs['deadline']
+    assert deadline.remaining() is None
@@ -0,0 +1,121 @@
+"""
+Tests for deferred (provider batch API) workflow execution, run against the
+local batch API stand-in server.
+"""
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from anthropic import Anthropic
+from openai import OpenAI
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from cli.core.deferred_runner import DeferredRunner
+from cli.core.skill_executor import SkillExecutor
+from cli.core.workflow_plan import compile_workflow
+from cli.utils.llm_client import (
+    BATCH_COMPLETED,
+    BATCH_PENDING,
+    AnthropicProvider,
+    BatchRequest,
+    OpenAIProvider,
+)
+from tests.batch_api_stub import BatchAPIStub
+
+
+@pytest.fixture
+def stub():
+    with BatchAPIStub(polls_until_done=2) as server:
+        yield server
+
+
+def _openai(stub):
+    provider = OpenAIProvider(api_key="test-key")
+    provider.client = OpenAI(api_key="test-key", base_url=f"{stub.url}/v1", max_retries=0)
+    return provider
+
+
+def _anthropic(stub):
+    provider = AnthropicProvider(api_key="test-key")
+    provider.client = Anthropic(api_key="test-key", base_url=stub.url, max_retries=0)
+    return provider
+
+
+REQUESTS = [
+    BatchRequest("item-0", "You are terse.", "hello"),
+    BatchRequest("item-1", "You are terse.", "please FAIL"),
+]
+
+
+@pytest.mark.parametrize("make_provider", [_openai, _anthropic])
+def test_provider_batch_round_trip(stub, make_provider):
+    provider = make_provider(stub)
+
+    batch_id = provider.submit_batch(REQUESTS)
+
+    assert provider.batch_status(batch_id) == BATCH_PENDING
+    assert provider.batch_status(batch_id) == BATCH_COMPLETED
+
+    results = provider.batch_results(batch_id)
+    assert results["item-0"].output == "processed: hello"
+    assert results["item-1"].output is None
+    assert "stub failure" in results["item-1"].error
+    assert len(stub.submitted) == 2
+
+
+def _runner(stub, tmp_path, max_wait=5):
+    config = MagicMock()
+    config.cache_dir = tmp_path
+    config.get.side_effect = lambda key, default=None: {
+        'workflows.deferred.poll_interval': 0.01,
+        'workflows.deferred.max_wait': max_wait,
+    }.get(key, default)
+
+    executor = SkillExecutor(config)
+    executor.llm_provider = _openai(stub)
+    return DeferredRunner(executor, config)
+
+
+PLAN = compile_workflow({
+    "name": "deferred",
+    "steps": [
+        {"name": "draft", "skill": "copywriter", "input": "${input}", "output": "draft"},
+        {"name": "edit", "skill": "editor", "input": "${draft}", "output": "final"},
+    ],
+}, file_hash="0" * 64)
+
+
+def test_runner_executes_steps_as_batch_jobs(stub, tmp_path):
+    runner = _runner(stub, tmp_path)
+
+    results = runner.run(PLAN, {
+        "a.md": {"input": "first"},
+        "b.md": {"input": "second"},
+        "c.md": {"input": "FAIL here"},
+    })
+
+    assert results["a.md"]["final_output"] == "processed: processed: first"
+    assert results["b.md"]["steps"]["edit"]["metadata"]["batch_id"]
+    assert "draft" in results["c.md"]["error"]
+
+    # One job per step; the failed input is not carried into the next step
+    assert len(stub.batches) == 2
+    assert len(stub.submitted) == 5
+    assert not list((tmp_path / "deferred").glob("*.json"))
+
+
+def test_runner_resumes_pending_batch(stub, tmp_path):
+    stub.polls_until_done = 1000
+    interrupted = _runner(stub, tmp_path, max_wait=0.05).run(PLAN, {"a.md": {"input": "first"}})
+    assert "error" in interrupted["a.md"]
+    assert len(list((tmp_path / "deferred").glob("*.json"))) == 1
+
+    stub.polls_until_done = 0
+    resumed = _runner(stub, tmp_path).run(PLAN, {"a.md": {"input": "first"}})
+
+    assert resumed["a.md"]["final_output"] == "processed: processed: first"
+    # The first step's job was picked up again rather than resubmitted
+    assert len(stub.batches) == 2
@@ -0,0 +1,106 @@
+"""
+Tests for incremental `superskills export`.
+"""
+import json
+import os
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from cli.commands import export
+from cli.core.export_cache import ExportCache
+from cli.core.skill_loader import SkillLoader
+
+
+def _write_skill(path: Path, name: str, description: str):
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "SKILL.md").write_text(f"---\nname: {name}\ndescription: {description}\n---\n\n# {name}\n")
+
+
+@pytest.fixture
+def project(tmp_path):
+    skills_dir = tmp_path / "superskills"
+    _write_skill(skills_dir / "author", "author", "Writes content")
+    _write_skill(skills_dir / "narrator", "narrator", "Generates voiceovers")
+    _write_skill(skills_dir / "narrator" / "podcast", "narrator-podcast", "Podcast voiceovers")
+
+    workflows_dir = tmp_path / "workflows"
+    (workflows_dir / "weekly-digest").mkdir(parents=True)
+    (workflows_dir / "weekly-digest" / "workflow.yaml").write_text(
+        "name: weekly-digest\n"
+        "description: Summarise the week\n"
+        "variables:\n  topic: ''\n"
+        "steps:\n"
+        "  - {name: research, skill: researcher, output: findings}\n"
+        "  - {name: write, skill: author, output: digest}\n"
+    )
+
+    loader = SkillLoader()
+    loader.skills_dir = skills_dir
+    config = MagicMock()
+    config.cache_dir = tmp_path / "cache"
+
+    with patch.object(export, 'SkillLoader', return_value=loader), \
+            patch.object(export, 'CLIConfig', return_value=config), \
+            patch.object(export, 'get_workflows_dir',
+                         side_effect=lambda sub=None: workflows_dir / sub if sub else workflows_dir):
+        yield tmp_path
+
+
+def test_export_includes_skills_subskills_and_workflow_files(project, capsys):
+    output_file = project / "out" / "skills.json"
+    assert export.export_command(output_file=str(output_file)) == 0
+
+    metadata = json.loads(output_file.read_text())
+    assert [s['name'] for s in metadata['skills']] == ['author', 'narrator', 'narrator-podcast']
+    assert metadata['metadata']['python_skills'] == 2
+
+    digest = next(w for w in metadata['workflows'] if w['name'] == 'weekly-digest')
+    assert digest['steps'] == ['researcher', 'author']
+    assert digest['inputs'] == ['topic']
+    assert digest['outputs'] == ['digest']
+    assert [w['name'] for w in metadata['workflows']] == sorted(w['name'] for w in metadata['workflows'])
+
+
+def test_unchanged_export_is_not_rewritten(project):
+    output_file = project / "skills.json"
+    export.export_command(output_file=str(output_file))
+    os.utime(output_file, ns=(1, 1))
+
+    export.export_command(output_file=str(output_file))
+    assert output_file.stat().st_mtime_ns == 1
+
+    _write_skill(project / "superskills" / "author", "author", "Writes better content")
+    export.export_command(output_file=str(output_file))
+    assert output_file.stat().st_mtime_ns != 1
+    assert "Writes better content" in output_file.read_text()
+
+
+def test_only_changed_entries_are_rebuilt(tmp_path):
+    sources = {name: tmp_path / f"{name}.md" for name in ['a', 'b']}
+    for path in sources.values():
+        path.write_text("x")
+    builds = []
+
+    def items():
+        return {name: ([path], lambda name=name: builds.append(name) or name.upper())
+                for name, path in sources.items()}
+
+    cache = ExportCache(tmp_path / "cache.json", salt="1")
+    assert cache.build(items()) == {'a': 'A', 'b': 'B'}
+    cache.save()
+
+    sources['b'].write_text("changed")
+    cache = ExportCache(tmp_path / "cache.json", salt="1")
+    assert cache.build(items()) == {'a': 'A', 'b': 'B'}
+    assert cache.rebuilt == ['b']
+
+    # A different salt (export code changed) rebuilds everything
+    cache = ExportCache(tmp_path / "cache.json", salt="2")
+    cache.build(items())
+    assert sorted(cache.rebuilt) == ['a', 'b']
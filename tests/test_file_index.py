@@ -0,0 +1,106 @@
+"""
+Tests for the persistent filename index used by `superskills search`.
+"""
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from cli.core.file_index import FileIndex
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "docs"
+    (root / "work" / "reports").mkdir(parents=True)
+    (root / "personal").mkdir()
+    (root / "node_modules" / "pkg").mkdir(parents=True)
+
+    (root / "work" / "Superworker-Executive-Summary.md").write_text("x")
+    (root / "work" / "reports" / "Q3 report.pdf").write_text("x")
+    (root / "personal" / "recipes.txt").write_text("x")
+    (root / "node_modules" / "pkg" / "summary.js").write_text("x")
+    return root
+
+
+@pytest.fixture
+def index(tmp_path):
+    with FileIndex(tmp_path / "cache" / "file_index.db") as file_index:
+        yield file_index
+
+
+def _names(matches):
+    return [os.path.basename(match.path) for match in matches]
+
+
+@pytest.mark.parametrize("fts", [True, False])
+def test_case_insensitive_multi_word_search(tree, index, fts):
+    index.fts = fts
+    index.refresh([tree])
+
+    matches, total = index.search("executive summary", roots=[tree])
+
+    assert _names(matches) == ["Superworker-Executive-Summary.md"]
+    assert total == 1
+    assert not matches[0].fuzzy
+
+
+def test_glob_and_short_queries(tree, index):
+    index.refresh([tree])
+
+    assert _names(index.search("*.PDF", roots=[tree])[0]) == ["Q3 report.pdf"]
+    assert "Q3 report.pdf" in _names(index.search("q3", roots=[tree], fuzzy=False)[0])
+
+
+def test_glob_character_classes_follow_fnmatch(tree, index):
+    (tree / "personal" / "^notes.txt").write_text("x")
+    index.refresh([tree])
+
+    assert _names(index.search("[!r]*.txt", roots=[tree])[0]) == ["^notes.txt"]
+    assert sorted(_names(index.search("[^r]*.txt", roots=[tree])[0])) == ["^notes.txt", "recipes.txt"]
+
+
+def test_fuzzy_match_tolerates_typos(tree, index):
+    index.refresh([tree])
+
+    matches, _ = index.search("recipies", roots=[tree])
+
+    assert _names(matches) == ["recipes.txt"]
+    assert matches[0].fuzzy
+
+
+def test_excluded_directories_are_not_indexed(tree, index):
+    index.refresh([tree])
+
+    assert "summary.js" not in _names(index.search("summary", roots=[tree])[0])
+
+
+def test_refresh_only_relists_changed_directories(tree, index):
+    first = index.refresh([tree])
+    assert first['rescanned'] == first['visited'] == 4
+
+    (tree / "personal" / "budget.xlsx").write_text("x")
+    shutil.rmtree(tree / "work" / "reports")
+
+    second = index.refresh([tree])
+
+    # 'personal' and 'work' changed; the root directory did not
+    assert second['rescanned'] == 2
+    assert _names(index.search("budget", roots=[tree])[0]) == ["budget.xlsx"]
+    assert index.search("report", roots=[tree], fuzzy=False)[0] == []
+
+
+def test_index_persists_and_filters_by_root(tree, tmp_path):
+    db = tmp_path / "cache" / "file_index.db"
+    with FileIndex(db) as index:
+        index.refresh([tree])
+
+    with FileIndex(db) as index:
+        index.ensure_fresh([tree], max_age=3600)
+        assert index.search("recipes", roots=[tree])[1] == 1
+        assert index.search("recipes", roots=[tree / "work"])[1] == 0
@@ -2,11 +2,13 @@
 Unit tests for intent parser
 """
 import json
+import shutil
 from unittest.mock import Mock, patch
 
 import pytest
 
 from cli.core.intent_parser import IntentParser, IntentResult
+from cli.core.prompt_cache import PromptCache
 from cli.utils.config import CLIConfig
 
 
@@ -185,3 +187,29 @@ class TestIntentParser:
 
         assert len(suggestions) > 0
         assert any("skills" in s.lower() for s in suggestions)
+
+
+def test_system_prompt_follows_subskill_changes(tmp_path, mock_config, mock_llm_provider):
+    """Editing, adding or removing a subskill rebuilds the cached prompt"""
+    def write_skill(path, name, description):
+        path.mkdir(parents=True, exist_ok=True)
+        (path / 'SKILL.md').write_text(f"---\nname: {name}\ndescription: {description}\n---\n")
+
+    write_skill(tmp_path / 'narrator', 'narrator', 'Voice-overs')
+    write_skill(tmp_path / 'narrator' / 'podcast', 'narrator-podcast', 'Podcast voice')
+
+    with patch('cli.core.intent_parser.get_skills_dir', return_value=tmp_path), \
+            patch('cli.core.skill_loader.get_skills_dir', return_value=tmp_path):
+        PromptCache.invalidate('intent-parser')
+        parser = IntentParser(mock_config)
+        assert "- narrator-podcast: Podcast voice" in parser._build_system_prompt()
+
+        write_skill(tmp_path / 'narrator' / 'podcast', 'narrator-podcast', 'Warm conversational podcast voice')
+        assert "- narrator-podcast: Warm conversational podcast voice" in parser._build_system_prompt()
+
+        write_skill(tmp_path / 'narrator' / 'social', 'narrator-social', 'Short social clips')
+        assert "- narrator-social: Short social clips" in parser._build_system_prompt()
+
+        shutil.rmtree(tmp_path / 'narrator' / 'social')
+        assert "narrator-social" not in parser._build_system_prompt()
+    PromptCache.invalidate('intent-parser')
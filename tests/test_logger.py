@@ -0,0 +1,85 @@
+"""
+Tests for the queue-based CLI logger.
+"""
+import json
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from cli.utils.logger import CLILogger, DebugSampler
+
+
+@pytest.fixture
+def cli_logger(tmp_path, monkeypatch):
+    monkeypatch.delenv('SUPERSKILLS_LOG_FORMAT', raising=False)
+    monkeypatch.delenv('SUPERSKILLS_LOG_DEBUG_SAMPLE', raising=False)
+    CLILogger.reset()
+    CLILogger._instance = CLILogger(log_dir=tmp_path)
+    yield CLILogger._instance
+    CLILogger.reset()
+
+
+def _log_lines(tmp_path):
+    CLILogger.flush()
+    return (tmp_path / "superskills.log").read_text(encoding='utf-8').splitlines()
+
+
+def test_file_records_are_written_by_background_thread(cli_logger, tmp_path):
+    logger = CLILogger.get_logger()
+    logger.debug("step %s done", "draft")
+
+    lines = _log_lines(tmp_path)
+
+    assert lines[-1].endswith("DEBUG - step draft done")
+    assert cli_logger._listener._thread is not None
+
+
+def test_json_records_include_exceptions(cli_logger, tmp_path):
+    cli_logger.configure(log_format='json')
+    logger = CLILogger.get_logger()
+
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        logger.debug("step failed", exc_info=True)
+
+    record = json.loads(_log_lines(tmp_path)[-1])
+    assert record['level'] == 'DEBUG'
+    assert record['message'] == 'step failed'
+    assert 'RuntimeError: boom' in record['exception']
+
+
+def test_env_overrides_config(cli_logger, tmp_path, monkeypatch):
+    monkeypatch.setenv('SUPERSKILLS_LOG_DEBUG_SAMPLE', '0.5')
+
+    cli_logger.configure(debug_sample_rate=1.0)
+
+    assert cli_logger._sampler.rate == 0.5
+
+
+def _record(level=logging.DEBUG, lineno=10):
+    return logging.LogRecord('superskills', level, 'engine.py', lineno, 'msg', None, None)
+
+
+def test_sampler_keeps_fraction_per_call_site():
+    sampler = DebugSampler(rate=0.25)
+
+    kept = [sampler.filter(_record()) for _ in range(100)]
+
+    assert kept[0]
+    assert sum(kept) == 25
+    # Each call site is sampled independently
+    assert sampler.filter(_record(lineno=11))
+
+
+def test_sampler_never_drops_info_and_above():
+    sampler = DebugSampler(rate=0)
+
+    assert not sampler.filter(_record())
+    assert sampler.filter(_record(level=logging.INFO))
+    assert sampler.filter(_record(level=logging.ERROR))
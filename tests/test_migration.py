@@ -0,0 +1,114 @@
+"""
+Tests for migration export/import packages.
+"""
+import json
+import sys
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from cli.commands import migrate
+from cli.utils import migration
+from cli.utils.migration import calculate_checksum, calculate_checksums
+
+
+@pytest.fixture
+def install(tmp_path):
+    root = tmp_path / "project"
+    user_config = tmp_path / "home" / ".superskills"
+    user_config.mkdir(parents=True)
+    (user_config / "config.yaml").write_text("api:\n  default_provider: gemini\n")
+
+    for skill in ["author", "editor", "coach"]:
+        (root / "superskills" / skill).mkdir(parents=True)
+        (root / "superskills" / skill / "PROFILE.md").write_text(f"# {skill} profile\n")
+
+    with patch.object(migrate, 'get_project_root', return_value=root), \
+            patch.object(migrate, 'get_user_config_dir', return_value=user_config), \
+            patch.object(migration, 'get_project_root', return_value=root), \
+            patch.object(migration, 'get_user_config_dir', return_value=user_config):
+        yield root
+
+
+def _package(path: Path):
+    with zipfile.ZipFile(path) as zipf:
+        return sorted(zipf.namelist()), json.loads(zipf.read("manifest.json"))
+
+
+def test_parallel_checksums_match_serial(install):
+    files = {path.name + str(i): path for i, path in enumerate(install.rglob("PROFILE.md"))}
+
+    assert calculate_checksums(files) == {key: calculate_checksum(path) for key, path in files.items()}
+
+
+def test_incremental_export_packs_only_changed_files(install, tmp_path):
+    assert migrate.migrate_command('export', output=str(tmp_path / "full.zip")) == 0
+    names, manifest = _package(tmp_path / "full.zip")
+    assert len(manifest['files']) == 4
+    assert not manifest['flags']['incremental']
+
+    (install / "superskills" / "editor" / "PROFILE.md").write_text("# editor profile, revised\n")
+    (install / "superskills" / "coach" / "PROFILE.md").unlink()
+
+    assert migrate.migrate_command('export', output=str(tmp_path / "delta.zip"), incremental=True) == 0
+    names, manifest = _package(tmp_path / "delta.zip")
+
+    assert names == ["manifest.json", "skill-profiles/editor/PROFILE.md"]
+    assert manifest['flags']['incremental']
+    assert sorted(manifest['unchanged']) == ["skill-profiles/author/PROFILE.md", "user-config/config.yaml"]
+    assert manifest['removed'] == ["skill-profiles/coach/PROFILE.md"]
+
+
+def test_incremental_export_against_a_given_package(install, tmp_path):
+    migrate.migrate_command('export', output=str(tmp_path / "base.zip"))
+    migrate.migrate_command('export', output=str(tmp_path / "other.zip"))
+
+    (install / "superskills" / "author" / "PROFILE.md").write_text("# new author profile\n")
+    migrate.migrate_command('export', output=str(tmp_path / "delta.zip"), incremental=str(tmp_path / "base.zip"))
+
+    names, _ = _package(tmp_path / "delta.zip")
+    assert names == ["manifest.json", "skill-profiles/author/PROFILE.md"]
+
+
+def test_import_applies_delta_and_reports_missing_base_files(install, tmp_path, capsys):
+    migrate.migrate_command('export', output=str(tmp_path / "full.zip"))
+    (install / "superskills" / "editor" / "PROFILE.md").write_text("# editor profile, revised\n")
+    migrate.migrate_command('export', output=str(tmp_path / "delta.zip"), incremental=True)
+
+    (install / "superskills" / "editor" / "PROFILE.md").write_text("# local edit\n")
+    (install / "superskills" / "author" / "PROFILE.md").write_text("# drifted\n")
+    capsys.readouterr()
+
+    assert migrate.migrate_command('import', input=str(tmp_path / "delta.zip"), yes=True, overwrite=True) == 0
+
+    output = capsys.readouterr().out
+    assert "✅ Imported: skill-profiles/editor/PROFILE.md" in output
+    assert "skill-profiles/author/PROFILE.md" in output.split("import the base package first:")[1]
+    assert (install / "superskills" / "editor" / "PROFILE.md").read_text() == "# editor profile, revised\n"
+
+
+def test_import_removes_files_deleted_since_base(install, tmp_path, capsys):
+    migrate.migrate_command('export', output=str(tmp_path / "full.zip"))
+    coach = install / "superskills" / "coach" / "PROFILE.md"
+    coach.unlink()
+    migrate.migrate_command('export', output=str(tmp_path / "delta.zip"), incremental=True)
+
+    coach.write_text("# coach profile\n")
+    capsys.readouterr()
+    assert migrate.migrate_command('import', input=str(tmp_path / "delta.zip"), dry_run=True) == 0
+    assert "[remove   ] skill-profiles/coach/PROFILE.md" in capsys.readouterr().out
+
+    assert migrate.migrate_command('import', input=str(tmp_path / "delta.zip"), yes=True) == 0
+    assert "Keeping (removed in package): skill-profiles/coach/PROFILE.md" in capsys.readouterr().out
+    assert coach.exists()
+
+    assert migrate.migrate_command('import', input=str(tmp_path / "delta.zip"), yes=True, overwrite=True) == 0
+    assert "Removed: skill-profiles/coach/PROFILE.md" in capsys.readouterr().out
+    assert not coach.exists()
+    backups = list((tmp_path / "home" / ".superskills" / "backups").rglob("PROFILE.md"))
+    assert any(backup.read_text() == "# coach profile\n" for backup in backups)
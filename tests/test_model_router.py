@@ -0,0 +1,166 @@
+"""
+Tests for adaptive model routing.
+"""
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from cli.core.model_router import ModelRouter, ModelStats, estimate_tokens
+from cli.core.skill_executor import SkillExecutor
+from cli.core.skill_loader import SkillInfo
+
+ROUTING = {
+    'stats': {'min_samples': 3, 'max_error_rate': 0.5},
+    'rules': [
+        {'name': 'long-context', 'min_input_tokens': 1000,
+         'candidates': ['gemini-pro-latest', 'claude-sonnet-latest']},
+        {'name': 'best-quality', 'quality': 'best',
+         'candidates': ['claude-sonnet-latest', 'gemini-pro-latest']},
+        {'name': 'small-fast', 'max_input_tokens': 100, 'quality': ['fast', 'balanced'],
+         'prefer': 'latency', 'candidates': ['gemini-flash-latest', 'openai-default']},
+    ]
+}
+
+
+@pytest.fixture(autouse=True)
+def api_keys(monkeypatch):
+    for name in ('GEMINI_API_KEY', 'ANTHROPIC_API_KEY', 'OPENAI_API_KEY'):
+        monkeypatch.setenv(name, 'test-key')
+
+
+def _skill(quality=None):
+    return SkillInfo(name='writer', description='', skill_type='prompt', path=Path('.'), has_profile=False,
+                     quality=quality)
+
+
+def _router(stats=None):
+    return ModelRouter(MagicMock(), stats=stats or ModelStats(), routing=ROUTING)
+
+
+def _route(router, text, quality=None):
+    return router.route(_skill(quality), '', text, 'gemini', 'gemini-flash-latest')
+
+
+def test_estimate_tokens():
+    assert estimate_tokens('a' * 400, 'b' * 400) == 200
+
+
+def test_large_input_routes_to_long_context_model():
+    decision = _route(_router(), 'x' * 8000)
+
+    assert (decision.provider, decision.model, decision.rule) == ('gemini', 'gemini-pro-latest', 'long-context')
+
+
+def test_quality_tier_routes_to_best_model():
+    decision = _route(_router(), 'x' * 1000, quality='best')
+
+    assert (decision.provider, decision.model) == ('anthropic', 'claude-sonnet-latest')
+
+
+def test_no_matching_rule_uses_defaults():
+    decision = _route(_router(), 'x' * 1000)
+
+    assert (decision.provider, decision.model, decision.rule) == ('gemini', 'gemini-flash-latest', None)
+
+
+def test_provider_without_api_key_is_skipped(monkeypatch):
+    monkeypatch.delenv('GEMINI_API_KEY')
+
+    decision = _route(_router(), 'x' * 8000)
+
+    assert decision.model == 'claude-sonnet-latest'
+
+
+def test_failing_model_is_skipped_until_failures_age_out():
+    stats = ModelStats()
+    for _ in range(3):
+        stats.record('gemini-pro-latest', 1.0, ok=False)
+    router = _router(stats)
+
+    assert _route(router, 'x' * 8000).model == 'claude-sonnet-latest'
+
+    stats.error_max_age = 0
+    time.sleep(0.01)
+    assert _route(router, 'x' * 8000).model == 'gemini-pro-latest'
+
+
+def test_latency_preference_samples_every_candidate_then_picks_fastest():
+    stats = ModelStats()
+    router = _router(stats)
+
+    for _ in range(3):
+        assert _route(router, 'short').model == 'gemini-flash-latest'
+        stats.record('gemini-flash-latest', 2.0, ok=True)
+    for _ in range(3):
+        assert _route(router, 'short').model == 'openai-default'
+        stats.record('openai-default', 0.5, ok=True)
+
+    decision = _route(router, 'short')
+    assert (decision.provider, decision.model) == ('openai', 'openai-default')
+    assert 'latency' in decision.reason
+
+
+def test_stats_persist_between_instances(tmp_path):
+    path = tmp_path / 'model_stats.json'
+    stats = ModelStats(path)
+    stats.record('openai-default', 0.4, ok=True)
+    stats.record('openai-default', 0.6, ok=False)
+    stats.save()
+
+    reloaded = ModelStats(path)
+
+    assert reloaded.count('openai-default') == 2
+    assert reloaded.error_rate('openai-default') == (0.5, 2)
+    assert reloaded.median_latency('openai-default') == 0.4
+
+
+def _executor(tmp_path, routing):
+    config = MagicMock()
+    config.cache_dir = tmp_path
+    config.get.side_effect = lambda key, default=None: {
+        'api.provider': 'gemini',
+        'api.model': 'gemini-flash-latest',
+        'api.routing': routing,
+    }.get(key, default)
+
+    executor = SkillExecutor(config)
+    executor.loader = MagicMock()
+    executor.loader.get_skill.return_value = _skill()
+    executor.loader.load_skill_content.return_value = {'skill': 'Write.', 'master_briefing': None, 'profile': None}
+    executor.llm_provider = MagicMock()
+    executor.llm_provider.call.return_value = 'default output'
+    return executor
+
+
+def test_executor_ignores_routing_when_disabled(tmp_path):
+    executor = _executor(tmp_path, routing=False)
+
+    result = executor.execute('writer', 'x' * 8000)
+
+    assert result['output'] == 'default output'
+    assert 'route' not in result['metadata']
+
+
+def test_executor_routes_call_and_records_outcome(tmp_path):
+    executor = _executor(tmp_path, routing=True)
+    executor._router = _router()
+    routed = MagicMock()
+    routed.call.return_value = 'routed output'
+
+    with patch('cli.core.skill_executor.LLMProvider.create', return_value=routed) as create:
+        result = executor.execute('writer', 'x' * 8000)
+        executor.execute('writer', 'y' * 8000)
+
+    assert result['output'] == 'routed output'
+    assert result['metadata']['model'] == 'gemini-pro-latest'
+    assert result['metadata']['route'] == 'long-context'
+    create.assert_called_once()
+    assert create.call_args.kwargs['model'] == 'models/gemini-1.5-pro'
+    assert executor._router.stats.count('gemini-pro-latest') == 2
+    executor.llm_provider.call.assert_not_called()
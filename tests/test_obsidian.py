@@ -11,6 +11,7 @@ from superskills.obsidian.src.ObsidianParser import (
     extract_headings,
     extract_links,
     extract_tags_from_frontmatter,
+    file_key,
     find_section,
     merge_frontmatter,
     parse_frontmatter,
@@ -151,6 +152,35 @@ Body content.
 
         assert frontmatter == {}
 
+    def test_parse_frontmatter_fast_path_matches_yaml(self):
+        """Simple frontmatter skips YAML; anything else still goes through it."""
+        import yaml
+
+        for text in [
+            "title: Note 1\ntags:\n  - topic/ai\n  - status/active\ncount: 3\nempty:\n",
+            "done: yes\ncreated: 2024-01-01\nratio: 1.5\n",
+            "title: 'Quoted: text'\nnested:\n  key: value\n",
+        ]:
+            frontmatter, body = parse_frontmatter(f"---\n{text}---\n\nBody")
+            assert frontmatter == yaml.safe_load(text)
+            assert body == "Body"
+
+    def test_parse_frontmatter_cache(self, tmp_path):
+        """Cached frontmatter is keyed by file version and safe to mutate."""
+        note = tmp_path / "note.md"
+        note.write_text("---\ntitle: First\n---\nBody\n")
+        key = file_key(note, note.stat())
+
+        frontmatter, body = parse_frontmatter(note.read_text(), key)
+        frontmatter['title'] = "Changed"
+        cached, cached_body = parse_frontmatter(note.read_text(), key)
+
+        assert cached == {'title': 'First'}
+        assert cached_body == body == "Body\n"
+
+        note.write_text("---\ntitle: Second version\n---\nBody\n")
+        assert parse_frontmatter(note.read_text(), file_key(note, note.stat()))[0] == {'title': 'Second version'}
+
     def test_serialize_frontmatter(self):
         """Test serializing frontmatter to YAML."""
         fm = {"title": "Test", "tags": ["tag1", "tag2"]}
@@ -0,0 +1,353 @@
+"""Tests for the persistent Obsidian vault index."""
+
+import os
+
+import pytest
+
+from superskills.obsidian.src import ObsidianClient, ObsidianLinkUpdater
+from superskills.obsidian.src.ObsidianIndex import VaultIndex
+from superskills.obsidian.src.ObsidianLinkUpdater import atomic_write_text
+
+
+def _note(title, tags=(), body=""):
+    tag_lines = "".join(f"  - {tag}\n" for tag in tags)
+    return f"---\ntitle: {title}\ntags:\n{tag_lines}---\n\n# {title}\n\n{body}\n"
+
+
+@pytest.fixture
+def vault(tmp_path):
+    vault = tmp_path / "vault"
+    (vault / "Projects").mkdir(parents=True)
+    (vault / ".obsidian").mkdir()
+    (vault / "alpha.md").write_text(_note("Alpha", ["topic/ai"], "Links to [[beta]]."))
+    (vault / "beta.md").write_text(_note("Beta", ["topic/coaching", "status/active"]))
+    (vault / "Projects" / "gamma.md").write_text(_note("Gamma", ["status/active"], "See [[alpha|A]]."))
+    (vault / ".obsidian" / "workspace.md").write_text("not a note")
+    return vault
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    return tmp_path / "index" / "vault.db"
+
+
+def test_refresh_only_reparses_changed_notes(vault, index_path):
+    with VaultIndex(vault, index_path) as index:
+        assert index.refresh() == {'notes': 3, 'updated': 3, 'removed': 0}
+        assert index.refresh() == {'notes': 3, 'updated': 0, 'removed': 0}
+
+        (vault / "beta.md").write_text(_note("Beta v2", ["topic/coaching"]))
+        (vault / "Projects" / "gamma.md").unlink()
+
+        assert index.refresh() == {'notes': 2, 'updated': 1, 'removed': 1}
+        assert index.get("beta.md").title == "Beta v2"
+        assert index.find_tag("status/active", exact_match=True) == []
+
+
+def test_index_persists_between_instances(vault, index_path):
+    with VaultIndex(vault, index_path) as index:
+        index.refresh()
+
+    with VaultIndex(vault, index_path) as index:
+        assert index.refresh()['updated'] == 0
+        note = index.get(os.path.join("Projects", "gamma.md"))
+        assert note.title == "Gamma"
+        assert note.links == ["alpha"]
+        assert note.headings == [(1, "Gamma")]
+
+
+def test_queries(vault, index_path):
+    with VaultIndex(vault, index_path) as index:
+        index.refresh()
+
+        assert index.paths() == ["Projects" + os.sep + "gamma.md", "alpha.md", "beta.md"]
+        assert index.paths("Projects") == ["Projects" + os.sep + "gamma.md"]
+        assert index.paths(recursive=False) == ["alpha.md", "beta.md"]
+        assert index.find_tag("TOPIC") == ["alpha.md", "beta.md"]
+        assert index.forward_links()["alpha.md"] == ["beta"]
+
+
+def test_client_uses_index_and_sees_external_edits_after_refresh(vault, index_path):
+    client = ObsidianClient(vault_path=str(vault), verbose=False, index_path=str(index_path))
+
+    assert sorted(note.title for note in client.find_by_tag("status/active")) == ["Beta", "Gamma"]
+
+    client.add_tag("alpha.md", "status/active")
+    assert len(client.find_by_tag("status/active", exact_match=True)) == 3
+
+    (vault / "delta.md").write_text(_note("Delta", ["topic/ai"]))
+    assert client.refresh_index()['updated'] == 1
+    assert client.get_note("Delta").relative_path == "delta.md"
+    assert len(client.list_notes()) == 4
+
+
+@pytest.fixture
+def search_client(vault, index_path):
+    (vault / "adoption.md").write_text(_note("AI Adoption Playbook", [], "How teams adopt tools."))
+    (vault / "notes.md").write_text(_note(
+        "Meeting notes", [],
+        "We discussed AI adoption in passing.\n\n" + "Unrelated filler sentence. " * 50
+    ))
+    (vault / "draft.md").write_text(_note("Draft", [], "Adoption of AI is slow; draft only."))
+    return ObsidianClient(vault_path=str(vault), verbose=False, index_path=str(index_path))
+
+
+def test_search_is_ranked_and_has_snippets(search_client):
+    results = search_client.search_notes("adoption")
+
+    assert results[0].title == "AI Adoption Playbook"
+    assert {note.title for note in results} == {"AI Adoption Playbook", "Meeting notes", "Draft"}
+    assert all(note.score is not None for note in results)
+    meeting = next(note for note in results if note.title == "Meeting notes")
+    assert "**adoption**" in meeting.snippet
+    assert "snippet" in meeting.dict()
+
+
+def test_search_phrases_prefixes_and_exclusions(search_client):
+    assert {n.title for n in search_client.search_notes('"AI adoption"', search_in="content")} == {"AI Adoption Playbook", "Meeting notes"}
+    assert {n.title for n in search_client.search_notes("adopt tools")} == {"AI Adoption Playbook"}
+    assert {n.title for n in search_client.search_notes("adoption -draft")} == {"AI Adoption Playbook", "Meeting notes"}
+    assert {n.title for n in search_client.search_notes("Adoption", case_sensitive=True, search_in="content")} == {"AI Adoption Playbook", "Draft"}
+
+
+def test_search_index_follows_writes(search_client):
+    search_client.update_note("draft.md", content="Rewritten about onboarding.")
+
+    assert "Draft" not in {n.title for n in search_client.search_notes("adoption")}
+    assert [n.title for n in search_client.search_notes("onboarding")] == ["Draft"]
+
+
+def test_link_index_follows_writes_without_rescans(vault, index_path, monkeypatch):
+    client = ObsidianClient(vault_path=str(vault), verbose=False, index_path=str(index_path))
+    monkeypatch.setattr(client.index, "forward_links", lambda: pytest.fail("full link reload"))
+
+    client.create_note("delta.md", "Points at [[beta]] and [[alpha]].")
+    assert sorted(client.link_index.get_backlinks("beta")) == ["alpha.md", "delta.md"]
+
+    client.update_note("alpha.md", content="No links any more.")
+    assert client.link_index.get_backlinks("beta") == ["delta.md"]
+
+    client.move_note("delta.md", "Projects/delta.md", update_links=False)
+    assert client.link_index.get_backlinks("beta") == ["Projects" + os.sep + "delta.md"]
+    assert "delta.md" not in client.link_index.forward_links
+
+
+def test_batch_commits_once(vault, index_path):
+    client = ObsidianClient(vault_path=str(vault), verbose=False, index_path=str(index_path))
+
+    with pytest.raises(RuntimeError):
+        with client.batch():
+            client.create_note("one.md", "first")
+            client.create_note("two.md", "second")
+            raise RuntimeError("abort")
+
+    with VaultIndex(vault, index_path) as other:
+        assert other.get("one.md") is None
+
+    with client.batch():
+        client.create_note("three.md", "third")
+    with VaultIndex(vault, index_path) as other:
+        assert other.get("three.md") is not None
+
+
+def test_batched_moves_rewrite_only_backlinks(vault, index_path, monkeypatch):
+    (vault / "hub.md").write_text("Hub: [[alpha]], [[Beta|B]] and [[Projects/gamma]].")
+    (vault / "unrelated.md").write_text("Nothing to see.")
+    client = ObsidianClient(vault_path=str(vault), verbose=False, index_path=str(index_path))
+
+    read, written = [], []
+    original_read_text = type(vault).read_text
+
+    def tracking_read_text(self, *args, **kwargs):
+        read.append(self.name)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(vault), "read_text", tracking_read_text)
+    monkeypatch.setattr(ObsidianLinkUpdater, "atomic_write_text", lambda path, text: (
+        written.append(path.name), atomic_write_text(path, text)
+    ))
+    results = client.move_notes([("alpha.md", "Archive/alpha-old.md"), ("beta", "Archive/beta-old")])
+    monkeypatch.undo()
+
+    assert [result.success for result in results] == [True, True]
+    assert sorted(results[0].affected_files) == ["Projects" + os.sep + "gamma.md", "hub.md"]
+    assert results[1].affected_files == ["Archive" + os.sep + "alpha-old.md", "hub.md"]
+    assert sorted(written) == ["alpha-old.md", "gamma.md", "hub.md"]
+    assert "unrelated.md" not in read
+
+    assert (vault / "hub.md").read_text() == "Hub: [[alpha-old]], [[beta-old|B]] and [[Projects/gamma]]."
+    assert "[[beta-old]]" in (vault / "Archive" / "alpha-old.md").read_text()
+    assert sorted(client.link_index.get_backlinks("Archive/beta-old.md")) == ["Archive" + os.sep + "alpha-old.md", "hub.md"]
+    assert not list(vault.rglob("*.tmp"))
+
+
+def test_field_projection_skips_reading_notes(vault, index_path, monkeypatch):
+    client = ObsidianClient(vault_path=str(vault), verbose=False, index_path=str(index_path))
+
+    read = []
+    original_read_text = type(vault).read_text
+    monkeypatch.setattr(type(vault), "read_text", lambda self, *args, **kwargs: (
+        read.append(self.name), original_read_text(self, *args, **kwargs)
+    )[1])
+
+    notes = client.list_notes(fields=["relative_path", "title", "tags"])
+    assert [note.dict(["relative_path", "title"]) for note in notes] == [
+        {"relative_path": "Projects" + os.sep + "gamma.md", "title": "Gamma"},
+        {"relative_path": "alpha.md", "title": "Alpha"},
+        {"relative_path": "beta.md", "title": "Beta"},
+    ]
+    assert [note.title for note in client.find_by_tag("status/active", fields="title")] == ["Gamma", "Beta"]
+    assert read == []
+
+    assert "Links to [[beta]]." in notes[1].body
+    assert notes[1].backlinks == ["Projects" + os.sep + "gamma.md"]
+    assert read == ["alpha.md"]
+
+    with pytest.raises(ValueError, match="Unknown note fields: bodies"):
+        client.list_notes(fields=["bodies"])
+
+
+def test_name_lookups_use_the_index_and_report_ambiguity(vault, index_path, caplog):
+    (vault / "Archive").mkdir()
+    (vault / "Archive" / "alpha.md").write_text(_note("Old Alpha"))
+    client = ObsidianClient(vault_path=str(vault), verbose=False, index_path=str(index_path))
+
+    assert client.index.resolve("ALPHA") == ["alpha.md", "Archive" + os.sep + "alpha.md"]
+    assert client.index.resolve("old alpha") == ["Archive" + os.sep + "alpha.md"]
+    assert client.resolve_link("Archive/alpha|old") == ["Archive" + os.sep + "alpha.md"]
+    assert client.resolve_link("gamma#Heading") == ["Projects" + os.sep + "gamma.md"]
+
+    with caplog.at_level("WARNING"):
+        assert client.get_note("Alpha").relative_path == "alpha.md"
+    assert "Ambiguous note name 'Alpha'" in caplog.text
+
+    client.move_note("Projects/gamma.md", "Projects/delta.md")
+    assert client.get_note("delta").relative_path == "Projects" + os.sep + "delta.md"
+    # Only the title still says Gamma
+    assert client.index.resolve("gamma") == ["Projects" + os.sep + "delta.md"]
+
+
+def test_tag_queries_follow_writes(vault, index_path):
+    client = ObsidianClient(vault_path=str(vault), verbose=False, index_path=str(index_path))
+
+    assert client.tag_counts("topic") == {"topic/ai": 1, "topic/coaching": 1}
+    assert [n.relative_path for n in client.find_by_tags(["topic", "status"], exclude=["topic/ai"])] == ["beta.md"]
+
+    client.add_tag("alpha.md", "status/active")
+    client.move_note("beta.md", "Projects/beta.md")
+
+    assert client.tag_counts(rollup=True)["status"] == 3
+    assert [n.relative_path for n in client.find_by_tags(["status/active", "topic"])] == [
+        "Projects" + os.sep + "beta.md", "alpha.md"
+    ]
+
+
+def test_change_feed(vault, index_path):
+    client = ObsidianClient(vault_path=str(vault), verbose=False, index_path=str(index_path))
+
+    first = client.changes_since()
+    assert sorted(first.updated) == ["Projects" + os.sep + "gamma.md", "alpha.md", "beta.md"]
+    assert client.changes_since(first.cursor).updated == []
+
+    client.add_tag("alpha.md", "status/active")
+    client.move_note("beta.md", "Projects/beta.md")
+    (vault / "delta.md").write_text(_note("Delta", body="[[alpha]]"))
+    (vault / "Projects" / "gamma.md").unlink()
+
+    changes = client.changes_since(first.cursor)
+    assert changes.updated == ["alpha.md", "Projects" + os.sep + "beta.md", "delta.md"]
+    assert changes.removed == ["beta.md", "Projects" + os.sep + "gamma.md"]
+    assert not changes.reset
+    assert client.link_index.get_backlinks("alpha") == ["delta.md"]
+
+    # Cursors from another (or a rebuilt) index start over
+    with VaultIndex(vault, index_path.with_name("other.db")) as other:
+        other.refresh()
+        stale = other.changes_since(changes.cursor)
+    assert stale.reset and len(stale.updated) == 3 and stale.removed == []
+
+
+def test_watcher_keeps_indexes_current(vault, index_path):
+    pytest.importorskip("watchdog")
+    import queue
+
+    client = ObsidianClient(vault_path=str(vault), verbose=False, index_path=str(index_path))
+    feeds = queue.Queue()
+
+    with client.watch(on_change=feeds.put) as watcher:
+        watcher.debounce = 0.1
+        (vault / "delta.md").write_text(_note("Delta", ["topic/ai"], "See [[beta]]."))
+        (vault / "beta.md").rename(vault / "Projects" / "beta.md")
+        (vault / ".obsidian" / "workspace.json").write_text("{}")
+
+        updated, removed = set(), set()
+        while not {"delta.md", "beta.md"} <= updated | removed:
+            changes = feeds.get(timeout=10)
+            updated.update(changes.updated)
+            removed.update(changes.removed)
+
+    assert updated == {"delta.md", "Projects" + os.sep + "beta.md"}
+    assert removed == {"beta.md"}
+    assert client.index.find_tag("topic/ai") == ["alpha.md", "delta.md"]
+    assert sorted(client.link_index.get_backlinks("beta")) == ["alpha.md", "delta.md"]
+    assert client.changes_since(changes.cursor, refresh=False).updated == []
+
+
+def test_link_index_can_be_read_while_another_thread_updates_it(vault, index_path):
+    import sys
+    import threading
+
+    client = ObsidianClient(vault_path=str(vault), verbose=False, index_path=str(index_path))
+    stop = threading.Event()
+    errors = []
+
+    def update_links():
+        # What a watcher thread does as notes linking to beta come and go
+        while not stop.is_set():
+            for i in range(1000):
+                client.link_index.set_links(f"note-{i}.md", ["beta", f"topic-{i}"])
+            for i in range(1000):
+                client.link_index.remove_note(f"note-{i}.md")
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    writer = threading.Thread(target=update_links)
+    writer.start()
+    try:
+        for _ in range(100):
+            client.find_backlinks("beta")
+            client.link_index.sources_for(["beta", "alpha"])
+    except RuntimeError as e:
+        errors.append(e)
+    finally:
+        stop.set()
+        writer.join()
+        sys.setswitchinterval(switch_interval)
+
+    assert errors == []
+    assert sorted(client.link_index.get_backlinks("beta")) == ["alpha.md"]
+
+
+def test_cache_prunes_by_last_open_not_by_missing_vault(vault, obsidian_cache_dir):
+    import json
+    import time
+
+    obsidian_cache_dir.mkdir(parents=True)
+    now = time.time()
+    for name in ("stale.db", "unmounted.db", "legacy.db"):
+        (obsidian_cache_dir / name).write_text("")
+    (obsidian_cache_dir / "vaults.json").write_text(json.dumps({
+        "stale.db": {"vault": str(vault.parent / "old"), "opened": now - 200 * 24 * 3600},
+        "unmounted.db": {"vault": "/Volumes/Missing/Vault", "opened": now - 3600},
+        "legacy.db": "/Volumes/Missing/Other",
+    }))
+
+    with VaultIndex(vault) as index:
+        assert index.index_path.parent == obsidian_cache_dir
+
+    registry = json.loads((obsidian_cache_dir / "vaults.json").read_text())
+    assert not (obsidian_cache_dir / "stale.db").exists()
+    assert (obsidian_cache_dir / "unmounted.db").exists() and (obsidian_cache_dir / "legacy.db").exists()
+    assert sorted(registry) == sorted(["unmounted.db", "legacy.db", index.index_path.name])
+    assert registry["legacy.db"]["vault"] == "/Volumes/Missing/Other"
+    assert registry[index.index_path.name]["vault"] == str(vault)
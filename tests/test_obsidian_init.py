@@ -87,6 +87,18 @@ class TestExecuteList:
         client.list_notes.assert_called_once_with(folder="projects", recursive=False)
         assert result["notes"] == []
 
+    def test_execute_list_with_fields(self, mock_client):
+        """Test list action with a field projection."""
+        client, _ = mock_client
+
+        mock_note = create_mock_note()
+        client.list_notes.return_value = [mock_note]
+
+        execute("list", vault_path="/vault", fields=["relative_path", "title"])
+
+        client.list_notes.assert_called_once_with(folder=None, recursive=True, fields=["relative_path", "title"])
+        mock_note.dict.assert_called_once_with(["relative_path", "title"])
+
 
 class TestExecuteGet:
     """Test get action."""
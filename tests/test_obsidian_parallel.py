@@ -0,0 +1,40 @@
+"""Tests for parallel Obsidian note parsing."""
+
+from superskills.obsidian.src import ObsidianParallel
+from superskills.obsidian.src.ObsidianParallel import parse_notes
+from superskills.obsidian.src.ObsidianParser import analyze_note
+
+
+def _vault(tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"note-{i:03d}.md"
+        path.write_text(f"---\ntags: [n{i}]\n---\n# Note {i}\n\nSee [[note-{i + 1:03d}]].\n")
+        paths.append(path)
+    return paths
+
+
+def test_results_keep_input_order_and_report_errors(tmp_path, monkeypatch):
+    monkeypatch.setattr(ObsidianParallel, "CHUNK_SIZE", 4)
+    paths = _vault(tmp_path, 30)
+    paths.insert(7, tmp_path / "missing.md")
+    (tmp_path / "binary.md").write_bytes(b"\xff\xfe\x00")
+    paths.append(tmp_path / "binary.md")
+
+    parsed = list(parse_notes(reversed(paths)))
+
+    assert [note.path for note in parsed] == list(reversed(paths))
+    assert [note.path.name for note in parsed if note.error] == ["binary.md", "missing.md"]
+    first = next(note for note in parsed if note.path.name == "note-000.md")
+    assert first.fields == analyze_note(first.content, "note-000")
+    assert first.fields['links'] == ["note-001"]
+
+
+def test_process_pool_matches_in_process_parsing(tmp_path):
+    paths = _vault(tmp_path, 70)
+
+    in_process = [note.fields for note in parse_notes(paths, processes=False)]
+    in_workers = [note.fields for note in parse_notes(paths, workers=2, processes=True)]
+
+    assert in_workers == in_process
+    assert in_process[5]['title'] == "Note 5"
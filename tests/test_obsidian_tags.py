@@ -0,0 +1,40 @@
+"""Tests for the in-memory Obsidian tag index."""
+
+from superskills.obsidian.src.ObsidianTags import TagIndex
+
+
+def _tags():
+    tags = TagIndex()
+    tags.set_tags("a.md", ["Topic/AI", "status/active"])
+    tags.set_tags("b.md", ["topic/coaching"])
+    tags.set_tags("c.md", ["topic"])
+    tags.set_tags("d.md", [])
+    return tags
+
+
+def test_hierarchical_matches_and_set_operations():
+    tags = _tags()
+
+    assert tags.query(all_of=["topic"]) == ["a.md", "b.md", "c.md"]
+    assert tags.query(all_of=["topic"], exact_match=True) == ["c.md"]
+    assert tags.query(all_of=["topic/"]) == ["a.md", "b.md"]
+    assert tags.query(all_of=["#topic/ai", "status"]) == ["a.md"]
+    assert tags.query(any_of=["topic/coaching", "status/active"]) == ["a.md", "b.md"]
+    assert tags.query(all_of=["topic"], none_of=["status"]) == ["b.md", "c.md"]
+    assert tags.query(none_of=["topic"]) == ["d.md"]
+    assert tags.query(all_of=["missing"]) == []
+
+
+def test_counts_and_updates():
+    tags = _tags()
+
+    assert tags.counts() == {"status/active": 1, "topic": 1, "topic/ai": 1, "topic/coaching": 1}
+    assert tags.counts("topic", rollup=True) == {"topic": 3, "topic/ai": 1, "topic/coaching": 1}
+
+    tags.set_tags("a.md", ["archive"])
+    tags.remove("b.md")
+    tags.set_tags("e.md", ["topic/ai"])
+
+    assert tags.counts(rollup=True) == {"archive": 1, "topic": 2, "topic/ai": 1}
+    assert tags.query(all_of=["topic"]) == ["c.md", "e.md"]
+    assert len(tags) == 4
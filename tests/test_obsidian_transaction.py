@@ -0,0 +1,170 @@
+"""Tests for transactional Obsidian plan execution."""
+
+import json
+import os
+
+import pytest
+
+from superskills.obsidian.src import ObsidianClient, ObsidianTransaction
+from superskills.obsidian.src.ObsidianIndex import VaultIndex
+from superskills.obsidian.src.ObsidianTransaction import JOURNAL_NAME, LOCK_NAME
+
+
+@pytest.fixture
+def vault(tmp_path):
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    (vault / "alpha.md").write_text("---\ntitle: Alpha\n---\n\nLinks to [[beta]].\n")
+    (vault / "beta.md").write_text("---\ntitle: Beta\n---\n\nBack to [[alpha|A]].\n")
+    (vault / "hub.md").write_text("[[alpha]] and [[beta]]\n")
+    return vault
+
+
+@pytest.fixture
+def client(vault, tmp_path):
+    return ObsidianClient(vault_path=str(vault), verbose=False, index_path=str(tmp_path / "vault.db"))
+
+
+def _snapshot(vault):
+    # The lock file stays once created; anything else left behind is a leak
+    return {
+        str(path.relative_to(vault)): path.read_text()
+        for path in sorted(vault.rglob("*")) if path.is_file() and path.name != LOCK_NAME
+    }
+
+
+def _plan(client):
+    return client.plan_changes([
+        {"action": "create", "target": "Inbox/gamma", "changes": {"content": "See [[alpha]].", "tags": ["new"]}},
+        {"action": "move", "target": "Archive/alpha-old", "changes": {"source": "alpha.md"}},
+        {"action": "update", "target": "beta", "changes": {"frontmatter": {"status": "done"}}},
+        {"action": "move", "target": "beta-new", "changes": {"source": "beta"}},
+    ])
+
+
+def test_apply_plan_commits_everything_and_indexes_once(client, vault, monkeypatch):
+    reindexed = []
+    original_reindex = client._reindex
+    monkeypatch.setattr(client, "_reindex", lambda *paths: (reindexed.append(paths), original_reindex(*paths)))
+
+    results = client.apply_plan(_plan(client))
+
+    assert [result.success for result in results] == [True, True, True, True]
+    assert sorted(results[1].affected_files) == ["Inbox" + os.sep + "gamma.md", "beta.md", "hub.md"]
+    assert sorted(results[3].affected_files) == ["Archive" + os.sep + "alpha-old.md", "hub.md"]
+    assert len(reindexed) == 1
+
+    files = _snapshot(vault)
+    assert sorted(files) == ["Archive" + os.sep + "alpha-old.md", "Inbox" + os.sep + "gamma.md",
+                             "beta-new.md", "hub.md"]
+    assert files["hub.md"] == "[[alpha-old]] and [[beta-new]]\n"
+    assert "Links to [[beta-new]]." in files["Archive" + os.sep + "alpha-old.md"]
+    assert "See [[alpha-old]]." in files["Inbox" + os.sep + "gamma.md"]
+    assert "status: done" in files["beta-new.md"] and "[[alpha-old|A]]" in files["beta-new.md"]
+
+    assert client.index.find_tag("new") == ["Inbox" + os.sep + "gamma.md"]
+    assert sorted(client.link_index.get_backlinks("beta-new")) == ["Archive" + os.sep + "alpha-old.md", "hub.md"]
+
+
+def test_failed_operation_applies_nothing(client, vault):
+    before = _snapshot(vault)
+    plan = _plan(client)
+    plan.operations.append(client.plan_changes([
+        {"action": "move", "target": "hub", "changes": {"source": "Inbox/gamma"}}
+    ]).operations[0])
+
+    results = client.apply_plan(plan)
+
+    assert not any(result.success for result in results)
+    assert results[4].message == "Destination already exists: hub.md"
+    assert results[0].message == "Not applied: plan operation(s) 5 failed"
+    assert _snapshot(vault) == before
+
+
+def test_commit_failure_rolls_back(client, vault, monkeypatch):
+    before = _snapshot(vault)
+    replaced = []
+    original_replace = os.replace
+
+    def failing_replace(source, target):
+        replaced.append(target)
+        if len(replaced) == 4:
+            raise OSError("disk full")
+        original_replace(source, target)
+
+    monkeypatch.setattr(ObsidianTransaction.os, "replace", failing_replace)
+    results = client.apply_plan(_plan(client))
+    monkeypatch.undo()
+
+    assert not any(result.success for result in results)
+    assert "rolled back (disk full)" in results[0].message
+    assert _snapshot(vault) == before
+    assert not (vault / "Inbox").exists()
+
+
+def test_interrupted_commit_is_recovered_on_open(client, vault, tmp_path, monkeypatch):
+    before = _snapshot(vault)
+    calls = []
+    original_replace = os.replace
+
+    def crashing_replace(source, target):
+        calls.append(target)
+        if len(calls) == 5:
+            raise KeyboardInterrupt
+        original_replace(source, target)
+
+    monkeypatch.setattr(ObsidianTransaction.os, "replace", crashing_replace)
+    # The process dies: no in-process rollback
+    monkeypatch.setattr(ObsidianTransaction, "_roll_back", lambda *args: (_ for _ in ()).throw(SystemExit))
+    with pytest.raises(SystemExit):
+        client.apply_plan(_plan(client))
+    monkeypatch.undo()
+
+    assert (vault / JOURNAL_NAME).exists()
+
+    ObsidianClient(vault_path=str(vault), verbose=False, index_path=str(tmp_path / "vault.db"))
+
+    assert _snapshot(vault) == before
+    with VaultIndex(vault, tmp_path / "vault.db") as index:
+        assert index.paths() == ["alpha.md", "beta.md", "hub.md"]
+
+
+
+def test_journal_of_a_live_commit_is_left_alone(client, vault, tmp_path):
+    before = _snapshot(vault)
+    journal = {"state": "placing", "stashes": {"hub.md": ".hub.md.0.bak"}, "placements": [], "folders": []}
+    (vault / JOURNAL_NAME).write_text(json.dumps(journal))
+    os.rename(vault / "hub.md", vault / ".hub.md.0.bak")
+
+    # Another process is committing: it holds the lock
+    with ObsidianTransaction._transaction_lock(vault) as locked:
+        assert locked
+        ObsidianClient(vault_path=str(vault), verbose=False, index_path=str(tmp_path / "other.db"))
+        assert (vault / JOURNAL_NAME).exists()
+
+        results = client.apply_plan(_plan(client))
+        assert "Another transaction is in progress" in results[0].message
+
+    # Its owner died without cleaning up
+    assert ObsidianTransaction.recover_transaction(vault) == "rolled back"
+    assert _snapshot(vault) == before
+
+def test_later_operations_find_notes_by_their_staged_names(client, vault):
+    results = client.apply_plan(client.plan_changes([
+        {"action": "move", "target": "sub/gamma", "changes": {"source": "beta"}},
+        {"action": "update", "target": "gamma", "changes": {"frontmatter": {"status": "done"}}},
+        {"action": "create", "target": "Inbox/delta", "changes": {"content": "Draft", "title": "Delta Draft"}},
+        {"action": "update", "target": "Delta Draft", "changes": {"frontmatter": {"status": "new"}}},
+    ]))
+
+    assert [result.success for result in results] == [True, True, True, True]
+    assert "status: done" in (vault / "sub" / "gamma.md").read_text()
+    assert "status: new" in (vault / "Inbox" / "delta.md").read_text()
+
+    results = client.apply_plan(client.plan_changes([
+        {"action": "move", "target": "Archive/alpha-old", "changes": {"source": "alpha"}},
+        {"action": "update", "target": "alpha", "changes": {"frontmatter": {"status": "done"}}},
+    ]))
+
+    assert results[1].message == "Note not found: alpha"
+    assert (vault / "alpha.md").exists()
@@ -0,0 +1,118 @@
+"""
+Tests for SkillExecutor warm-up and prompt reuse.
+"""
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from cli.core.prompt_cache import PromptCache
+from cli.core.skill_executor import SkillExecutor
+from cli.core.skill_loader import SkillInfo
+
+
+@pytest.fixture
+def config():
+    mock_config = MagicMock()
+    mock_config.get.side_effect = lambda key, default=None: {
+        'api.provider': 'gemini',
+        'api.model': 'gemini-flash-latest',
+    }.get(key, default)
+    return mock_config
+
+
+@pytest.fixture(autouse=True)
+def prompt_cache():
+    PromptCache.invalidate()
+    yield
+    PromptCache.invalidate()
+
+
+@pytest.fixture
+def provider():
+    mock_provider = MagicMock()
+    mock_provider.call.return_value = "generated"
+    mock_provider.warm_up.return_value = True
+    with patch('cli.core.skill_executor.LLMProvider.create', return_value=mock_provider) as create:
+        yield mock_provider, create
+
+
+def test_warm_up_builds_prompts_and_provider(config, provider):
+    mock_provider, create = provider
+    executor = SkillExecutor(config)
+
+    with patch.object(executor.loader, 'load_skill_content', wraps=executor.loader.load_skill_content) as load:
+        errors = executor.warm_up(['copywriter', 'editor', 'copywriter'])
+
+        assert errors == {}
+        assert load.call_count == 2
+        create.assert_called_once()
+        mock_provider.warm_up.assert_called_once()
+
+        executor.execute('copywriter', 'Write a tagline')
+        executor.execute('editor', 'Fix this')
+
+        # Steps reuse the warmed prompts instead of re-reading skill files
+        assert load.call_count == 2
+
+    system_prompt = mock_provider.call.call_args_list[0].kwargs['system_prompt']
+    assert "# Your Role and Guidelines" in system_prompt
+
+
+def test_repeated_warm_up_skips_warm_skills_and_provider(config, provider):
+    mock_provider, _ = provider
+    executor = SkillExecutor(config)
+
+    executor.warm_up(['copywriter'])
+    with patch.object(executor, 'compile_prompt', wraps=executor.compile_prompt) as compile_prompt:
+        executor.warm_up(['copywriter'])
+        executor.warm_up(['copywriter', 'editor'])
+
+    assert [call.args[0].name for call in compile_prompt.call_args_list] == ['editor']
+    mock_provider.warm_up.assert_called_once()
+
+
+def test_warm_up_reports_failures_without_raising(config, provider):
+    executor = SkillExecutor(config)
+    broken = SkillInfo(
+        name='broken',
+        description='Broken skill',
+        skill_type='python',
+        path=Path('.'),
+        has_profile=False,
+        python_module='superskills.does_not_exist.src:Missing'
+    )
+    executor.loader._skill_cache['broken'] = broken
+
+    errors = executor.warm_up(['broken', 'unknown-skill'])
+
+    assert 'broken' in errors
+    assert 'unknown-skill' not in errors
+
+
+def test_compiled_prompts_are_shared_and_rebuilt_when_a_layer_changes(config, provider, tmp_path):
+    (tmp_path / 'SKILL.md').write_text("---\nname: notes\n---\nTake notes.")
+    skill = SkillInfo(name='notes', description='Notes', skill_type='prompt', path=tmp_path, has_profile=False)
+
+    first = SkillExecutor(config)
+    first.loader._skill_cache['notes'] = skill
+    second = SkillExecutor(config)
+    second.loader._skill_cache['notes'] = skill
+
+    compiled = first.compile_prompt(skill)
+    assert compiled.tokens == len(compiled.text) // 4
+
+    with patch.object(second.loader, 'load_skill_content') as load:
+        assert second.compile_prompt(skill) is compiled
+        load.assert_not_called()
+
+    # Adding a PROFILE.md invalidates the compiled prompt
+    (tmp_path / 'PROFILE.md').write_text("Always use bullet points.")
+    rebuilt = second.compile_prompt(skill)
+
+    assert rebuilt is not compiled
+    assert "Always use bullet points." in rebuilt.text
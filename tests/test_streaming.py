@@ -0,0 +1,182 @@
+"""
+Tests for token streaming in providers, skills, `call` and workflows.
+"""
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from anthropic import APIConnectionError
+
+from cli.commands.call import call_command
+from cli.core.skill_executor import SkillExecutor
+from cli.core.workflow_plan import compile_workflow
+from cli.utils.llm_client import AnthropicProvider, GeminiProvider, LLMProvider, OpenAIProvider
+
+
+class FakeProvider(LLMProvider):
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def call(self, system_prompt, user_prompt, **kwargs):
+        return ''.join(self.chunks)
+
+    def stream(self, system_prompt, user_prompt, **kwargs):
+        yield from self.chunks
+
+
+class TestProviderStreams:
+    def test_default_stream_yields_full_response(self):
+        class CallOnly(LLMProvider):
+            def call(self, system_prompt, user_prompt, **kwargs):
+                return "whole"
+
+        assert list(CallOnly().stream("sys", "user")) == ["whole"]
+
+    def test_gemini_stream(self):
+        provider = GeminiProvider(api_key="test-key")
+        provider.client = MagicMock()
+        provider.client.models.generate_content_stream.return_value = [
+            SimpleNamespace(text="Hel"), SimpleNamespace(text=None), SimpleNamespace(text="lo")
+        ]
+
+        assert list(provider.stream("sys", "user")) == ["Hel", "lo"]
+
+    def test_anthropic_stream(self):
+        provider = AnthropicProvider(api_key="test-key")
+        provider.client = MagicMock()
+        stream_ctx = provider.client.messages.stream.return_value
+        stream_ctx.__enter__.return_value.text_stream = iter(["Hel", "lo"])
+
+        assert list(provider.stream("sys", "user")) == ["Hel", "lo"]
+        assert provider.client.messages.stream.call_args.kwargs['system'] == "sys"
+
+    def test_openai_stream(self):
+        provider = OpenAIProvider(api_key="test-key")
+        provider.client = MagicMock()
+
+        def chunk(text):
+            return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+        provider.client.chat.completions.create.return_value = iter([chunk("Hel"), chunk(None), chunk("lo")])
+
+        assert list(provider.stream("sys", "user")) == ["Hel", "lo"]
+        assert provider.client.chat.completions.create.call_args.kwargs['stream'] is True
+
+    def test_retries_only_before_first_token(self, monkeypatch):
+        monkeypatch.setattr(LLMProvider, '_backoff', staticmethod(lambda wait_time, deadline: None))
+        provider = AnthropicProvider(api_key="test-key")
+        error = APIConnectionError(request=MagicMock())
+        attempts = []
+
+        def open_stream():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise error
+            yield "ok"
+            raise error
+
+        with pytest.raises(ValueError, match="streaming failed"):
+            list(provider._stream_with_retry(open_stream, 3, None))
+
+        assert len(attempts) == 2
+
+    def test_astream(self):
+        provider = FakeProvider(["a", "b", "c"])
+
+        async def collect():
+            return [chunk async for chunk in provider.astream("sys", "user")]
+
+        assert asyncio.run(collect()) == ["a", "b", "c"]
+
+    def test_astream_propagates_errors(self):
+        class Failing(LLMProvider):
+            def call(self, system_prompt, user_prompt, **kwargs):
+                raise ValueError("boom")
+
+        async def collect():
+            return [chunk async for chunk in Failing().astream("sys", "user")]
+
+        with pytest.raises(ValueError, match="boom"):
+            asyncio.run(collect())
+
+
+@pytest.fixture
+def executor():
+    config = MagicMock()
+    config.get.side_effect = lambda key, default=None: default
+    executor = SkillExecutor(config)
+    executor.llm_provider = FakeProvider(["Once ", "upon ", "a time"])
+    return executor
+
+
+def test_executor_streams_prompt_skill(executor):
+    chunks = []
+    result = executor.execute('copywriter', 'Write a story', on_chunk=chunks.append)
+
+    assert chunks == ["Once ", "upon ", "a time"]
+    assert result['output'] == "Once upon a time"
+    assert result['metadata']['first_token_latency'] is not None
+
+
+def test_call_command_streams_to_stdout(capsys):
+    mock_executor = MagicMock()
+
+    def execute(skill, text, on_chunk=None, **kwargs):
+        for chunk in ["Hello ", "world"]:
+            on_chunk(chunk)
+        return {'output': "Hello world", 'metadata': {'first_token_latency': 0.25}}
+
+    mock_executor.execute.side_effect = execute
+
+    with patch('cli.commands.call.SkillExecutor', return_value=mock_executor), \
+         patch('cli.commands.call.CLIConfig'):
+        result = call_command("test-skill", "input", stream=True, no_save=True)
+
+    assert result == 0
+    captured = capsys.readouterr()
+    # Streamed text is printed once, not followed by the formatted output
+    assert captured.out.count("Hello world") == 1
+    assert "First token after 0.25s" in captured.err
+
+
+def test_workflow_step_streams_to_file(tmp_path, executor):
+    from cli.core.workflow_engine import WorkflowEngine
+
+    config = MagicMock()
+    config.cache_dir = tmp_path
+    config.get.side_effect = lambda key, default=None: {'workflows.prewarm': False}.get(key, default)
+    engine = WorkflowEngine(config, show_progress=False)
+    engine.executor = executor
+
+    written = []
+    stream_path = tmp_path / "out" / "story.md"
+    original_stream = executor._stream_output
+
+    def spy(chunks, on_chunk):
+        def record(chunk):
+            on_chunk(chunk)
+            written.append(stream_path.read_text())
+        return original_stream(chunks, record)
+
+    executor._stream_output = spy
+
+    plan = compile_workflow(
+        {"name": "story", "steps": [{
+            "name": "draft", "skill": "copywriter", "input": "${input}",
+            "output": "story", "stream_to": "out/story.md"
+        }]},
+        source=str(tmp_path / "workflow.yaml")
+    )
+    result = engine.execute_plan(plan, {'input': 'Write a story'})
+
+    assert result['final_output'] == "Once upon a time"
+    # File content grew while tokens were arriving
+    assert written == ["Once ", "Once upon ", "Once upon a time"]
+    assert stream_path.read_text() == "Once upon a time"
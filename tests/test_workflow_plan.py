@@ -0,0 +1,184 @@
+"""
+Tests for compiled workflow plans and plan caching.
+"""
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from cli.core.workflow_plan import (
+    WorkflowCompiler,
+    WorkflowPlan,
+    compile_workflow,
+    parse_reference,
+)
+
+WORKFLOW_YAML = """name: test-flow
+description: Test workflow
+io:
+  input_dir: input
+variables:
+  audience: "coaches"
+  alias: ${audience}
+steps:
+  - name: research
+    skill: researcher
+    input: ${topic}
+    output: findings
+  - name: draft
+    skill: author
+    input: ${findings.summary}
+    output: draft
+    config:
+      tone: professional
+  - name: edit
+    skill: editor
+    input: |
+      Draft: ${draft}
+      Research: ${findings}
+    output: final
+"""
+
+
+@pytest.fixture(autouse=True)
+def clear_plan_cache():
+    WorkflowCompiler.clear_cache()
+    yield
+    WorkflowCompiler.clear_cache()
+
+
+@pytest.fixture
+def workflow_file(tmp_path):
+    path = tmp_path / "workflow.yaml"
+    path.write_text(WORKFLOW_YAML)
+    return path
+
+
+@pytest.fixture
+def validator():
+    mock_validator = MagicMock()
+    mock_validator.validate_workflow.return_value = (True, [])
+    return mock_validator
+
+
+def test_parse_reference():
+    assert parse_reference("${topic}") == ("topic",)
+    assert parse_reference("${findings.summary}") == ("findings", "summary")
+    assert parse_reference("${step-1.output}") == ("step-1", "output")
+    assert parse_reference("Topic: ${topic}") is None
+    assert parse_reference("${a} and ${b}") is None
+    assert parse_reference(42) is None
+
+
+def test_compile_resolves_refs_and_dependencies(workflow_file, validator):
+    plan = WorkflowCompiler(validator=validator).compile(workflow_file)
+
+    assert plan.name == "test-flow"
+    assert plan.skills == ("researcher", "author", "editor")
+    assert plan.final_output == "final"
+    assert plan.io["input_dir"] == "input"
+
+    research, draft, edit = plan.steps
+    assert research.input_ref == ("topic",)
+    assert draft.input_ref == ("findings", "summary")
+    assert draft.depends_on == ("research",)
+    assert edit.input_ref is None
+    assert edit.depends_on == ("draft", "research")
+    assert dict(draft.config) == {"tone": "professional"}
+
+    variables = {v.name: v for v in plan.variables}
+    assert variables["alias"].ref == ("audience",)
+
+
+def test_plan_is_immutable(workflow_file, validator):
+    plan = WorkflowCompiler(validator=validator).compile(workflow_file)
+
+    with pytest.raises(Exception):
+        plan.name = "changed"
+    with pytest.raises(TypeError):
+        plan.steps[1].config["tone"] = "casual"
+
+
+def test_memory_cache_skips_validation(workflow_file, validator):
+    compiler = WorkflowCompiler(validator=validator)
+
+    first = compiler.compile(workflow_file)
+    second = WorkflowCompiler(validator=validator).compile(workflow_file)
+
+    assert first is second
+    assert validator.validate_workflow.call_count == 1
+
+
+def test_changed_file_is_recompiled(workflow_file, validator):
+    compiler = WorkflowCompiler(validator=validator)
+    first = compiler.compile(workflow_file)
+
+    workflow_file.write_text(WORKFLOW_YAML.replace("test-flow", "renamed-flow"))
+    second = compiler.compile(workflow_file)
+
+    assert second.name == "renamed-flow"
+    assert second.file_hash != first.file_hash
+    assert validator.validate_workflow.call_count == 2
+
+
+def test_disk_cache_round_trip(workflow_file, validator, tmp_path):
+    cache_dir = tmp_path / "plans"
+    first = WorkflowCompiler(cache_dir=cache_dir, validator=validator).compile(workflow_file)
+    assert (cache_dir / f"{first.file_hash}.json").exists()
+
+    WorkflowCompiler.clear_cache()
+    second = WorkflowCompiler(cache_dir=cache_dir, validator=validator).compile(workflow_file)
+
+    assert second == first
+    assert validator.validate_workflow.call_count == 1
+
+
+def test_identical_files_share_plan_but_keep_their_source(workflow_file, validator, tmp_path):
+    cache_dir = tmp_path / "plans"
+    copy = tmp_path / "copy" / "workflow.yaml"
+    copy.parent.mkdir()
+    copy.write_text(WORKFLOW_YAML)
+
+    first = WorkflowCompiler(cache_dir=cache_dir, validator=validator).compile(workflow_file)
+    second = WorkflowCompiler(cache_dir=cache_dir, validator=validator).compile(copy)
+    WorkflowCompiler.clear_cache()
+    from_disk = WorkflowCompiler(cache_dir=cache_dir, validator=validator).compile(copy)
+
+    assert first.source == str(workflow_file)
+    assert second.source == from_disk.source == str(copy)
+    assert second.steps is first.steps
+    assert validator.validate_workflow.call_count == 1
+
+
+def test_invalid_workflow_raises(workflow_file):
+    failing = MagicMock()
+    failing.validate_workflow.return_value = (False, ["Step 1 (research): Skill 'x' not found"])
+
+    with pytest.raises(ValueError, match="Workflow validation failed"):
+        WorkflowCompiler(validator=failing).compile(workflow_file)
+
+
+def test_plan_dict_round_trip():
+    plan = compile_workflow({
+        "name": "inline",
+        "steps": [{"name": "only", "skill": "author", "input": "${input}", "output": "out"}],
+    })
+
+    assert WorkflowPlan.from_dict(plan.to_dict()) == plan
+
+
+def test_references_accept_any_variable_name():
+    plan = compile_workflow({
+        "name": "dashed",
+        "steps": [
+            {"name": "first", "skill": "researcher", "input": "${input}", "output": "step-1"},
+            {"name": "second", "skill": "author", "input": "${step-1.output}", "output": "out"},
+        ],
+    })
+
+    assert plan.steps[1].input_ref == ("step-1", "output")
+    assert plan.steps[1].depends_on == ("first",)